@@ -0,0 +1,53 @@
+"""
+Micro-benchmarks for hot paths, run by hand rather than by pytest::
+
+    python -m benchmarks.bench_kindwise_client
+
+Each script stubs out upstream services, so numbers reflect this codebase's
+own overhead, not network conditions.
+"""
+
+import os
+import statistics
+import time
+from typing import Callable, Dict
+
+
+def setup_django() -> None:
+    """Configure Django with the test settings (in-memory SQLite, LocMem cache)."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings_test")
+    import django
+
+    django.setup()
+
+
+def setup_database() -> None:
+    """Set up Django and migrate the (in-memory) test database."""
+    setup_django()
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def bench(func: Callable[[], object], iterations: int = 100, warmup: int = 5) -> Dict[str, float]:
+    """Time `func` and return mean/median/p95 in milliseconds."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "median_ms": statistics.median(samples),
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def report(label: str, result: Dict[str, float]) -> None:
+    print(
+        f"{label:<40} mean {result['mean_ms']:8.3f} ms  "
+        f"median {result['median_ms']:8.3f} ms  p95 {result['p95_ms']:8.3f} ms"
+    )
@@ -0,0 +1,66 @@
+"""
+ASCII mirror parsing: the previous regex-per-call implementation against
+``nfctags.validators``, for valid, counter-bearing and invalid inputs, plus
+``parse_many`` on a 10k batch.
+
+Run with ``python -m benchmarks.bench_ascii_mirror``.
+"""
+
+import re
+
+from benchmarks import bench, report, setup_django
+
+BATCH_SIZE = 10_000
+CALLS = 1_000  # per timed sample, so single parses register in milliseconds
+CASES = {
+    "uid only": "04E141124C2880",
+    "uid + counter": "04E141124C2880x00002A",
+    "invalid uid": "04E141124C28ZZx00002A",
+    "wrong length": "04E141124C",
+}
+
+
+def legacy_parse(value):
+    """The parser as it was: patterns compiled and dispatched per call."""
+
+    def validate(value, component_type):
+        if component_type == "uid":
+            if not re.compile(r"^[0-9A-Fa-f]{14}$").match(value):
+                return None
+            return value
+        if not re.compile(r"^[0-9A-Fa-f]{6}$").match(value):
+            return None
+        return int(value, 16)
+
+    if "x" in value:
+        uid, counter = value.split("x", 1)
+        return validate(uid, "uid"), validate(counter, "counter")
+    return validate(value, "uid"), None
+
+
+def _repeat(func, value):
+    def run():
+        for _ in range(CALLS):
+            func(value)
+
+    return run
+
+
+def main(iterations: int = 200) -> None:
+    setup_django()
+    from nfctags.validators import parse_ascii_mirror, parse_many
+
+    for name, value in CASES.items():
+        report(f"{name} x{CALLS} (before)", bench(_repeat(legacy_parse, value), iterations))
+        report(f"{name} x{CALLS} (after)", bench(_repeat(parse_ascii_mirror, value), iterations))
+
+    batch = [f"{i:014X}x{i % 0xFFFFFF:06X}" for i in range(BATCH_SIZE)]
+    report(
+        f"{BATCH_SIZE} mirrors, loop (before)",
+        bench(lambda: [legacy_parse(v) for v in batch], 20),
+    )
+    report(f"{BATCH_SIZE} mirrors, parse_many (after)", bench(lambda: parse_many(batch), 20))
+
+
+if __name__ == "__main__":
+    main()
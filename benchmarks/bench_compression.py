@@ -0,0 +1,31 @@
+"""
+Compressing our largest rendered payloads with each available codec, and
+serving an identical body again from the compressed-variant cache.
+
+Run with ``python -m benchmarks.bench_compression``.
+"""
+
+from benchmarks import bench, report, setup_django
+from benchmarks.bench_renderer import _occurrences, _tag_page
+
+
+def main(iterations: int = 50) -> None:
+    setup_django()
+    from config.middleware import CODECS, _cache, compress
+    from config.renderers import ORJSONRenderer
+
+    renderer = ORJSONRenderer()
+    for name, payload in (("occurrences x300", _occurrences()), ("tag page x1000", _tag_page())):
+        body = renderer.render(None, payload, response_status=200)
+        print(f"{name}: {len(body) / 1024:.0f} KiB")
+        for encoding, codec in CODECS.items():
+            size = len(codec(body))
+            result = bench(lambda: codec(body), iterations)
+            report(f"  {encoding} -> {size / 1024:.0f} KiB ({size / len(body):.0%})", result)
+        _cache.clear()
+        compress(body, "gzip")
+        report("  gzip, cached variant", bench(lambda: compress(body, "gzip"), iterations))
+
+
+if __name__ == "__main__":
+    main()
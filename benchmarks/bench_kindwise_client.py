@@ -0,0 +1,124 @@
+"""
+Per-identification overhead of the Kindwise client, before and after pooling.
+
+A local HTTP/1.1 stub stands in for plant.id and answers every identification
+with a canned response, so the difference between the two runs is client
+construction plus connection setup:
+
+- before: a new ``PlantApi`` per request, which opens a new ``httpx.Client``
+  (and TCP connection) per call.
+- after: ``KindwiseService`` on the process-wide pooled client.
+
+Run with ``python -m benchmarks.bench_kindwise_client``.
+"""
+
+import io
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks import bench, report, setup_django
+
+RESPONSE = json.dumps(
+    {
+        "access_token": "bench",
+        "model_version": "plant_id:3.4.1",
+        "custom_id": None,
+        "input": {
+            "latitude": None,
+            "longitude": None,
+            "similar_images": False,
+            "images": [],
+            "datetime": "2023-11-28T08:38:48.538187+00:00",
+        },
+        "result": {
+            "is_plant": {"probability": 0.98, "binary": True, "threshold": 0.5},
+            "classification": {
+                "suggestions": [
+                    {
+                        "id": "4ba05f1050481731",
+                        "name": "Aloe vera",
+                        "probability": 0.96,
+                        "details": {"language": "en", "entity_id": "4ba05f1050481731", "gbif_id": 2777724},
+                    }
+                ]
+            },
+        },
+        "status": "COMPLETED",
+        "sla_compliant_client": True,
+        "sla_compliant_system": True,
+        "created": 1701160728.5,
+        "completed": 1701160729.2,
+    }
+).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY a
+    # kept-alive connection stalls on delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def _jpeg():
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), "green").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def main(iterations: int = 200) -> None:
+    setup_django()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    from django.conf import settings
+    from kindwise import PlantApi
+
+    from botany import kindwise
+    from botany.services import KindwiseService
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{server.server_port}"
+    settings.KINDWISE_API_KEY = "bench"
+    image = _jpeg()
+
+    def before():
+        api = PlantApi(api_key=settings.KINDWISE_API_KEY)
+        api.host = host
+        service = KindwiseService(api=api)
+        service.parse_identification(
+            api.identify(
+                [image],
+                language=["en"],
+                details=["gbif_id"],
+                classification_level="species",
+            )
+        )
+
+    def after():
+        KindwiseService().identify_plant([image])
+
+    kindwise.get_kindwise_client().host = host
+    try:
+        report("per-call PlantApi (before)", bench(before, iterations))
+        report("process-wide pooled client (after)", bench(after, iterations))
+    finally:
+        kindwise.close_kindwise_client()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
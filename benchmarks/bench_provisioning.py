@@ -0,0 +1,48 @@
+"""
+Importing a 100k-UID factory reel, 10% of which is already provisioned.
+
+- before: ``get_or_create`` per line, as the data migration command does
+  (two or three queries per UID; timed on a 5k-line slice).
+- after: ``provision_tags``: ``parse_many``, one ``uid IN`` query and one
+  ``bulk_create`` per batch.
+
+Run with ``python -m benchmarks.bench_provisioning``.
+"""
+
+from benchmarks import bench, report, setup_database
+
+REEL_SIZE = 100_000
+BEFORE_SLICE = 5_000
+
+_runs = {}
+
+
+def _reel(size: int, prefix: str):
+    # New UIDs per run, except the first 10%, which the previous run imported.
+    run = _runs[prefix] = _runs.get(prefix, 0) + 1
+    overlap = size // 10
+    lines = [f"{prefix}{run - 1:04X}{i:08X}" for i in range(overlap)]
+    lines += [f"{prefix}{run:04X}{i:08X}" for i in range(size - overlap)]
+    return lines
+
+
+def main(iterations: int = 3) -> None:
+    setup_database()
+    from domain.models import PlantLabel
+    from domain.provisioning import provision_tags
+    from nfctags.validators import validate_ascii_mirror_uid
+
+    def before():
+        for line in _reel(BEFORE_SLICE, "05"):
+            PlantLabel.objects.get_or_create(uid=validate_ascii_mirror_uid(line))
+
+    def after():
+        return provision_tags(_reel(REEL_SIZE, "04"), batch_size=1000)
+
+    report(f"get_or_create per UID, {BEFORE_SLICE // 1000}k (before)", bench(before, iterations, 1))
+    report(f"batched provisioning, {REEL_SIZE // 1000}k (after)", bench(after, iterations, 1))
+    print(f"last reel: {after()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Encoding our largest response payloads: ninja's stdlib ``JSONRenderer``
+(before) against ``config.renderers.ORJSONRenderer`` (after).
+
+- occurrences: a 300-item GBIF occurrence page, each with media entries;
+- tag page: 1k ``PlantLabelOut``-shaped items with nested plants (UUIDs,
+  datetimes, dates), as served by the tag list.
+
+Run with ``python -m benchmarks.bench_renderer``.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from benchmarks import bench, report, setup_django
+
+
+def _occurrences(count: int = 300):
+    return {
+        "items": [
+            {
+                "name": "Monstera deliciosa Liebm.",
+                "license": "http://creativecommons.org/licenses/by-nc/4.0/legalcode",
+                "month": i % 12 + 1,
+                "year": 2000 + i % 25,
+                "eventDate": f"20{i % 25:02d}-{i % 12 + 1:02d}-14T10:12:00",
+                "media": [
+                    {
+                        "type": "StillImage",
+                        "format": "image/jpeg",
+                        "identifier": f"https://inaturalist-open-data.s3.amazonaws.com/photos/{i}/original.jpg",
+                        "creator": "Jan Novák",
+                        "license": "http://creativecommons.org/licenses/by-nc/4.0/",
+                    }
+                    for _ in range(2)
+                ],
+            }
+            for i in range(count)
+        ],
+        "count": count,
+    }
+
+
+def _tag_page(count: int = 1000):
+    now = datetime(2026, 10, 19, 8, 43, 14, 178123, tzinfo=timezone.utc)
+    items = []
+    for i in range(count):
+        plant_uuid = uuid.uuid4()
+        items.append(
+            {
+                "uuid": uuid.uuid4(),
+                "plant_id": plant_uuid,
+                "plant": {
+                    "uuid": plant_uuid,
+                    "name": f"Plant {i}",
+                    "gbif_id": 2868241,
+                    "description": "Large evergreen climber " * 10,
+                    "acquisition_date": date(2025, 5, 1),
+                    "location": "Greenhouse B",
+                    "notes": "",
+                    "created_at": now - timedelta(days=i),
+                    "updated_at": now,
+                },
+                "active": True,
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now,
+            }
+        )
+    return {"items": items, "next_cursor": "WyIyMDI2LTEwLTE5Il0", "count": None}
+
+
+def main(iterations: int = 200) -> None:
+    setup_django()
+    import json
+
+    import orjson
+    from ninja.renderers import JSONRenderer
+
+    from config.renderers import ORJSONRenderer
+
+    before, after = JSONRenderer(), ORJSONRenderer()
+    for name, payload in (("occurrences x300", _occurrences()), ("tag page x1000", _tag_page())):
+        old = before.render(None, payload, response_status=200)
+        new = after.render(None, payload, response_status=200)
+        assert orjson.loads(new) == json.loads(old)
+        print(f"{name}: {len(old.encode()) / 1024:.0f} KiB -> {len(new) / 1024:.0f} KiB")
+        for label, renderer in (("stdlib json (before)", before), ("orjson (after)", after)):
+            result = bench(lambda: renderer.render(None, payload, response_status=200), iterations)
+            report(f"  {label}", result)
+
+
+if __name__ == "__main__":
+    main()
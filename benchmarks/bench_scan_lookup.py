@@ -0,0 +1,63 @@
+"""
+NFC scan resolution for a user who owns many tags.
+
+- before: look the tag up by uid, then load every active tag id the user
+  owns into a set to check visibility (cost grows with collection size).
+- after: ``resolve_scan`` on a cold uid cache: one query on the unique
+  ``uid`` index that also fetches the bound plant's uuid.
+
+Run with ``python -m benchmarks.bench_scan_lookup``.
+"""
+
+import uuid
+
+from benchmarks import bench, report, setup_database
+
+TAGS_PER_USER = 10_000
+
+
+def main(iterations: int = 200) -> None:
+    setup_database()
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from botany.models import Plant
+    from domain.models import PlantLabel
+    from django.core.cache import cache
+
+    from domain.selectors import resolve_scan
+
+    user = get_user_model().objects.create_user("collector", "c@example.com", "p")
+    plant = Plant.objects.create(name="Monstera", user=user)
+    PlantLabel.objects.bulk_create(
+        PlantLabel(uid=uuid.uuid4().hex[:14].upper(), user=user) for _ in range(TAGS_PER_USER)
+    )
+    tag = PlantLabel.objects.order_by("?").first()
+    tag.plant = plant
+    tag.save(update_fields=["plant"])
+    ascii_mirror = f"{tag.uid}x00002A"
+
+    def before():
+        found = PlantLabel.objects.get(uid=tag.uid)
+        visible = set(
+            PlantLabel.objects.filter(user=user, active=True).values_list("id", flat=True)
+        )
+        assert found.id in visible
+        return found.plant.uuid
+
+    def after():
+        cache.clear()
+        return resolve_scan(ascii_mirror=ascii_mirror, user=user)["plant_uuid"]
+
+    for label, func in (
+        ("uid lookup + visible-id set (before)", before),
+        ("single indexed query (after)", after),
+    ):
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        report(f"{label} [{len(queries)} queries]", bench(func, iterations))
+
+
+if __name__ == "__main__":
+    main()
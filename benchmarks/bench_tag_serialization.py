@@ -0,0 +1,84 @@
+"""
+Serializing a 1k-row NFC tag page (every tag bound to a plant).
+
+- before: ``select_related`` model instances validated into
+  ``PlantLabelOut``; per row ``resolve_plant`` validates a
+  ``PlantOutNested`` from the ORM object.
+- after: the list fast path: a ``values()`` projection mapped straight to
+  dicts, which the response model passes through without re-validation.
+
+Reported twice: the response-model round trip ninja performs on
+already-fetched rows, and end to end (query, serialization and JSON
+rendering) per page as served.
+
+Run with ``python -m benchmarks.bench_tag_serialization``.
+"""
+
+import uuid
+
+from benchmarks import bench, report, setup_database
+
+PAGE_SIZE = 1_000
+
+
+def main(iterations: int = 20) -> None:
+    setup_database()
+    from django.contrib.auth import get_user_model
+    from ninja.renderers import JSONRenderer
+
+    from botany.models import Plant
+    from config.pagination import KeysetPaginatedResponseSchema
+    from domain.api import TAG_LIST_ORDERING
+    from domain.models import PlantLabel
+    from domain.projections import FULL_FIELDS, project_tags
+    from domain.schema import PlantLabelListItem, PlantLabelOut
+    from domain.selectors import get_nfctags_for
+
+    user = get_user_model().objects.create_user("collector", "c@example.com", "p")
+    plants = Plant.objects.bulk_create(
+        Plant(name=f"Plant {i}", user=user, description="x" * 500, notes="y" * 200)
+        for i in range(PAGE_SIZE)
+    )
+    PlantLabel.objects.bulk_create(
+        PlantLabel(uid=uuid.uuid4().hex[:14].upper(), user=user, plant=plant)
+        for plant in plants
+    )
+
+    renderer = JSONRenderer()
+    before_schema = KeysetPaginatedResponseSchema[PlantLabelOut]
+    after_schema = KeysetPaginatedResponseSchema[PlantLabelListItem]
+
+    def serialize(schema, items):
+        page = {"items": items, "next_cursor": None, "count": None}
+        return schema.model_validate(page).model_dump()
+
+    def fetch_before():
+        qs = get_nfctags_for(fetched_by=user, select_related=["plant"])
+        return list(qs.order_by(*TAG_LIST_ORDERING)[:PAGE_SIZE])
+
+    def fetch_after():
+        projection = project_tags(get_nfctags_for(fetched_by=user), FULL_FIELDS)
+        rows = projection.queryset.order_by(*TAG_LIST_ORDERING)[:PAGE_SIZE]
+        return [projection.mapper(row) for row in rows]
+
+    def before():
+        data = serialize(before_schema, fetch_before())
+        return renderer.render(None, data, response_status=200)
+
+    def after():
+        data = serialize(after_schema, fetch_after())
+        return renderer.render(None, data, response_status=200)
+
+    assert before() == after()
+    instances, items = fetch_before(), fetch_after()
+    for label, func in (
+        ("serialize: PlantLabelOut (before)", lambda: serialize(before_schema, instances)),
+        ("serialize: mapped rows (after)", lambda: serialize(after_schema, items)),
+        ("query+serialize+render (before)", before),
+        ("query+map+serialize+render (after)", after),
+    ):
+        report(label, bench(func, iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
+import time
+from functools import wraps
 from typing import List, Optional
+from uuid import UUID
 
-from ninja import Query
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from ninja import File, Form, Query, UploadedFile
 from ninja.errors import HttpError
 from ninja_extra import (
     ControllerBase,
@@ -15,10 +21,14 @@ from ninja_extra.pagination import (
 )
 
 from config.auth import JWTAuthenticationBackend
+from .cache import track_stale_serves
+from .jobs import JobLimitExceeded, submit_identification
+from .models import IdentificationJob
 from .schema import (
     CreatePlantFromGBIFIn,
     ErrorOut,
     GBIFSearchPaginatedOut,
+    IdentificationJobOut,
     PlantDetailOut,
     PlantOccurrenceOut,
     PlantOut,
@@ -34,6 +44,33 @@ from .services import (
 )
 
 
+# Kindwise accepts at most five images per identification.
+MAX_IDENTIFICATION_IMAGES = 5
+# Seconds an identification event stream stays open; 0 is a single snapshot.
+_DEFAULT_EVENTS_TIMEOUT = 0
+
+
+# RFC 7234 warn-code for responses served past their freshness lifetime.
+STALE_WARNING = '110 - "Response is Stale"'
+
+
+def flag_stale_responses(func):
+    """
+    Add a ``Warning: 110`` header when the wrapped endpoint answered from a
+    last-known-good copy because GBIF was unavailable.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with track_stale_serves() as stale_paths:
+            result = func(self, *args, **kwargs)
+        if stale_paths:
+            self.context.response.headers["Warning"] = STALE_WARNING
+        return result
+
+    return wrapper
+
+
 @api_controller("/gbif", tags=["GBIF (Plants)"])
 class GBIFController(ControllerBase):
     """
@@ -46,6 +83,7 @@ class GBIFController(ControllerBase):
         summary="Search GBIF species by name with optional family filter (public)",
         auth=None,
     )
+    @flag_stale_responses
     def search_species(
         self,
         q: str,
@@ -56,7 +94,9 @@ class GBIFController(ControllerBase):
         """
         Search the GBIF backbone taxonomy for species matching the given query.
 
-        Results are cached for 1 hour. No authentication is required.
+        Results are cached until the next GBIF backbone release. If GBIF is
+        unavailable after that, the last-known-good results are returned with
+        a ``Warning`` header. No authentication is required.
         """
         try:
             data = search_gbif(query=q, family=family, limit=limit, offset=offset)
@@ -103,6 +143,7 @@ class GBIFController(ControllerBase):
         response={200: PlantDetailOut, 404: ErrorOut, 500: ErrorOut},
         summary="Fetch plant details from GBIF by id/slug/uuid/name",
     )
+    @flag_stale_responses
     def retrieve_plant_details(self, identifier: str):
         try:
             plant = get_plant_details(identifier)
@@ -122,6 +163,7 @@ class GBIFController(ControllerBase):
         summary="Paginated occurrences for a plant",
     )
     @paginate(LimitOffsetPagination)
+    @flag_stale_responses
     def list_plant_occurrences(self, identifier: str):
         try:
             results = get_plant_occurrences(identifier)
@@ -131,3 +173,101 @@ class GBIFController(ControllerBase):
             raise HttpError(500, str(exc))
 
         return results
+
+
+@api_controller(
+    "/identify",
+    auth=JWTAuthenticationBackend(),
+    tags=["Plant Identification"],
+)
+class IdentificationController(ControllerBase):
+    """
+    Asynchronous plant identification: submit photos, then poll (or stream)
+    the job until it finishes. See ``botany.jobs``.
+    """
+
+    @http_post(
+        "/jobs",
+        response={202: IdentificationJobOut, 400: ErrorOut, 401: ErrorOut, 429: ErrorOut},
+        summary="Submit photos for plant identification (requires authentication)",
+    )
+    def submit_job(
+        self,
+        images: List[UploadedFile] = File(...),
+        latitude: Optional[float] = Form(default=None, ge=-90, le=90),
+        longitude: Optional[float] = Form(default=None, ge=-180, le=180),
+    ):
+        """
+        Queue an identification of up to five photos of one plant.
+
+        Returns HTTP 202 with the job immediately; poll
+        ``GET /identify/jobs/{uuid}`` for the result. Returns 429 if the user
+        already has the maximum number of jobs pending or running.
+        """
+        if not 1 <= len(images) <= MAX_IDENTIFICATION_IMAGES:
+            raise HttpError(400, f"Submit 1 to {MAX_IDENTIFICATION_IMAGES} images")
+        coordinates = None
+        if latitude is not None and longitude is not None:
+            coordinates = (latitude, longitude)
+
+        try:
+            job = submit_identification(
+                user=self.context.request.auth, images=images, coordinates=coordinates
+            )
+        except JobLimitExceeded as exc:
+            raise HttpError(429, str(exc))
+        return 202, job
+
+    @http_get(
+        "/jobs/{uuid:job_uuid}",
+        response={200: IdentificationJobOut, 404: ErrorOut},
+        summary="Status and result of an identification job",
+    )
+    def retrieve_job(self, job_uuid: UUID):
+        return get_object_or_404(
+            IdentificationJob, uuid=job_uuid, user=self.context.request.auth
+        )
+
+    @http_get(
+        "/jobs/{uuid:job_uuid}/events",
+        summary="Server-sent events for an identification job",
+    )
+    def job_events(self, job_uuid: UUID):
+        """
+        Stream ``status`` events as the job progresses and a final ``done``
+        event with the finished job, as ``text/event-stream``.
+
+        The stream ends after ``IDENTIFICATION_EVENTS_TIMEOUT`` seconds even
+        if the job is still running; clients then fall back to polling. An
+        open stream occupies a worker thread for that long, so the default
+        of 0 sends one snapshot and closes (a plain poll). Only raise it when
+        serving with threaded or async workers (e.g. ``gunicorn -k gthread``),
+        never with the default single sync worker.
+        """
+        job = get_object_or_404(
+            IdentificationJob, uuid=job_uuid, user=self.context.request.auth
+        )
+        response = StreamingHttpResponse(
+            _job_events(job.pk), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+def _job_events(job_id: int):
+    timeout = getattr(settings, "IDENTIFICATION_EVENTS_TIMEOUT", _DEFAULT_EVENTS_TIMEOUT)
+    deadline = time.monotonic() + timeout
+    last_status = None
+    while True:
+        job = IdentificationJob.objects.get(pk=job_id)
+        if job.is_finished:
+            data = IdentificationJobOut.model_validate(job).model_dump_json()
+            yield f"event: done\ndata: {data}\n\n"
+            return
+        if job.status != last_status:
+            last_status = job.status
+            yield f"event: status\ndata: {{\"status\": \"{job.status}\"}}\n\n"
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(0.5)
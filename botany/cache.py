@@ -0,0 +1,213 @@
+"""
+Backbone-version-aware cache keys for GBIF taxonomy data.
+
+Taxon details, name resolutions and species searches only change when GBIF
+publishes a new release of the backbone taxonomy, so they can be cached for
+days or weeks as long as a new release invalidates them. Every key built by
+``taxonomy_cache_key`` embeds the current backbone version and a generation
+counter; bumping the generation orphans every existing entry in one step.
+
+The backbone version is checked against the GBIF registry at most once per
+``GBIF_BACKBONE_VERSION_CHECK_INTERVAL`` seconds (shared through the cache) and
+memoized in-process for a short time so hot paths never pay for the check.
+
+Entries also get an unversioned last-known-good copy (``last_good_cache_key``)
+that outlives both the freshness TTL and backbone changes, so a GBIF outage
+can be answered with stale data; ``track_stale_serves`` lets the API layer
+find out that this happened while handling a request.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from pygbif import registry
+
+from config import metrics
+from .upstream import call_gbif
+
+logger = logging.getLogger(__name__)
+
+# GBIF Backbone Taxonomy dataset.
+BACKBONE_DATASET_KEY = "d7dddbf4-2cf0-4f39-9b2a-bb099caae36c"
+
+_DEFAULT_TAXONOMY_CACHE_TIMEOUT = 60 * 60 * 24 * 14  # 2 weeks
+_DEFAULT_VERSION_CHECK_INTERVAL = 60 * 60 * 6  # 6 hours
+_DEFAULT_STALE_TIMEOUT = 60 * 60 * 24 * 60  # 60 days
+_LOCAL_MEMO_SECONDS = 60
+
+_VERSION_KEY = "gbif:backbone:version"
+_VERSION_CHECKED_KEY = "gbif:backbone:checked"
+_GENERATION_KEY = "gbif:backbone:generation"
+
+UNVERSIONED = "unversioned"
+
+# (version, generation, memo expiry as time.monotonic())
+_memo: Optional[Tuple[str, int, float]] = None
+
+# Read paths that fell back to a stale copy during the current request.
+_stale_serves: ContextVar[Optional[List[str]]] = ContextVar(
+    "gbif_stale_serves", default=None
+)
+
+
+def get_taxonomy_cache_timeout() -> int:
+    """Return the TTL (seconds) for backbone-derived cache entries."""
+    return getattr(
+        settings, "GBIF_TAXONOMY_CACHE_TIMEOUT", _DEFAULT_TAXONOMY_CACHE_TIMEOUT
+    )
+
+
+def get_stale_cache_timeout() -> int:
+    """Return how long (seconds) last-known-good copies are kept."""
+    return getattr(settings, "GBIF_STALE_CACHE_TIMEOUT", _DEFAULT_STALE_TIMEOUT)
+
+
+def fetch_backbone_version() -> Optional[str]:
+    """
+    Ask the GBIF registry for the current backbone release identifier.
+
+    Goes through ``call_gbif`` like every other GBIF read, so the check runs
+    on the gbif bulkhead under the GBIF timeout and retry policy.
+
+    Returns:
+        The backbone ``pubDate`` (falling back to ``modified``), or None when the
+        registry cannot be reached.
+    """
+    try:
+        dataset = call_gbif(registry.datasets, uuid=BACKBONE_DATASET_KEY)
+    except Exception:
+        logger.warning("Could not fetch GBIF backbone version", exc_info=True)
+        return None
+
+    version = dataset.get("pubDate") or dataset.get("modified")
+    return str(version) if version else None
+
+
+def _get_generation() -> int:
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        cache.add(_GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(_GENERATION_KEY, 1)
+    return int(generation)
+
+
+def bump_generation() -> int:
+    """
+    Invalidate every taxonomy cache entry by incrementing the generation.
+
+    Other processes pick the new generation up once their in-process memo
+    expires (at most ``_LOCAL_MEMO_SECONDS``).
+
+    Returns:
+        The new generation number.
+    """
+    global _memo
+
+    _get_generation()
+    try:
+        generation = cache.incr(_GENERATION_KEY)
+    except ValueError:
+        # Key was evicted between the read and the increment.
+        cache.set(_GENERATION_KEY, 2, timeout=None)
+        generation = 2
+    _memo = None
+    return int(generation)
+
+
+def _refresh_version() -> str:
+    """Re-check the backbone version if the shared check interval has elapsed."""
+    interval = getattr(
+        settings,
+        "GBIF_BACKBONE_VERSION_CHECK_INTERVAL",
+        _DEFAULT_VERSION_CHECK_INTERVAL,
+    )
+    known: Optional[str] = cache.get(_VERSION_KEY)
+
+    if interval is None or cache.get(_VERSION_CHECKED_KEY):
+        return known or UNVERSIONED
+
+    # Claim the check so concurrent workers don't all hit the registry.
+    if not cache.add(_VERSION_CHECKED_KEY, True, timeout=interval):
+        return known or UNVERSIONED
+
+    latest = fetch_backbone_version()
+    if latest is None:
+        return known or UNVERSIONED
+
+    if latest != known:
+        cache.set(_VERSION_KEY, latest, timeout=None)
+        if known is not None:
+            logger.info("GBIF backbone changed from %s to %s", known, latest)
+            bump_generation()
+    return latest
+
+
+def get_backbone_state() -> Tuple[str, int]:
+    """
+    Return the ``(backbone version, generation)`` pair used in cache keys.
+    """
+    global _memo
+
+    now = time.monotonic()
+    if _memo is not None and _memo[2] > now:
+        return _memo[0], _memo[1]
+
+    version = _refresh_version()
+    generation = _get_generation()
+    _memo = (version, generation, now + _LOCAL_MEMO_SECONDS)
+    return version, generation
+
+
+def taxonomy_cache_key(namespace: str, *parts: Any) -> str:
+    """
+    Build a cache key scoped to the current backbone version and generation.
+
+    Args:
+        namespace: Kind of entry (e.g. ``"search"``, ``"usage"``, ``"name"``).
+        *parts: Values that identify the entry within the namespace.
+    """
+    version, generation = get_backbone_state()
+    suffix = ":".join(str(p) for p in parts)
+    return f"gbif:{version}:{generation}:{namespace}:{suffix}"
+
+
+def last_good_cache_key(namespace: str, *parts: Any) -> str:
+    """
+    Build the key of the last-known-good copy of an entry.
+
+    Unlike ``taxonomy_cache_key`` it ignores the backbone version and
+    generation, so the copy survives invalidation and can be served stale.
+    """
+    suffix = ":".join(str(p) for p in parts)
+    return f"gbif:last-good:{namespace}:{suffix}"
+
+
+@contextmanager
+def track_stale_serves() -> Iterator[List[str]]:
+    """
+    Collect the read paths that served stale data inside the block.
+
+    Yields:
+        A list that receives the name of every path that fell back to its
+        last-known-good copy.
+    """
+    served: List[str] = []
+    token = _stale_serves.set(served)
+    try:
+        yield served
+    finally:
+        _stale_serves.reset(token)
+
+
+def note_stale_serve(path: str) -> None:
+    """Record that `path` answered from its last-known-good copy."""
+    metrics.increment("gbif.stale_serves", path=path)
+    logger.warning("GBIF unavailable; serving stale %s data", path)
+    served = _stale_serves.get()
+    if served is not None:
+        served.append(path)
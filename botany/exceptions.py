@@ -0,0 +1,11 @@
+# Domain-specific exceptions so callers don't need to import pygbif or know implementation details.
+class GBIFNotFound(Exception):
+    """Raised when the requested GBIF resource or results are not found (404-like)."""
+
+    pass
+
+
+class GBIFError(Exception):
+    """Raised when something goes wrong calling GBIF (500-like)."""
+
+    pass
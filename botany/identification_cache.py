@@ -0,0 +1,162 @@
+"""
+Content-addressed cache of plant identification results.
+
+An identification depends only on the image bytes, the location and the
+request options, so results are cached under a SHA-256 of:
+
+- the digests of the preprocessed images (as a set: order doesn't matter),
+- the coordinates rounded to ``IDENTIFICATION_COORDINATE_PRECISION``
+  decimal places (3 ≈ 110 m), and
+- the language/details/classification options.
+
+The cache is shared by all users, so only the identification itself is
+stored: the per-submission fields (``PER_REQUEST_FIELDS``: the submitter's
+Kindwise access token, which grants access to their identification and
+images, and their exact location and time) are stripped on save and on
+read, and callers fill them in from the current request.
+
+Lookups go cache → database (``PlantIdentificationResult``); both expire
+entries after ``IDENTIFICATION_CACHE_TIMEOUT``. At most once per
+``_EVICTION_INTERVAL`` a save also deletes expired rows and the oldest rows
+beyond ``IDENTIFICATION_CACHE_MAX_ENTRIES``.
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from .models import PlantIdentificationResult
+
+_DEFAULT_TIMEOUT = 60 * 60 * 24 * 30  # 30 days
+_DEFAULT_MAX_ENTRIES = 10_000
+_DEFAULT_PRECISION = 3
+_EVICTION_INTERVAL = 60 * 10
+
+_EVICTION_KEY = "identification:evicted"
+
+PER_REQUEST_FIELDS = ("access_token", "latitude", "longitude", "datetime")
+
+
+def get_identification_cache_timeout() -> int:
+    return getattr(settings, "IDENTIFICATION_CACHE_TIMEOUT", _DEFAULT_TIMEOUT)
+
+
+def identification_cache_key(
+    images: Sequence[bytes],
+    coordinates: Optional[Tuple[float, float]],
+    options: Dict[str, Any],
+) -> str:
+    """Return the hex SHA-256 identifying this identification request."""
+    precision = getattr(
+        settings, "IDENTIFICATION_COORDINATE_PRECISION", _DEFAULT_PRECISION
+    )
+    if coordinates is not None:
+        coordinates = [round(float(c), precision) for c in coordinates]
+
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            {
+                "images": sorted(hashlib.sha256(image).hexdigest() for image in images),
+                "coordinates": coordinates,
+                "options": options,
+            },
+            sort_keys=True,
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+def _cache_key(key: str) -> str:
+    return f"identification:{key}"
+
+
+def _encode(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return json.loads(json.dumps(payload, cls=DjangoJSONEncoder))
+
+
+def _shared(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in payload.items() if k not in PER_REQUEST_FIELDS}
+
+
+def _decode(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Undo what JSON did to the payload (suggestion indexes come back as
+    # strings). Rows saved before per-request fields were stripped still
+    # hold them; never hand them out.
+    payload = _shared(data)
+    if "suggestions" in payload:
+        payload["suggestions"] = {int(k): v for k, v in payload["suggestions"].items()}
+    return payload
+
+
+def get_identification(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached identification payload for `key`, or None.
+
+    The payload never contains ``PER_REQUEST_FIELDS``.
+    """
+    data = cache.get(_cache_key(key))
+    if data is None:
+        timeout = get_identification_cache_timeout()
+        row = (
+            PlantIdentificationResult.objects.filter(
+                key=key, created_at__gte=timezone.now() - timedelta(seconds=timeout)
+            )
+            .values_list("result", "created_at")
+            .first()
+        )
+        if row is None:
+            return None
+        data, created_at = row
+        remaining = timeout - (timezone.now() - created_at).total_seconds()
+        cache.set(_cache_key(key), data, max(int(remaining), 1))
+    return _decode(data)
+
+
+def save_identification(key: str, payload: Dict[str, Any]) -> None:
+    """
+    Store `payload` under `key` in the cache and the database, without its
+    ``PER_REQUEST_FIELDS``.
+    """
+    data = _encode(_shared(payload))
+    PlantIdentificationResult.objects.update_or_create(
+        key=key, defaults={"result": data, "created_at": timezone.now()}
+    )
+    cache.set(_cache_key(key), data, get_identification_cache_timeout())
+    if cache.add(_EVICTION_KEY, True, _EVICTION_INTERVAL):
+        evict_identifications()
+
+
+def evict_identifications() -> int:
+    """
+    Delete expired results and the oldest ones beyond the size limit.
+
+    Returns:
+        Number of rows deleted.
+    """
+    cutoff = timezone.now() - timedelta(seconds=get_identification_cache_timeout())
+    deleted, _ = PlantIdentificationResult.objects.filter(created_at__lt=cutoff).delete()
+
+    max_entries = getattr(
+        settings, "IDENTIFICATION_CACHE_MAX_ENTRIES", _DEFAULT_MAX_ENTRIES
+    )
+    newest_evicted = (
+        PlantIdentificationResult.objects.order_by("-created_at", "-id")
+        .values_list("created_at", "id")[max_entries : max_entries + 1]
+        .first()
+    )
+    if newest_evicted is not None:
+        created_at, pk = newest_evicted
+        overflow, _ = (
+            PlantIdentificationResult.objects.filter(created_at__lte=created_at)
+            .exclude(created_at=created_at, id__gt=pk)
+            .delete()
+        )
+        deleted += overflow
+    return deleted
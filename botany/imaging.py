@@ -0,0 +1,155 @@
+"""
+Image preprocessing before plant identification.
+
+Phone photos are often several megabytes, which dominates upload time and
+upstream latency. Before images are sent to Kindwise they are decoded,
+rotated according to their EXIF orientation, downsampled so the longest edge
+is at most ``IMAGE_MAX_EDGE`` pixels, stripped of metadata (EXIF, GPS, ICC)
+and re-encoded as JPEG at ``IMAGE_QUALITY``.
+
+Decoding and resampling are CPU-bound, so batches run on a bounded process
+pool (``IMAGE_PREPROCESS_WORKERS`` processes; 0 processes images inline).
+Bytes saved and time spent are reported through ``config.metrics``
+(``imaging.*`` counters) and the log.
+
+Images Pillow cannot decode are passed through unchanged and left for the
+upstream to accept or reject.
+"""
+
+import atexit
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import PurePath
+from typing import Any, List, Optional, Sequence
+
+from django.conf import settings
+
+from config import metrics
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_EDGE = 1500
+_DEFAULT_QUALITY = 85
+_DEFAULT_WORKERS = 2
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def preprocess_image(data: bytes, max_edge: int, quality: int) -> bytes:
+    """
+    Return `data` re-encoded as an oriented, downsampled, metadata-free JPEG.
+
+    Returns `data` unchanged if it is not an image Pillow can decode.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            # Let the JPEG decoder downscale by a power of two while decoding;
+            # much cheaper than decoding at full size and resampling.
+            image.draft("RGB", (max_edge, max_edge))
+            image = ImageOps.exif_transpose(image)
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+            output = io.BytesIO()
+            # No exif/icc_profile arguments: the re-encoded image carries no metadata.
+            image.save(output, "JPEG", quality=quality)
+            return output.getvalue()
+    except (UnidentifiedImageError, OSError):
+        return data
+
+
+def _read(image: Any) -> bytes:
+    if isinstance(image, bytes):
+        return image
+    if hasattr(image, "read"):
+        if hasattr(image, "seek"):
+            image.seek(0)
+        return image.read()
+    if isinstance(image, PurePath):
+        with open(image, "rb") as f:
+            return f.read()
+    raise TypeError(f"Unsupported image type: {type(image).__name__}")
+
+
+def get_image_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the process pool, or None when preprocessing runs inline."""
+    global _pool
+    workers = getattr(settings, "IMAGE_PREPROCESS_WORKERS", _DEFAULT_WORKERS)
+    if not workers:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # "spawn": forking a multi-threaded web worker is unsafe.
+                _pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def preprocess_images(images: Sequence[Any]) -> List[bytes]:
+    """
+    Preprocess `images` (bytes, file-like objects or paths) in parallel.
+
+    Returns:
+        The re-encoded images, in input order.
+    """
+    max_edge = getattr(settings, "IMAGE_MAX_EDGE", _DEFAULT_MAX_EDGE)
+    quality = getattr(settings, "IMAGE_QUALITY", _DEFAULT_QUALITY)
+    payloads = [_read(image) for image in images]
+
+    start = time.perf_counter()
+    pool = get_image_pool()
+    if pool is None:
+        results = [preprocess_image(data, max_edge, quality) for data in payloads]
+    else:
+        count = len(payloads)
+        results = list(
+            pool.map(preprocess_image, payloads, [max_edge] * count, [quality] * count)
+        )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    bytes_in = sum(len(data) for data in payloads)
+    bytes_out = sum(len(data) for data in results)
+    metrics.increment("imaging.images", len(payloads))
+    metrics.increment("imaging.bytes_in", bytes_in)
+    metrics.increment("imaging.bytes_saved", bytes_in - bytes_out)
+    metrics.increment("imaging.preprocess_ms", round(elapsed_ms))
+    logger.info(
+        "Preprocessed %d image(s): %d -> %d bytes (%d saved) in %.1f ms",
+        len(payloads),
+        bytes_in,
+        bytes_out,
+        bytes_in - bytes_out,
+        elapsed_ms,
+    )
+    return results
+
+
+def _forget_inherited_pool() -> None:
+    # The parent's worker processes and pipes are not ours to use.
+    global _pool
+    _pool = None
+
+
+atexit.register(shutdown_image_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_pool)
@@ -0,0 +1,201 @@
+"""
+Asynchronous plant identification jobs.
+
+Identification takes seconds of upstream time, which a synchronous web
+worker would spend blocked. Instead the submit endpoint preprocesses the
+images, stores an ``IdentificationJob`` and returns its id; a small
+in-process thread pool (``IDENTIFICATION_JOB_WORKERS``) runs the job and
+clients poll for (or stream) the result.
+
+The ``IdentificationJob`` table is the queue. A job is claimed by a
+conditional UPDATE from pending to running, so it never runs twice even if
+it is enqueued more than once. Jobs left pending or running when a worker
+exits are picked up again by the ``recover_identification_jobs``
+management command.
+
+Each user may have at most ``IDENTIFICATION_JOBS_PER_USER`` jobs pending or
+running at a time. The limit is checked and the job inserted in one
+transaction holding a lock on the user's row, so concurrent submits by the
+same user are serialized and can't both slip under the limit.
+"""
+
+import atexit
+import base64
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+
+from .imaging import preprocess_images
+from .models import IdentificationJob
+from .services import KindwiseService
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_WORKERS = 4
+_DEFAULT_PER_USER = 2
+_DEFAULT_STALE_AFTER = 60 * 5
+
+_ACTIVE = (IdentificationJob.Status.PENDING, IdentificationJob.Status.RUNNING)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class JobLimitExceeded(Exception):
+    """Raised when a user already has the maximum number of active jobs."""
+
+    pass
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(
+                        settings, "IDENTIFICATION_JOB_WORKERS", _DEFAULT_WORKERS
+                    ),
+                    thread_name_prefix="identification-job",
+                )
+    return _executor
+
+
+def submit_identification(
+    user: Any,
+    images: Sequence[Any],
+    coordinates: Optional[Tuple[float, float]] = None,
+) -> IdentificationJob:
+    """
+    Preprocess `images`, store a pending job and enqueue it after commit.
+
+    Raises:
+        JobLimitExceeded: if `user` already has the maximum number of
+            pending or running jobs.
+    """
+    # Unlocked early exit, so rejected submits skip preprocessing.
+    _check_job_limit(user)
+    encoded = [base64.b64encode(data).decode("ascii") for data in preprocess_images(images)]
+
+    latitude, longitude = coordinates if coordinates is not None else (None, None)
+    with transaction.atomic():
+        list(get_user_model().objects.select_for_update().filter(pk=user.pk).values_list("pk"))
+        _check_job_limit(user)
+        job = IdentificationJob.objects.create(
+            user=user, images=encoded, latitude=latitude, longitude=longitude
+        )
+    transaction.on_commit(lambda: enqueue(job.pk))
+    return job
+
+
+def _check_job_limit(user: Any) -> None:
+    limit = getattr(settings, "IDENTIFICATION_JOBS_PER_USER", _DEFAULT_PER_USER)
+    if IdentificationJob.objects.filter(user=user, status__in=_ACTIVE).count() >= limit:
+        raise JobLimitExceeded(
+            f"At most {limit} identification jobs may run at the same time"
+        )
+
+
+def enqueue(job_id: int) -> None:
+    """Schedule job `job_id` on the worker pool."""
+    try:
+        _get_executor().submit(_run_in_worker, job_id)
+    except RuntimeError:
+        # Pool shut down (interpreter exit): the job stays pending for recovery.
+        logger.warning("Could not enqueue identification job %s", job_id)
+
+
+def _run_in_worker(job_id: int) -> None:
+    close_old_connections()
+    try:
+        run_job(job_id)
+    except Exception:
+        logger.exception("Identification job %s crashed", job_id)
+    finally:
+        connections.close_all()
+
+
+def run_job(job_id: int) -> None:
+    """
+    Claim and run job `job_id`; does nothing if it is no longer pending.
+    """
+    claimed = IdentificationJob.objects.filter(
+        pk=job_id, status=IdentificationJob.Status.PENDING
+    ).update(status=IdentificationJob.Status.RUNNING, started_at=timezone.now())
+    if not claimed:
+        return
+
+    job = IdentificationJob.objects.get(pk=job_id)
+    images = [base64.b64decode(data) for data in job.images]
+    coordinates = None
+    if job.latitude is not None and job.longitude is not None:
+        coordinates = (job.latitude, job.longitude)
+
+    try:
+        result = KindwiseService().identify_preprocessed(images, coordinates)
+    except Exception as exc:
+        logger.warning("Identification job %s failed", job.uuid, exc_info=True)
+        status, result, error = IdentificationJob.Status.FAILED, None, str(exc)
+    else:
+        status, error = IdentificationJob.Status.SUCCEEDED, ""
+
+    IdentificationJob.objects.filter(pk=job_id).update(
+        status=status,
+        result=result,
+        error=error,
+        images=[],
+        finished_at=timezone.now(),
+    )
+
+
+def recover_jobs() -> int:
+    """
+    Re-enqueue pending jobs and jobs stuck running for longer than
+    ``IDENTIFICATION_JOB_STALE_AFTER`` seconds (their worker is gone).
+
+    Returns:
+        Number of jobs enqueued.
+    """
+    stale_after = getattr(
+        settings, "IDENTIFICATION_JOB_STALE_AFTER", _DEFAULT_STALE_AFTER
+    )
+    IdentificationJob.objects.filter(
+        status=IdentificationJob.Status.RUNNING,
+        started_at__lt=timezone.now() - timedelta(seconds=stale_after),
+    ).update(status=IdentificationJob.Status.PENDING, started_at=None)
+
+    job_ids = list(
+        IdentificationJob.objects.filter(
+            status=IdentificationJob.Status.PENDING
+        ).values_list("pk", flat=True)
+    )
+    for job_id in job_ids:
+        enqueue(job_id)
+    return len(job_ids)
+
+
+def shutdown_workers(wait: bool = False) -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _forget_inherited_executor() -> None:
+    # Worker threads don't survive fork(); children build their own pool.
+    global _executor
+    _executor = None
+
+
+atexit.register(shutdown_workers)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_executor)
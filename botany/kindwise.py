@@ -0,0 +1,108 @@
+"""
+Process-wide Kindwise (plant.id) client.
+
+``kindwise.PlantApi`` opens a fresh ``httpx.Client`` for every API call, so
+each identification pays for DNS, TCP and TLS setup again. This module keeps
+one client per worker process whose calls share a pooled ``httpx.Client``
+with explicit connect/read timeouts.
+
+The ``kindwise`` package (``kindwise-api-client`` in requirements.txt) is
+imported on first use, so processes that never identify plants don't pay
+for the import.
+
+The client lives as long as the worker: it is closed at interpreter exit and
+forgotten in forked children, which build their own pool on first use.
+"""
+
+import atexit
+import os
+import threading
+from typing import Any, Optional
+
+from django.conf import settings
+
+_DEFAULT_TIMEOUT = {"connect": 5.0, "read": 30.0, "write": 30.0, "pool": 5.0}
+_DEFAULT_POOL = {"max_connections": 8, "max_keepalive_connections": 4, "keepalive_expiry": 30.0}
+
+_client: Optional[Any] = None
+_lock = threading.Lock()
+
+
+def _build_client() -> Any:
+    try:
+        import httpx
+        from kindwise import PlantApi
+    except ImportError as exc:
+        raise ImportError(
+            "kindwise package is required for plant identification. "
+            "Install it with: pip install kindwise-api-client"
+        ) from exc
+
+    class PooledPlantApi(PlantApi):
+        """``PlantApi`` whose calls go through one shared, pooled HTTP client."""
+
+        def __init__(self, api_key: str, http: "httpx.Client"):
+            super().__init__(api_key=api_key)
+            self.http = http
+
+        def _make_api_call(self, url, method, data=None, timeout=None):
+            # Ignore the per-call float timeout kindwise passes by default and
+            # use the client's configured connect/read/write/pool timeouts.
+            response = self.http.request(
+                method,
+                url,
+                json=data,
+                headers={"Content-Type": "application/json", "Api-Key": self.api_key},
+            )
+            if response.is_error:
+                raise ValueError(
+                    f"Error while making an API call: {response.status_code=} {response.text=}"
+                )
+            return response
+
+        def close(self) -> None:
+            self.http.close()
+
+    timeout = {**_DEFAULT_TIMEOUT, **getattr(settings, "KINDWISE_TIMEOUT", {})}
+    pool = {**_DEFAULT_POOL, **getattr(settings, "KINDWISE_POOL", {})}
+    http = httpx.Client(timeout=httpx.Timeout(**timeout), limits=httpx.Limits(**pool))
+    return PooledPlantApi(getattr(settings, "KINDWISE_API_KEY", None), http)
+
+
+def get_kindwise_client() -> Any:
+    """
+    Return this process's Kindwise client, creating it on first use.
+
+    Raises:
+        ImportError: if the ``kindwise`` package is not installed.
+        ValueError: if no API key is configured.
+    """
+    global _client
+    client = _client
+    if client is not None:
+        return client
+
+    with _lock:
+        if _client is None:
+            _client = _build_client()
+        return _client
+
+
+def close_kindwise_client() -> None:
+    """Close the pooled connections; a new client is built on next use."""
+    global _client
+    with _lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+def _forget_inherited_client() -> None:
+    # Pooled sockets must not be shared with the parent after fork().
+    global _client
+    _client = None
+
+
+atexit.register(close_kindwise_client)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_client)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from botany.jobs import recover_jobs, shutdown_workers
+
+
+class Command(BaseCommand):
+    help = (
+        "Run identification jobs left pending or stuck running by a worker "
+        "that exited, and wait for them to finish.\n"
+    )
+
+    def handle(self, *args, **options):
+        count = recover_jobs()
+        shutdown_workers(wait=True)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Identification job recovery complete!\nJobs run: {count}\n"
+            )
+        )
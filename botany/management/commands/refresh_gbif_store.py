@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from botany.services import refresh_gbif_store
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh stale GBIF taxon records and name resolutions in the durable "
+        "store, in batches.\n"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Rows of each kind to refresh per batch (default: 100).",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=10,
+            help="Stop after this many batches (default: 10).",
+        )
+
+    def handle(self, *args, **options):
+        totals = {"taxa": 0, "names": 0, "errors": 0}
+
+        for _ in range(options["max_batches"]):
+            counts = refresh_gbif_store(batch_size=options["batch_size"])
+            for key, value in counts.items():
+                totals[key] += value
+            # Nothing left to refresh; failed rows are skipped until their
+            # retry back-off has passed, so they can't stall this loop.
+            if sum(counts.values()) == 0:
+                break
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"GBIF store refresh complete!\n"
+                f"Taxa: {totals['taxa']}, Names: {totals['names']}, "
+                f"Errors: {totals['errors']}\n"
+            )
+        )
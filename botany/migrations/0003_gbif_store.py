@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('botany', '0002_add_plant_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GBIFNameResolution',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='The normalized (lower-cased, single-spaced) taxon name.', max_length=255, unique=True, verbose_name='name')),
+                ('usage_key', models.PositiveBigIntegerField(blank=True, help_text='The GBIF usage key the name resolved to.', null=True, verbose_name='usage key')),
+                ('backbone_version', models.CharField(blank=True, help_text='The GBIF backbone release the resolution was fetched from.', max_length=64, verbose_name='backbone version')),
+                ('fetched_at', models.DateTimeField(db_index=True, verbose_name='fetched at')),
+            ],
+            options={
+                'verbose_name': 'GBIF name resolution',
+                'verbose_name_plural': 'GBIF name resolutions',
+            },
+        ),
+        migrations.CreateModel(
+            name='GBIFTaxon',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('usage_key', models.PositiveBigIntegerField(help_text='The GBIF usage key of the taxon.', unique=True, verbose_name='usage key')),
+                ('data', models.JSONField(help_text='The taxon record as returned by GBIF.', verbose_name='data')),
+                ('backbone_version', models.CharField(blank=True, help_text='The GBIF backbone release the record was fetched from.', max_length=64, verbose_name='backbone version')),
+                ('fetched_at', models.DateTimeField(db_index=True, verbose_name='fetched at')),
+            ],
+            options={
+                'verbose_name': 'GBIF taxon',
+                'verbose_name_plural': 'GBIF taxa',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-19 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('botany', '0003_gbif_store'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlantIdentificationResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='SHA-256 of the images, coordinates and options.', max_length=64, unique=True, verbose_name='key')),
+                ('result', models.JSONField(help_text='The parsed identification payload.', verbose_name='result')),
+                ('created_at', models.DateTimeField(db_index=True, verbose_name='created at')),
+            ],
+            options={
+                'verbose_name': 'plant identification result',
+                'verbose_name_plural': 'plant identification results',
+            },
+        ),
+    ]
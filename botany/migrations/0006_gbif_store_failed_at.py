@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-19 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('botany', '0005_identification_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gbifnameresolution',
+            name='failed_at',
+            field=models.DateTimeField(blank=True, help_text='When the last refresh of this row failed; retried after a back-off.', null=True, verbose_name='failed at'),
+        ),
+        migrations.AddField(
+            model_name='gbiftaxon',
+            name='failed_at',
+            field=models.DateTimeField(blank=True, help_text='When the last refresh of this row failed; retried after a back-off.', null=True, verbose_name='failed at'),
+        ),
+    ]
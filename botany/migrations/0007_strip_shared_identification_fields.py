@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 13:50
+
+from django.db import migrations
+
+PER_REQUEST_FIELDS = ("access_token", "latitude", "longitude", "datetime")
+
+
+def strip_per_request_fields(apps, schema_editor):
+    """Drop per-submission fields (access token, location, time) from cached results.
+
+    The identification cache is shared across users; rows saved before
+    these fields were stripped would otherwise hand them to other users.
+    """
+    PlantIdentificationResult = apps.get_model("botany", "PlantIdentificationResult")
+    for row in PlantIdentificationResult.objects.only("result").iterator():
+        if any(field in row.result for field in PER_REQUEST_FIELDS):
+            for field in PER_REQUEST_FIELDS:
+                row.result.pop(field, None)
+            row.save(update_fields=["result"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('botany', '0006_gbif_store_failed_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(strip_per_request_fields, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 import uuid
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
@@ -116,3 +117,178 @@ class PlantJournalEntry(models.Model):
 
     def __str__(self):
         return f"Journal Entry for {self.plant}"
+
+
+class GBIFTaxon(models.Model):
+    """
+    Durable copy of a GBIF backbone taxon (``species.name_usage``) keyed by usage key.
+
+    Sits behind the in-memory caches so evictions and restarts don't send us
+    back to GBIF; rows are refreshed in batches by ``refresh_gbif_store``.
+    """
+
+    usage_key = models.PositiveBigIntegerField(
+        unique=True,
+        verbose_name=_("usage key"),
+        help_text=_("The GBIF usage key of the taxon."),
+    )
+    data = models.JSONField(
+        verbose_name=_("data"),
+        help_text=_("The taxon record as returned by GBIF."),
+    )
+    backbone_version = models.CharField(
+        max_length=64,
+        blank=True,
+        verbose_name=_("backbone version"),
+        help_text=_("The GBIF backbone release the record was fetched from."),
+    )
+    fetched_at = models.DateTimeField(db_index=True, verbose_name=_("fetched at"))
+    failed_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name=_("failed at"),
+        help_text=_("When the last refresh of this row failed; retried after a back-off."),
+    )
+
+    class Meta:
+        verbose_name = _("GBIF taxon")
+        verbose_name_plural = _("GBIF taxa")
+
+    def __str__(self):
+        return f"GBIF taxon {self.usage_key}"
+
+
+class GBIFNameResolution(models.Model):
+    """
+    Durable copy of a GBIF name resolution (``species.name_backbone``).
+
+    ``usage_key`` is NULL when GBIF had no match for the name.
+    """
+
+    name = models.CharField(
+        max_length=255,
+        unique=True,
+        verbose_name=_("name"),
+        help_text=_("The normalized (lower-cased, single-spaced) taxon name."),
+    )
+    usage_key = models.PositiveBigIntegerField(
+        blank=True,
+        null=True,
+        verbose_name=_("usage key"),
+        help_text=_("The GBIF usage key the name resolved to."),
+    )
+    backbone_version = models.CharField(
+        max_length=64,
+        blank=True,
+        verbose_name=_("backbone version"),
+        help_text=_("The GBIF backbone release the resolution was fetched from."),
+    )
+    fetched_at = models.DateTimeField(db_index=True, verbose_name=_("fetched at"))
+    failed_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name=_("failed at"),
+        help_text=_("When the last refresh of this row failed; retried after a back-off."),
+    )
+
+    class Meta:
+        verbose_name = _("GBIF name resolution")
+        verbose_name_plural = _("GBIF name resolutions")
+
+    def __str__(self):
+        return self.name
+
+
+class PlantIdentificationResult(models.Model):
+    """
+    Cached plant identification, keyed by a hash of the preprocessed images,
+    rounded coordinates and request options (see ``botany.identification_cache``).
+
+    Rows expire after ``IDENTIFICATION_CACHE_TIMEOUT`` and the oldest are
+    evicted beyond ``IDENTIFICATION_CACHE_MAX_ENTRIES``.
+    """
+
+    key = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name=_("key"),
+        help_text=_("SHA-256 of the images, coordinates and options."),
+    )
+    result = models.JSONField(
+        verbose_name=_("result"),
+        help_text=_("The parsed identification payload."),
+    )
+    created_at = models.DateTimeField(db_index=True, verbose_name=_("created at"))
+
+    class Meta:
+        verbose_name = _("plant identification result")
+        verbose_name_plural = _("plant identification results")
+
+    def __str__(self):
+        return f"Identification {self.key[:12]}"
+
+
+class IdentificationJob(models.Model):
+    """
+    A queued plant identification (see ``botany.jobs``).
+
+    The table is the queue: jobs are claimed by flipping ``status`` from
+    pending to running, so a job runs at most once even if it is enqueued
+    again by ``recover_identification_jobs``. ``images`` holds the
+    preprocessed images (base64) until the job finishes.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED = "failed", _("Failed")
+
+    uuid = models.UUIDField(
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+    )
+    user = models.ForeignKey(
+        get_user_model(),
+        on_delete=models.CASCADE,
+        related_name="identification_jobs",
+        verbose_name=_("user"),
+        help_text=_("The user who submitted the job."),
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name=_("status"),
+    )
+    images = models.JSONField(
+        default=list,
+        verbose_name=_("images"),
+        help_text=_("Base64-encoded preprocessed images; cleared when the job finishes."),
+    )
+    latitude = models.FloatField(blank=True, null=True, verbose_name=_("latitude"))
+    longitude = models.FloatField(blank=True, null=True, verbose_name=_("longitude"))
+    result = models.JSONField(
+        blank=True,
+        null=True,
+        encoder=DjangoJSONEncoder,
+        verbose_name=_("result"),
+        help_text=_("The parsed identification payload."),
+    )
+    error = models.TextField(blank=True, verbose_name=_("error"))
+    created_at = models.DateTimeField(db_index=True, auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = _("identification job")
+        verbose_name_plural = _("identification jobs")
+        indexes = [models.Index(fields=["user", "status"])]
+
+    def __str__(self):
+        return f"Identification job {self.uuid} ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.Status.SUCCEEDED, self.Status.FAILED)
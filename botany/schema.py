@@ -131,3 +131,17 @@ class PlantOut(Schema):
     notes: str
     created_at: datetime
     updated_at: datetime
+
+
+class IdentificationJobOut(Schema):
+    """Status (and, once finished, result) of a plant identification job."""
+
+    uuid: UUID
+    status: str = Field(..., description="pending, running, succeeded or failed")
+    result: Optional[Dict[str, Any]] = Field(
+        default=None, description="The identification payload once succeeded"
+    )
+    error: str = Field(default="", description="Failure reason once failed")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -1,37 +1,83 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from django.core.cache import cache
-from django.conf import settings
+from django.utils import timezone
 from pygbif import species, occurrences
 
-try:
-    from kindwise import PlantApi, PlantIdentification, ClassificationLevel
-
-    _KINDWISE_AVAILABLE = True
-except ImportError:
-    _KINDWISE_AVAILABLE = False
-
-from .utils import resolve_gbif_id
-
-
-# Domain-specific exceptions so callers don't need to import pygbif or know implementation details.
-class GBIFNotFound(Exception):
-    """Raised when the requested GBIF resource or results are not found (404-like)."""
-
-    pass
+from outbound.bulkheads import get_bulkhead
+from . import store
+from .cache import (
+    get_stale_cache_timeout,
+    get_taxonomy_cache_timeout,
+    last_good_cache_key,
+    note_stale_serve,
+    taxonomy_cache_key,
+)
+from .exceptions import GBIFError, GBIFNotFound
+from .identification_cache import (
+    get_identification,
+    identification_cache_key,
+    save_identification,
+)
+from .imaging import preprocess_images
+from .kindwise import get_kindwise_client
+from .upstream import call_gbif
+from .utils import fetch_usage_key, resolve_gbif_id
+
+
+logger = logging.getLogger(__name__)
+
+
+_MISSING = object()
+_GBIF_OCCURRENCES_CACHE_TIMEOUT = 3600  # 1 hour
+# Concurrent GBIF fetches when enriching a batch of taxa.
+_ENRICHMENT_CONCURRENCY = 5
+
+
+def _fetch_with_fallback(
+    path: str,
+    cache_key: str,
+    last_good_key: str,
+    fetch: Callable[[], Any],
+    timeout: int,
+) -> Any:
+    """
+    Return the fresh cached value for `cache_key`, fetching it on a miss.
 
+    Every successful fetch is also written to `last_good_key`, which outlives
+    the freshness TTL. When the fetch raises GBIFError and a last-known-good
+    copy exists, that copy is served instead and the stale serve is recorded.
+    """
+    value = cache.get(cache_key, _MISSING)
+    if value is not _MISSING:
+        return value
 
-class GBIFError(Exception):
-    """Raised when something goes wrong calling GBIF (500-like)."""
+    try:
+        value = fetch()
+    except GBIFError:
+        stale = cache.get(last_good_key, _MISSING)
+        if stale is _MISSING:
+            raise
+        note_stale_serve(path)
+        return stale
 
-    pass
+    cache.set(cache_key, value, timeout)
+    cache.set(last_good_key, value, get_stale_cache_timeout())
+    return value
 
 
 def get_plant_details(identifier: str) -> Dict[str, Any]:
     """
     Resolve `identifier` to a GBIF id and fetch the plant details via pygbif.species.name_usage.
 
+    Details are read from the cache, then the durable store (see
+    ``botany.store``), and only fetched from GBIF when both miss. The store
+    doubles as the last-known-good copy: stored rows are served regardless of
+    age, so a GBIF outage only affects taxa we have never fetched.
+
     Raises:
         GBIFNotFound: if identifier cannot be resolved to a GBIF id.
         GBIFError: on network/API errors from pygbif.
@@ -42,15 +88,102 @@ def get_plant_details(identifier: str) -> Dict[str, Any]:
     if gbif_id is None:
         raise GBIFNotFound("Plant not found")
 
+    details = store.get_taxon(gbif_id)
+    if details is not None:
+        return details
+
+    details = _fetch_taxon(gbif_id)
+    if details:
+        store.save_taxon(gbif_id, details)
+    return details
+
+
+def _fetch_taxon(gbif_id: int) -> Dict[str, Any]:
+    """Fetch a taxon record from GBIF, bypassing caches and the store."""
     try:
-        details: Dict[str, Any] = species.name_usage(key=gbif_id, data="all", limit=1)
+        details: Dict[str, Any] = call_gbif(
+            species.name_usage, key=gbif_id, data="all", limit=1
+        )
     except Exception as exc:
         # wrap implementation-specific exceptions so the controller can map them to HTTP 500
         raise GBIFError("Error accessing GBIF API") from exc
-
     return details
 
 
+def get_taxa_details(usage_keys: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Bulk version of ``get_plant_details`` for known usage keys.
+
+    All keys are read from the cache/store in one step (``store.get_taxa``);
+    only the misses are fetched from GBIF, concurrently, and saved to the
+    store. Keys GBIF fails on are left out rather than failing the batch.
+
+    Returns:
+        Dict mapping usage key to taxon record.
+    """
+    found = store.get_taxa(usage_keys)
+    missing = [k for k in dict.fromkeys(int(k) for k in usage_keys) if k not in found]
+    if not missing:
+        return found
+
+    # These threads only wait: the GBIF calls themselves are dispatched to the
+    # gbif bulkhead by call_gbif. Saving stays on this thread (and connection).
+    workers = min(len(missing), _ENRICHMENT_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {k: executor.submit(_fetch_taxon, k) for k in missing}
+    for usage_key, future in futures.items():
+        try:
+            details = future.result()
+        except GBIFError:
+            logger.warning("Could not fetch GBIF taxon %s", usage_key, exc_info=True)
+            continue
+        if details:
+            store.save_taxon(usage_key, details)
+            found[usage_key] = details
+    return found
+
+
+def refresh_gbif_store(batch_size: int = 100) -> Dict[str, int]:
+    """
+    Re-fetch one batch of stale taxon records and name resolutions from GBIF.
+
+    Intended for the ``refresh_gbif_store`` management command, never the
+    request path. Failures (including empty records) are counted and the
+    rows stamped as failed, so they are retried after a back-off instead of
+    being picked again by the next batch.
+
+    Returns:
+        Dict with ``taxa``, ``names`` (rows refreshed) and ``errors`` counts.
+    """
+    counts = {"taxa": 0, "names": 0, "errors": 0}
+
+    failed_taxa = []
+    for usage_key in store.stale_taxa(batch_size):
+        try:
+            details = _fetch_taxon(usage_key)
+        except GBIFError:
+            details = None
+        if not details:
+            failed_taxa.append(usage_key)
+            continue
+        store.save_taxon(usage_key, details)
+        counts["taxa"] += 1
+
+    failed_names = []
+    for name in store.stale_name_resolutions(batch_size):
+        try:
+            usage_key = fetch_usage_key(name)
+        except GBIFError:
+            failed_names.append(name)
+            continue
+        store.save_name_resolution(name, usage_key)
+        counts["names"] += 1
+
+    store.mark_refresh_failed(usage_keys=failed_taxa, names=failed_names)
+    counts["errors"] = len(failed_taxa) + len(failed_names)
+    return counts
+
+
 def get_plant_occurrences(
     identifier: str,
     limit: int = 300,
@@ -59,6 +192,9 @@ def get_plant_occurrences(
     """
     Resolve `identifier` and return a list of occurrences (already filtered).
 
+    Results are cached for 1 hour; past that, the last-known-good copy is
+    served if GBIF fails.
+
     Raises:
         GBIFNotFound: if identifier cannot be resolved or no occurrences found.
         GBIFError: on network/API errors from pygbif.
@@ -70,20 +206,30 @@ def get_plant_occurrences(
         raise GBIFNotFound("Plant not found")
 
     fields = fields or ["name", "media", "license", "month", "year", "eventDate"]
+    key_parts = (gbif_id, limit, ",".join(fields))
 
-    try:
-        occ_data: Dict[str, Any] = occurrences.search(
-            taxon_key=gbif_id,
-            has_coordinate=True,
-            has_geospatial_issue=False,
-            mediatype="StillImage",
-            fields=fields,
-            limit=limit,
-        )
-    except Exception as exc:
-        raise GBIFError("Error retrieving occurrences from GBIF API") from exc
-
-    results: List[Dict[str, Any]] = occ_data.get("results", []) or []
+    def _fetch() -> List[Dict[str, Any]]:
+        try:
+            occ_data: Dict[str, Any] = call_gbif(
+                occurrences.search,
+                taxon_key=gbif_id,
+                has_coordinate=True,
+                has_geospatial_issue=False,
+                mediatype="StillImage",
+                fields=fields,
+                limit=limit,
+            )
+        except Exception as exc:
+            raise GBIFError("Error retrieving occurrences from GBIF API") from exc
+        return occ_data.get("results", []) or []
+
+    results: List[Dict[str, Any]] = _fetch_with_fallback(
+        "occurrences",
+        "gbif:occurrences:" + ":".join(str(p) for p in key_parts),
+        last_good_cache_key("occurrences", *key_parts),
+        _fetch,
+        _GBIF_OCCURRENCES_CACHE_TIMEOUT,
+    )
     if not results:
         # intentionally using NotFound semantics for empty results
         raise GBIFNotFound("No occurrences found")
@@ -144,9 +290,6 @@ def get_plant_summary(
     }
 
 
-_GBIF_SEARCH_CACHE_TIMEOUT = 3600  # 1 hour
-
-
 def search_gbif(
     query: str,
     family: Optional[str] = None,
@@ -156,8 +299,10 @@ def search_gbif(
     """
     Search GBIF for species matching `query`, with optional family filter.
 
-    Results are cached for 1 hour using Django's cache framework. The cache key
-    encodes all parameters so distinct queries never share cached data.
+    Results are cached using Django's cache framework until the next GBIF
+    backbone release (see ``botany.cache``). The cache key encodes all
+    parameters so distinct queries never share cached data. If GBIF fails
+    after that, the last-known-good copy is served.
 
     Args:
         query: Free-text species search term (required).
@@ -171,9 +316,9 @@ def search_gbif(
         rank, kingdom, phylum, class, order, family, genus, commonNames.
 
     Raises:
-        GBIFError: If the pygbif call fails for any reason.
+        GBIFError: If the pygbif call fails and no last-known-good copy exists.
     """
-    cache_key = f"gbif_search:{query}:{family}:{limit}:{offset}"
+    key_parts = (query, family, limit, offset)
 
     def _fetch() -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {
@@ -185,7 +330,7 @@ def search_gbif(
             kwargs["family"] = family
 
         try:
-            raw: Dict[str, Any] = species.search(**kwargs)
+            raw: Dict[str, Any] = call_gbif(species.search, **kwargs)
         except Exception as exc:
             raise GBIFError("Error searching GBIF") from exc
 
@@ -201,8 +346,12 @@ def search_gbif(
             "results": normalized,
         }
 
-    result: Dict[str, Any] = cache.get_or_set(
-        cache_key, _fetch, _GBIF_SEARCH_CACHE_TIMEOUT
+    result: Dict[str, Any] = _fetch_with_fallback(
+        "search",
+        taxonomy_cache_key("search", *key_parts),
+        last_good_cache_key("search", *key_parts),
+        _fetch,
+        get_taxonomy_cache_timeout(),
     )
     return result
 
@@ -311,34 +460,63 @@ def plant_to_dict(plant: Any) -> Dict[str, Any]:
 
 
 class KindwiseService:
-    def __init__(self):
-        if not _KINDWISE_AVAILABLE:
-            raise ImportError(
-                "kindwise package is required for plant identification. "
-                "Install it with: pip install kindwise"
-            )
-        self.api_key = settings.KINDWISE_API_KEY
-        self.api = PlantApi(api_key=self.api_key)
+    # specify up to 3 languages
+    language = ["en"]
+    details = ["gbif_id"]
+    # health = 'all'
+    classification_level = "species"
 
-        # specify up to 3 languages
-        self.language = ["en"]
-        self.details = self.get_details()
-        # self.health = 'all'
-        self.classification_level = ClassificationLevel.SPECIES
+    def __init__(self, api=None):
+        # The process-wide client keeps its HTTP connections between calls.
+        self.api = api if api is not None else get_kindwise_client()
 
     def identify_plant(self, images, coordinates=None):
+        if not isinstance(images, (list, tuple)):
+            images = [images]
+        return self.identify_preprocessed(preprocess_images(images), coordinates)
+
+    def identify_preprocessed(self, images, coordinates=None):
+        """Identify images that already went through ``preprocess_images``."""
+        # Identical photos and (rounded) coordinates always identify the same.
+        key = identification_cache_key(
+            images,
+            coordinates,
+            {
+                "language": self.language,
+                "details": self.details,
+                "classification_level": self.classification_level,
+            },
+        )
+        payload = get_identification(key)
+        if payload is not None:
+            # Shared across users: this request gets its own location and
+            # time, and no access token (there was no Kindwise call).
+            latitude, longitude = coordinates if coordinates is not None else (None, None)
+            payload.update(
+                access_token=None,
+                latitude=latitude,
+                longitude=longitude,
+                datetime=timezone.now(),
+            )
+            return self.enrich_suggestions(payload)
+
         try:
-            identification: PlantIdentification = self.api.identify(
+            identification = get_bulkhead("kindwise").call(
+                self.api.identify,
                 images,
+                # Already downsampled by preprocess_images.
+                max_image_size=None,
                 latitude_longitude=coordinates,
                 language=self.language,
                 details=self.details,
                 # health=self.health,
                 classification_level=self.classification_level,
             )
-            return self.parse_identification(identification)
+            payload = self.parse_identification(identification)
         except Exception as e:
             raise e
+        save_identification(key, payload)
+        return self.enrich_suggestions(payload)
 
     def parse_identification(self, identification):
         probability_is_plant = identification.result.is_plant.probability
@@ -375,5 +553,31 @@ class KindwiseService:
             "top_match_probability": top_match.probability,
         }
 
+    def enrich_suggestions(self, payload):
+        """
+        Add GBIF taxonomy (family, genus, rank, scientific and common name)
+        to each suggestion, so clients don't need a ``/gbif/{id}`` request per
+        suggestion. Taxa are looked up in one batch; see ``get_taxa_details``.
+
+        Enrichment is applied after the identification cache, so cached
+        results pick up refreshed taxonomy.
+        """
+        suggestions = payload.get("suggestions") or {}
+        gbif_ids = [s["id"] for s in suggestions.values() if s.get("id") is not None]
+        taxa = get_taxa_details(gbif_ids) if gbif_ids else {}
+
+        enriched = {}
+        for index, suggestion in suggestions.items():
+            taxon = taxa.get(suggestion.get("id"), {})
+            enriched[index] = {
+                **suggestion,
+                "scientific_name": taxon.get("scientificName"),
+                "common_name": taxon.get("vernacularName"),
+                "rank": taxon.get("rank"),
+                "family": taxon.get("family"),
+                "genus": taxon.get("genus"),
+            }
+        return {**payload, "suggestions": enriched}
+
     def get_details(self):
-        return ["gbif_id"]
+        return self.details
@@ -0,0 +1,166 @@
+"""
+Durable GBIF response store (L3) behind the in-memory taxonomy caches.
+
+Reads go cache → database; GBIF is only contacted on a miss in both. Rows are
+never refreshed on the request path: ``stale_taxa``/``stale_name_resolutions``
+feed the ``refresh_gbif_store`` management command, which re-fetches them in
+batches once they are older than ``GBIF_STORE_REFRESH_AFTER`` or were fetched
+from a previous backbone release. Rows whose refresh failed are stamped
+(``mark_refresh_failed``) and skipped for ``GBIF_STORE_RETRY_AFTER``, so
+persistent failures don't hold the head of the queue.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import (
+    UNVERSIONED,
+    get_backbone_state,
+    get_taxonomy_cache_timeout,
+    taxonomy_cache_key,
+)
+from .models import GBIFNameResolution, GBIFTaxon
+
+_DEFAULT_REFRESH_AFTER = 60 * 60 * 24 * 30  # 30 days
+_DEFAULT_RETRY_AFTER = 60 * 60 * 24  # 1 day
+
+
+def _current_version() -> str:
+    return get_backbone_state()[0]
+
+
+def get_taxon(usage_key: int) -> Optional[Dict[str, Any]]:
+    """Return the stored taxon record for `usage_key`, or None."""
+    return get_taxa([usage_key]).get(usage_key)
+
+
+def get_taxa(usage_keys: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Bulk-read taxon records: one ``cache.get_many`` plus one
+    ``WHERE usage_key IN (...)`` query for the cache misses.
+
+    Records found only in the database are written back to the cache.
+
+    Returns:
+        Dict mapping usage key to taxon record; unknown keys are omitted.
+    """
+    keys = list(dict.fromkeys(int(k) for k in usage_keys))
+    if not keys:
+        return {}
+
+    cache_keys = {taxonomy_cache_key("usage", k): k for k in keys}
+    found: Dict[int, Dict[str, Any]] = {
+        cache_keys[ck]: data for ck, data in cache.get_many(cache_keys).items()
+    }
+
+    missing = [k for k in keys if k not in found]
+    if missing:
+        rows = GBIFTaxon.objects.filter(usage_key__in=missing).values_list(
+            "usage_key", "data"
+        )
+        from_db = dict(rows)
+        if from_db:
+            cache.set_many(
+                {taxonomy_cache_key("usage", k): d for k, d in from_db.items()},
+                get_taxonomy_cache_timeout(),
+            )
+        found.update(from_db)
+
+    return found
+
+
+def save_taxon(usage_key: int, data: Dict[str, Any]) -> None:
+    """Insert or replace the stored record for `usage_key` and cache it."""
+    GBIFTaxon.objects.update_or_create(
+        usage_key=usage_key,
+        defaults={
+            "data": data,
+            "backbone_version": _current_version(),
+            "fetched_at": timezone.now(),
+            "failed_at": None,
+        },
+    )
+    cache.set(
+        taxonomy_cache_key("usage", usage_key), data, get_taxonomy_cache_timeout()
+    )
+
+
+def get_name_resolution(name: str) -> Tuple[bool, Optional[int]]:
+    """
+    Look up a stored resolution for the normalized `name`.
+
+    Returns:
+        ``(found, usage_key)``; ``usage_key`` may be None for a stored miss.
+    """
+    rows = list(
+        GBIFNameResolution.objects.filter(name=name).values_list(
+            "usage_key", flat=True
+        )[:1]
+    )
+    if not rows:
+        return False, None
+    return True, rows[0]
+
+
+def save_name_resolution(name: str, usage_key: Optional[int]) -> None:
+    """Insert or replace the stored resolution for the normalized `name`."""
+    GBIFNameResolution.objects.update_or_create(
+        name=name,
+        defaults={
+            "usage_key": usage_key,
+            "backbone_version": _current_version(),
+            "fetched_at": timezone.now(),
+            "failed_at": None,
+        },
+    )
+    cache.set(
+        taxonomy_cache_key("name", name), usage_key, get_taxonomy_cache_timeout()
+    )
+
+
+def _stale_filter() -> Q:
+    refresh_after = getattr(
+        settings, "GBIF_STORE_REFRESH_AFTER", _DEFAULT_REFRESH_AFTER
+    )
+    stale = Q(fetched_at__lt=timezone.now() - timedelta(seconds=refresh_after))
+    version = _current_version()
+    if version != UNVERSIONED:
+        stale |= ~Q(backbone_version=version)
+    retry_after = getattr(settings, "GBIF_STORE_RETRY_AFTER", _DEFAULT_RETRY_AFTER)
+    retry_due = Q(failed_at__isnull=True) | Q(
+        failed_at__lt=timezone.now() - timedelta(seconds=retry_after)
+    )
+    return stale & retry_due
+
+
+def mark_refresh_failed(*, usage_keys: Iterable[int] = (), names: Iterable[str] = ()) -> None:
+    """Stamp rows whose refresh failed so the next batches move past them."""
+    now = timezone.now()
+    usage_keys, names = list(usage_keys), list(names)
+    if usage_keys:
+        GBIFTaxon.objects.filter(usage_key__in=usage_keys).update(failed_at=now)
+    if names:
+        GBIFNameResolution.objects.filter(name__in=names).update(failed_at=now)
+
+
+def stale_taxa(limit: int) -> List[int]:
+    """Usage keys of the oldest taxon records due for a refresh."""
+    return list(
+        GBIFTaxon.objects.filter(_stale_filter())
+        .order_by("fetched_at")
+        .values_list("usage_key", flat=True)[:limit]
+    )
+
+
+def stale_name_resolutions(limit: int) -> List[str]:
+    """Normalized names of the oldest resolutions due for a refresh."""
+    return list(
+        GBIFNameResolution.objects.filter(_stale_filter())
+        .order_by("fetched_at")
+        .values_list("name", flat=True)[:limit]
+    )
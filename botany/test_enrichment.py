@@ -0,0 +1,73 @@
+"""
+Tests for bulk taxonomy enrichment of identification suggestions.
+
+Verifies:
+- Stored taxa are read in one query and GBIF is not called
+- Only misses are fetched from GBIF, and are saved to the store
+- GBIF failures leave a suggestion unenriched instead of failing
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.utils import timezone
+
+from botany.models import GBIFTaxon
+from botany.services import KindwiseService, get_taxa_details
+
+PAYLOAD = {
+    "suggestions": {
+        0: {"id": 1, "name": "Aloe vera", "probability": 0.9},
+        1: {"id": 2, "name": "Bulbine", "probability": 0.05},
+        2: {"id": None, "name": "Unknown", "probability": 0.01},
+    },
+    "top_match_id": 1,
+}
+
+
+def _taxon(key, family):
+    return {"key": key, "scientificName": f"Taxon {key}", "family": family, "rank": "SPECIES"}
+
+
+@pytest.mark.django_db
+class TestEnrichment:
+    def test_stored_taxa_are_read_in_one_query(self, django_assert_num_queries):
+        GBIFTaxon.objects.bulk_create(
+            GBIFTaxon(usage_key=k, data=_taxon(k, "Asphodelaceae"), fetched_at=timezone.now())
+            for k in (1, 2)
+        )
+
+        with patch("botany.services.species") as mock_species:
+            with django_assert_num_queries(1):
+                enriched = KindwiseService(api=MagicMock()).enrich_suggestions(PAYLOAD)
+
+        mock_species.name_usage.assert_not_called()
+        assert enriched["suggestions"][0]["family"] == "Asphodelaceae"
+        assert enriched["suggestions"][1]["scientific_name"] == "Taxon 2"
+        assert enriched["suggestions"][2]["family"] is None
+        assert enriched["top_match_id"] == 1
+
+    def test_only_misses_are_fetched_and_stored(self):
+        GBIFTaxon.objects.create(usage_key=1, data=_taxon(1, "Stored"), fetched_at=timezone.now())
+
+        with patch("botany.services.species") as mock_species:
+            mock_species.name_usage.return_value = _taxon(2, "Fetched")
+            taxa = get_taxa_details([1, 2])
+
+        mock_species.name_usage.assert_called_once()
+        assert mock_species.name_usage.call_args.kwargs["key"] == 2
+        assert taxa[1]["family"] == "Stored"
+        assert taxa[2]["family"] == "Fetched"
+        assert GBIFTaxon.objects.filter(usage_key=2).exists()
+
+    def test_gbif_failure_leaves_suggestion_unenriched(self, settings):
+        settings.GBIF_REQUEST_POLICY = {"max_attempts": 1, "hedge": False}
+
+        with patch("botany.services.species") as mock_species, patch(
+            "botany.upstream._policy", None
+        ):
+            mock_species.name_usage.side_effect = ValueError("boom")
+            enriched = KindwiseService(api=MagicMock()).enrich_suggestions(PAYLOAD)
+
+        assert enriched["suggestions"][0]["name"] == "Aloe vera"
+        assert enriched["suggestions"][0]["family"] is None
@@ -0,0 +1,112 @@
+"""
+Tests for backbone-version-aware GBIF caching.
+
+Verifies:
+- Cache keys embed the backbone version and generation
+- The registry is checked at most once per interval
+- A new backbone release or a manual generation bump invalidates entries
+- Taxon details and name resolutions are cached
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from botany import cache as gbif_cache
+from botany.services import get_plant_details
+from botany.utils import resolve_gbif_id
+
+
+@pytest.fixture(autouse=True)
+def reset_memo(monkeypatch):
+    monkeypatch.setattr(gbif_cache, "_memo", None)
+
+
+@pytest.fixture
+def version_check(settings):
+    settings.GBIF_BACKBONE_VERSION_CHECK_INTERVAL = 3600
+    with patch("botany.cache.registry") as mock_registry:
+        mock_registry.datasets.return_value = {"pubDate": "2023-08-28"}
+        yield mock_registry
+
+
+class TestTaxonomyCacheKey:
+    def test_key_is_unversioned_when_check_disabled(self):
+        assert gbif_cache.taxonomy_cache_key("usage", 42) == "gbif:unversioned:1:usage:42"
+
+    def test_key_embeds_backbone_version(self, version_check):
+        assert gbif_cache.taxonomy_cache_key("usage", 42) == "gbif:2023-08-28:1:usage:42"
+
+    def test_registry_checked_once_per_interval(self, version_check, monkeypatch):
+        gbif_cache.taxonomy_cache_key("usage", 1)
+        monkeypatch.setattr(gbif_cache, "_memo", None)
+        gbif_cache.taxonomy_cache_key("usage", 2)
+
+        assert version_check.datasets.call_count == 1
+
+    def test_registry_check_goes_through_gbif_policy(self, version_check):
+        from botany.upstream import call_gbif
+
+        with patch("botany.cache.call_gbif", wraps=call_gbif) as mock_call:
+            gbif_cache.taxonomy_cache_key("usage", 1)
+
+        mock_call.assert_called_once_with(
+            version_check.datasets, uuid=gbif_cache.BACKBONE_DATASET_KEY
+        )
+        assert "timeout" in version_check.datasets.call_args.kwargs
+
+    def test_registry_failure_keeps_last_known_version(self, version_check):
+        version_check.datasets.side_effect = Exception("registry down")
+        assert gbif_cache.taxonomy_cache_key("usage", 1) == "gbif:unversioned:1:usage:1"
+
+    def test_new_release_bumps_generation(self, version_check, monkeypatch):
+        from django.core.cache import cache
+
+        before = gbif_cache.taxonomy_cache_key("usage", 1)
+
+        version_check.datasets.return_value = {"pubDate": "2024-11-01"}
+        cache.delete("gbif:backbone:checked")
+        monkeypatch.setattr(gbif_cache, "_memo", None)
+        after = gbif_cache.taxonomy_cache_key("usage", 1)
+
+        assert before == "gbif:2023-08-28:1:usage:1"
+        assert after == "gbif:2024-11-01:2:usage:1"
+
+    def test_bump_generation_changes_keys(self):
+        before = gbif_cache.taxonomy_cache_key("search", "monstera")
+        gbif_cache.bump_generation()
+        after = gbif_cache.taxonomy_cache_key("search", "monstera")
+
+        assert before != after
+
+
+@pytest.mark.django_db
+class TestTaxonomyCaching:
+    def test_details_are_cached(self):
+        with patch("botany.services.species") as mock_species:
+            mock_species.name_usage.return_value = {"key": 2684241}
+
+            get_plant_details("2684241")
+            get_plant_details("2684241")
+
+        assert mock_species.name_usage.call_count == 1
+
+    def test_generation_bump_falls_back_to_store(self):
+        with patch("botany.services.species") as mock_species:
+            mock_species.name_usage.return_value = {"key": 2684241}
+
+            get_plant_details("2684241")
+            gbif_cache.bump_generation()
+            details = get_plant_details("2684241")
+
+        assert details == {"key": 2684241}
+        assert mock_species.name_usage.call_count == 1
+
+    def test_name_resolution_misses_are_cached(self):
+        with patch("botany.utils.species") as mock_species:
+            mock_species.name_backbone.return_value = {"matchType": "NONE"}
+
+            assert resolve_gbif_id("no-such-plant") is None
+            assert resolve_gbif_id("No-Such-Plant") is None
+
+        assert mock_species.name_backbone.call_count == 1
@@ -208,3 +208,71 @@ class TestGBIFSearchEndpoint:
         assert response.status_code == 200
         result = response.json()["results"][0]
         assert result["commonNames"] == []
+
+
+class TestGBIFStaleOnError:
+    """GBIF failures are answered from the last-known-good copy when one exists."""
+
+    @pytest.mark.django_db
+    def test_search_serves_stale_copy_with_warning(self, client):
+        from botany import cache as gbif_cache
+        from config import metrics
+
+        metrics.reset()
+        with patch("botany.services.species") as mock_species:
+            mock_species.search.return_value = MOCK_GBIF_SEARCH_RESPONSE
+            fresh = client.get("/app/api/gbif/search/?q=staletest")
+
+            # Drop the fresh copy (e.g. a new backbone release) and break GBIF.
+            gbif_cache.bump_generation()
+            mock_species.search.side_effect = Exception("GBIF is down")
+            stale = client.get("/app/api/gbif/search/?q=staletest")
+
+        assert fresh.status_code == 200
+        assert "Warning" not in fresh.headers
+        assert stale.status_code == 200
+        assert stale.json() == fresh.json()
+        assert stale.headers["Warning"] == '110 - "Response is Stale"'
+        assert metrics.get_count("gbif.stale_serves", path="search") == 1
+
+    @pytest.mark.django_db
+    def test_occurrences_serve_stale_copy_with_warning(self, client):
+        from django.core.cache import cache
+
+        occurrence = {"name": "Monstera deliciosa", "year": 2024, "media": []}
+        with patch("botany.services.occurrences") as mock_occurrences:
+            mock_occurrences.search.return_value = {"results": [occurrence]}
+            fresh = client.get("/app/api/gbif/2684241/occurrences")
+
+            cache.delete("gbif:occurrences:2684241:300:name,media,license,month,year,eventDate")
+            mock_occurrences.search.side_effect = Exception("timeout")
+            stale = client.get("/app/api/gbif/2684241/occurrences")
+
+        assert fresh.status_code == 200
+        assert stale.status_code == 200
+        assert stale.json()["items"] == fresh.json()["items"]
+        assert stale.headers["Warning"] == '110 - "Response is Stale"'
+
+    @pytest.mark.django_db
+    def test_error_without_stale_copy_still_returns_500(self, client):
+        with patch("botany.services.occurrences") as mock_occurrences:
+            mock_occurrences.search.side_effect = Exception("GBIF is down")
+            response = client.get("/app/api/gbif/2684241/occurrences")
+
+        assert response.status_code == 500
+
+    @pytest.mark.django_db
+    def test_slug_lookup_during_outage_returns_500(self, client):
+        import requests
+
+        from outbound.bulkheads import BulkheadFull
+
+        for error in (requests.ConnectionError("GBIF is down"), BulkheadFull("gbif")):
+            with patch("botany.utils.species") as mock_species:
+                mock_species.name_backbone.side_effect = error
+                details = client.get("/app/api/gbif/monstera-deliciosa")
+                occurrences = client.get("/app/api/gbif/monstera-deliciosa/occurrences")
+
+            assert details.status_code == 500
+            assert occurrences.status_code == 500
+            assert details.json() == {"detail": "Error accessing GBIF API"}
@@ -0,0 +1,100 @@
+"""
+Tests for the durable GBIF response store.
+
+Verifies:
+- Details and name resolutions survive a cache flush via the store
+- Bulk reads use a single IN query for cache misses
+- The refresh command re-fetches stale rows in batches
+- Rows that keep failing are backed off instead of blocking later rows
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+
+from botany import store
+from botany.models import GBIFNameResolution, GBIFTaxon
+from botany.services import get_plant_details
+from botany.utils import resolve_gbif_id
+
+
+@pytest.mark.django_db
+class TestGBIFStore:
+    def test_details_served_from_store_after_cache_flush(self):
+        with patch("botany.services.species") as mock_species:
+            mock_species.name_usage.return_value = {"key": 2684241}
+            get_plant_details("2684241")
+            cache.clear()
+            details = get_plant_details("2684241")
+
+        assert details == {"key": 2684241}
+        assert mock_species.name_usage.call_count == 1
+        assert GBIFTaxon.objects.filter(usage_key=2684241).exists()
+
+    def test_name_resolution_served_from_store_after_cache_flush(self):
+        with patch("botany.utils.species") as mock_species:
+            mock_species.name_backbone.return_value = {"usageKey": 2684241}
+            resolve_gbif_id("monstera-deliciosa")
+            cache.clear()
+            usage_key = resolve_gbif_id("monstera-deliciosa")
+
+        assert usage_key == 2684241
+        assert mock_species.name_backbone.call_count == 1
+        assert GBIFNameResolution.objects.get(name="monstera deliciosa").usage_key == 2684241
+
+    def test_get_taxa_bulk_reads_misses_in_one_query(self, django_assert_num_queries):
+        now = timezone.now()
+        GBIFTaxon.objects.bulk_create(
+            GBIFTaxon(usage_key=k, data={"key": k}, fetched_at=now) for k in (1, 2, 3)
+        )
+
+        with django_assert_num_queries(1):
+            taxa = store.get_taxa([1, 2, 3, 4])
+
+        assert set(taxa) == {1, 2, 3}
+
+        # Now warm in the cache: no queries at all.
+        with django_assert_num_queries(0):
+            store.get_taxa([1, 2, 3])
+
+    def test_refresh_command_refetches_stale_rows(self):
+        old = timezone.now() - timedelta(days=365)
+        GBIFTaxon.objects.create(usage_key=7, data={"key": 7, "rank": "OLD"}, fetched_at=old)
+        GBIFTaxon.objects.create(usage_key=8, data={"key": 8}, fetched_at=timezone.now())
+
+        with patch("botany.services.species") as mock_species:
+            mock_species.name_usage.return_value = {"key": 7, "rank": "SPECIES"}
+            call_command("refresh_gbif_store", batch_size=10)
+
+        mock_species.name_usage.assert_called_once()
+        assert mock_species.name_usage.call_args.kwargs["key"] == 7
+        assert GBIFTaxon.objects.get(usage_key=7).data["rank"] == "SPECIES"
+
+    def test_failing_rows_do_not_block_the_queue(self):
+        old = timezone.now() - timedelta(days=365)
+        # The failing key is the oldest, so it heads every batch until stamped.
+        GBIFTaxon.objects.create(usage_key=1, data={"key": 1}, fetched_at=old)
+        for key in (2, 3):
+            GBIFTaxon.objects.create(
+                usage_key=key, data={"key": key}, fetched_at=old + timedelta(days=1)
+            )
+
+        def name_usage(key, **kwargs):
+            if key == 1:
+                raise ConnectionError("GBIF down for this key")
+            return {"key": key, "rank": "SPECIES"}
+
+        with patch("botany.services.species") as mock_species:
+            mock_species.name_usage.side_effect = name_usage
+            call_command("refresh_gbif_store", batch_size=1, max_batches=5)
+
+        keys = [c.kwargs["key"] for c in mock_species.name_usage.call_args_list]
+        assert keys.count(1) == 1
+        assert GBIFTaxon.objects.get(usage_key=1).failed_at is not None
+        for key in (2, 3):
+            row = GBIFTaxon.objects.get(usage_key=key)
+            assert row.data["rank"] == "SPECIES" and row.failed_at is None
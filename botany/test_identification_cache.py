@@ -0,0 +1,116 @@
+"""
+Tests for the content-hash plant identification cache.
+
+Verifies:
+- Re-submitting the same image and nearby coordinates skips the upstream call
+- Results survive a cache flush via the database
+- Different images, coordinates or options miss
+- Expired results miss and eviction enforces the TTL and size limit
+- Per-submission fields (access token, exact location, time) are never shared
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from botany import identification_cache
+from botany.identification_cache import PER_REQUEST_FIELDS
+from botany.models import PlantIdentificationResult
+from botany.services import KindwiseService
+
+PAYLOAD = {
+    "access_token": "abc",
+    "latitude": 49.2,
+    "longitude": 16.6,
+    "datetime": timezone.now(),
+    "probability_is_plant": 0.98,
+    "suggestions": {0: {"id": 2777724, "name": "Aloe vera", "probability": 0.96}},
+    "top_match_id": 2777724,
+    "top_match_name": "Aloe vera",
+    "top_match_probability": 0.96,
+}
+SHARED = {k: v for k, v in PAYLOAD.items() if k not in PER_REQUEST_FIELDS}
+
+
+def _shared(result):
+    return {k: v for k, v in result.items() if k not in PER_REQUEST_FIELDS}
+
+
+@pytest.fixture
+def service():
+    service = KindwiseService(api=MagicMock())
+    with patch("botany.services.get_bulkhead") as mock_bulkhead, patch.object(
+        KindwiseService, "parse_identification", return_value=PAYLOAD
+    ), patch.object(KindwiseService, "enrich_suggestions", side_effect=lambda p: p):
+        mock_bulkhead.return_value.call.side_effect = lambda f, *a, **kw: f(*a, **kw)
+        yield service
+
+
+@pytest.mark.django_db
+class TestIdentificationCache:
+    def test_same_image_is_identified_once(self, service):
+        first = service.identify_plant([b"photo"], coordinates=(49.2001, 16.6002))
+        second = service.identify_plant([b"photo"], coordinates=(49.2004, 16.5998))
+
+        assert service.api.identify.call_count == 1
+        assert _shared(second) == _shared(first) == SHARED
+
+    def test_result_survives_cache_flush(self, service):
+        service.identify_plant([b"photo"])
+        cache.clear()
+        result = service.identify_plant([b"photo"])
+
+        assert service.api.identify.call_count == 1
+        assert _shared(result) == SHARED
+        assert PlantIdentificationResult.objects.count() == 1
+
+    def test_hit_does_not_leak_the_first_submitters_fields(self, service):
+        service.identify_plant([b"photo"], coordinates=(49.2001, 16.6002))
+        stored = PlantIdentificationResult.objects.get().result
+
+        hit = service.identify_plant([b"photo"], coordinates=(49.2004, 16.5998))
+
+        assert not set(PER_REQUEST_FIELDS) & set(stored)
+        assert hit["access_token"] is None
+        assert (hit["latitude"], hit["longitude"]) == (49.2004, 16.5998)
+        assert hit["datetime"] != PAYLOAD["datetime"]
+
+    def test_different_image_or_coordinates_miss(self, service):
+        service.identify_plant([b"photo"], coordinates=(49.2, 16.6))
+        service.identify_plant([b"other"], coordinates=(49.2, 16.6))
+        service.identify_plant([b"photo"], coordinates=(49.3, 16.6))
+
+        assert service.api.identify.call_count == 3
+
+    def test_image_order_does_not_matter(self):
+        options = {"language": ["en"]}
+        key = identification_cache.identification_cache_key
+
+        assert key([b"a", b"b"], None, options) == key([b"b", b"a"], None, options)
+        assert key([b"a"], None, options) != key([b"a"], None, {"language": ["de"]})
+
+    def test_expired_results_miss(self, settings):
+        settings.IDENTIFICATION_CACHE_TIMEOUT = 60
+        PlantIdentificationResult.objects.create(
+            key="old", result={}, created_at=timezone.now() - timedelta(minutes=5)
+        )
+
+        assert identification_cache.get_identification("old") is None
+
+    def test_eviction_enforces_ttl_and_size(self, settings):
+        settings.IDENTIFICATION_CACHE_TIMEOUT = 3600
+        settings.IDENTIFICATION_CACHE_MAX_ENTRIES = 2
+        now = timezone.now()
+        PlantIdentificationResult.objects.bulk_create(
+            PlantIdentificationResult(key=str(i), result={}, created_at=now - timedelta(minutes=i))
+            for i in range(4)
+        )
+        PlantIdentificationResult.objects.create(
+            key="expired", result={}, created_at=now - timedelta(days=1)
+        )
+
+        assert identification_cache.evict_identifications() == 3
+        assert set(PlantIdentificationResult.objects.values_list("key", flat=True)) == {"0", "1"}
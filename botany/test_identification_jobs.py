@@ -0,0 +1,193 @@
+"""
+Tests for asynchronous plant identification jobs.
+
+Verifies:
+- Submitting returns 202 with a pending job and enqueues it after commit
+- Running a job stores the result (or the failure) and clears the images
+- A job is only ever claimed once
+- Per-user concurrency limits return 429
+- Status, result and event-stream endpoints are scoped to the owner
+- Recovery re-enqueues pending and stale running jobs
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from botany import jobs
+from botany.models import IdentificationJob
+from domain.tests import _auth_header, _make_user
+
+SUBMIT_URL = "/app/api/identify/jobs"
+
+PAYLOAD = {
+    "access_token": "abc",
+    "probability_is_plant": 0.98,
+    "suggestions": {0: {"id": 2777724, "name": "Aloe vera", "probability": 0.96}},
+    "top_match_id": 2777724,
+    "top_match_name": "Aloe vera",
+    "top_match_probability": 0.96,
+}
+
+
+def _upload(name="leaf.jpg", content=b"photo"):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    return SimpleUploadedFile(name, content, content_type="image/jpeg")
+
+
+def _job(user, **kwargs):
+    return IdentificationJob.objects.create(user=user, images=["cGhvdG8="], **kwargs)
+
+
+@pytest.fixture
+def identify():
+    with patch("botany.jobs.KindwiseService") as mock_service:
+        mock_service.return_value.identify_preprocessed.return_value = PAYLOAD
+        yield mock_service.return_value.identify_preprocessed
+
+
+@pytest.mark.django_db
+class TestIdentificationJobs:
+    def test_submit_returns_202_and_enqueues_on_commit(
+        self, client, django_capture_on_commit_callbacks
+    ):
+        user = _make_user("submit")
+        with patch("botany.jobs.enqueue") as mock_enqueue:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = client.post(
+                    SUBMIT_URL,
+                    {"images": [_upload()], "latitude": "49.2", "longitude": "16.6"},
+                    HTTP_AUTHORIZATION=_auth_header(user),
+                )
+
+        assert response.status_code == 202
+        job = IdentificationJob.objects.get(uuid=response.json()["uuid"])
+        assert response.json()["status"] == "pending"
+        assert (job.latitude, job.longitude) == (49.2, 16.6)
+        mock_enqueue.assert_called_once_with(job.pk)
+
+    def test_run_job_stores_result_and_clears_images(self, identify):
+        job = _job(_make_user("run"), latitude=49.2, longitude=16.6)
+
+        jobs.run_job(job.pk)
+
+        job.refresh_from_db()
+        assert job.status == IdentificationJob.Status.SUCCEEDED
+        assert job.result["top_match_id"] == 2777724
+        assert job.images == []
+        identify.assert_called_once_with([b"photo"], (49.2, 16.6))
+
+    def test_failed_job_records_error(self, identify):
+        identify.side_effect = ValueError("upstream said no")
+        job = _job(_make_user("fail"))
+
+        jobs.run_job(job.pk)
+
+        job.refresh_from_db()
+        assert job.status == IdentificationJob.Status.FAILED
+        assert job.error == "upstream said no"
+
+    def test_job_is_claimed_once(self, identify):
+        job = _job(_make_user("once"))
+
+        jobs.run_job(job.pk)
+        jobs.run_job(job.pk)
+
+        assert identify.call_count == 1
+
+    def test_per_user_limit_returns_429(self, client, settings):
+        settings.IDENTIFICATION_JOBS_PER_USER = 1
+        user = _make_user("limit")
+        _job(user, status=IdentificationJob.Status.RUNNING)
+
+        response = client.post(
+            SUBMIT_URL, {"images": [_upload()]}, HTTP_AUTHORIZATION=_auth_header(user)
+        )
+
+        assert response.status_code == 429
+
+    def test_limit_is_rechecked_under_the_user_lock(self, settings):
+        settings.IDENTIFICATION_JOBS_PER_USER = 1
+        user = _make_user("race")
+
+        def concurrent_submit(images):
+            # Another request inserts its job while this one preprocesses.
+            _job(user)
+            return [b"photo"]
+
+        with patch("botany.jobs.preprocess_images", side_effect=concurrent_submit):
+            with pytest.raises(jobs.JobLimitExceeded):
+                jobs.submit_identification(user=user, images=[_upload()])
+
+        assert IdentificationJob.objects.filter(user=user).count() == 1
+
+    def test_too_many_images_returns_400(self, client):
+        user = _make_user("many")
+
+        response = client.post(
+            SUBMIT_URL,
+            {"images": [_upload(f"{i}.jpg") for i in range(6)]},
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+
+        assert response.status_code == 400
+
+    def test_status_endpoint_is_scoped_to_owner(self, client, identify):
+        owner = _make_user("owner")
+        job = _job(owner)
+        jobs.run_job(job.pk)
+
+        own = client.get(f"{SUBMIT_URL}/{job.uuid}", HTTP_AUTHORIZATION=_auth_header(owner))
+        other = client.get(
+            f"{SUBMIT_URL}/{job.uuid}", HTTP_AUTHORIZATION=_auth_header(_make_user("other"))
+        )
+
+        assert own.status_code == 200
+        assert own.json()["status"] == "succeeded"
+        assert own.json()["result"]["top_match_name"] == "Aloe vera"
+        assert other.status_code == 404
+
+    def test_events_stream_ends_with_done(self, client, identify):
+        user = _make_user("events")
+        job = _job(user)
+        jobs.run_job(job.pk)
+
+        response = client.get(
+            f"{SUBMIT_URL}/{job.uuid}/events", HTTP_AUTHORIZATION=_auth_header(user)
+        )
+
+        assert response["Content-Type"] == "text/event-stream"
+        body = b"".join(response.streaming_content).decode()
+        assert body.startswith("event: done\n")
+        assert '"status":"succeeded"' in body
+
+    def test_events_default_to_one_snapshot_without_holding_the_worker(self, client):
+        user = _make_user("snapshot")
+        job = _job(user)
+
+        with patch("botany.api.time.sleep") as mock_sleep:
+            response = client.get(
+                f"{SUBMIT_URL}/{job.uuid}/events", HTTP_AUTHORIZATION=_auth_header(user)
+            )
+            body = b"".join(response.streaming_content).decode()
+
+        assert body == 'event: status\ndata: {"status": "pending"}\n\n'
+        mock_sleep.assert_not_called()
+
+    def test_recover_requeues_pending_and_stale_running_jobs(self):
+        user = _make_user("recover")
+        pending = _job(user)
+        stale = _job(
+            user,
+            status=IdentificationJob.Status.RUNNING,
+            started_at=timezone.now() - timedelta(hours=1),
+        )
+        _job(user, status=IdentificationJob.Status.RUNNING, started_at=timezone.now())
+
+        with patch("botany.jobs.enqueue") as mock_enqueue:
+            assert jobs.recover_jobs() == 2
+
+        assert {c.args[0] for c in mock_enqueue.call_args_list} == {pending.pk, stale.pk}
@@ -0,0 +1,90 @@
+"""
+Tests for image preprocessing before plant identification.
+
+Verifies:
+- Large images are downsampled to the configured max edge
+- EXIF orientation is applied and metadata is stripped
+- Undecodable input passes through unchanged
+- Batches preserve order on the process pool and report bytes saved
+"""
+
+import io
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from botany import imaging  # noqa: E402
+from config import metrics  # noqa: E402
+
+_ORIENTATION = 0x0112
+_GPS_IFD = 0x8825
+
+
+def _jpeg(size=(4000, 3000), orientation=None, color="green"):
+    image = Image.new("RGB", size, color)
+    exif = Image.Exif()
+    exif[0x010F] = "PhoneMaker"  # Make
+    if orientation:
+        exif[_ORIENTATION] = orientation
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=95, exif=exif)
+    return buffer.getvalue()
+
+
+def _open(data):
+    return Image.open(io.BytesIO(data))
+
+
+class TestPreprocessImage:
+    def test_downsamples_to_max_edge(self):
+        result = imaging.preprocess_image(_jpeg(), max_edge=1000, quality=80)
+
+        assert _open(result).size == (1000, 750)
+
+    def test_small_images_are_not_upscaled(self):
+        result = imaging.preprocess_image(_jpeg(size=(200, 100)), max_edge=1000, quality=80)
+
+        assert _open(result).size == (200, 100)
+
+    def test_applies_exif_orientation_and_strips_metadata(self):
+        # Orientation 6: stored landscape, displayed rotated 90° clockwise.
+        result = imaging.preprocess_image(
+            _jpeg(size=(400, 300), orientation=6), max_edge=1000, quality=80
+        )
+
+        image = _open(result)
+        assert image.size == (300, 400)
+        assert dict(image.getexif()) == {}
+
+    def test_undecodable_input_is_passed_through(self):
+        assert imaging.preprocess_image(b"not an image", 1000, 80) == b"not an image"
+
+
+class TestPreprocessImages:
+    def setup_method(self):
+        metrics.reset()
+
+    def test_reports_bytes_saved(self, settings):
+        settings.IMAGE_MAX_EDGE = 500
+        original = _jpeg()
+
+        (result,) = imaging.preprocess_images([io.BytesIO(original)])
+
+        assert metrics.get_count("imaging.images") == 1
+        assert metrics.get_count("imaging.bytes_saved") == len(original) - len(result)
+        assert len(result) < len(original)
+
+    def test_process_pool_preserves_order(self, settings):
+        settings.IMAGE_PREPROCESS_WORKERS = 2
+        settings.IMAGE_MAX_EDGE = 100
+        colors = ["red", "green", "blue"]
+        try:
+            results = imaging.preprocess_images(
+                [_jpeg(size=(400, 400), color=c) for c in colors]
+            )
+        finally:
+            imaging.shutdown_image_pool()
+
+        dominant = [max(range(3), key=_open(r).getpixel((50, 50)).__getitem__) for r in results]
+        assert dominant == [0, 1, 2]
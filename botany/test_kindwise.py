@@ -0,0 +1,118 @@
+"""
+Tests for the process-wide Kindwise client.
+
+Verifies:
+- One client is shared per process and rebuilt after it is closed
+- API calls reuse the pooled HTTP client instead of opening a new one
+- KindwiseService uses the shared client and parses identifications
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("kindwise")
+
+from botany import kindwise  # noqa: E402
+from botany.services import KindwiseService  # noqa: E402
+
+IDENTIFICATION = {
+    "access_token": "biXpfz7Fbe6cNLw",
+    "model_version": "plant_id:3.4.1",
+    "custom_id": None,
+    "input": {
+        "latitude": 49.2,
+        "longitude": 16.6,
+        "similar_images": False,
+        "images": ["https://plant.id/media/imgs/87fd66a5.jpg"],
+        "datetime": "2023-11-28T08:38:48.538187+00:00",
+    },
+    "result": {
+        "is_plant": {"probability": 0.98, "binary": True, "threshold": 0.5},
+        "classification": {
+            "suggestions": [
+                {
+                    "id": "4ba05f1050481731",
+                    "name": "Aloe vera",
+                    "probability": 0.96,
+                    "details": {"language": "en", "entity_id": "4ba05f1050481731", "gbif_id": 2777724},
+                },
+            ]
+        },
+    },
+    "status": "COMPLETED",
+    "sla_compliant_client": True,
+    "sla_compliant_system": True,
+    "created": 1701160728.538187,
+    "completed": 1701160729.289631,
+}
+
+
+@pytest.fixture(autouse=True)
+def kindwise_client(settings):
+    settings.KINDWISE_API_KEY = "test-key"
+    kindwise.close_kindwise_client()
+    yield
+    kindwise.close_kindwise_client()
+
+
+def _jpeg():
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 32), "green").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def _stub_transport(client, requests):
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=IDENTIFICATION)
+
+    client.http = httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestKindwiseClient:
+    def test_client_is_shared_per_process(self):
+        assert kindwise.get_kindwise_client() is kindwise.get_kindwise_client()
+
+    def test_close_builds_a_new_client_on_next_use(self):
+        first = kindwise.get_kindwise_client()
+        kindwise.close_kindwise_client()
+
+        assert kindwise.get_kindwise_client() is not first
+
+    def test_client_uses_configured_timeouts(self, settings):
+        settings.KINDWISE_TIMEOUT = {"connect": 1.5, "read": 12}
+
+        timeout = kindwise.get_kindwise_client().http.timeout
+
+        assert timeout.connect == 1.5
+        assert timeout.read == 12
+
+    def test_calls_reuse_pooled_http_client(self):
+        client = kindwise.get_kindwise_client()
+        requests = []
+        _stub_transport(client, requests)
+
+        for _ in range(2):
+            client.identify(b"jpeg-bytes", max_image_size=None, as_dict=True)
+
+        assert len(requests) == 2
+        assert requests[0].headers["Api-Key"] == "test-key"
+
+
+@pytest.mark.django_db
+class TestKindwiseService:
+    def test_identify_plant_uses_shared_client(self):
+        requests = []
+        _stub_transport(kindwise.get_kindwise_client(), requests)
+
+        with patch("botany.services.get_taxa_details", return_value={}):
+            result = KindwiseService().identify_plant([_jpeg()], coordinates=(49.2, 16.6))
+
+        assert result["top_match_id"] == 2777724
+        assert result["top_match_name"] == "Aloe vera"
+        assert "details=gbif_id" in str(requests[0].url)
@@ -0,0 +1,73 @@
+"""
+Request policy for calls to the GBIF API.
+
+Every pygbif read goes through ``call_gbif``, which applies an explicit
+timeout and the process-wide GBIF ``RequestPolicy`` (jittered retries of
+transient failures, optional hedging past p95, shared retry budget). Every
+attempt runs on the ``gbif`` bulkhead, so GBIF can never hold more than its
+own bounded share of threads. Configure it with the ``GBIF_REQUEST_POLICY``,
+``GBIF_TIMEOUT`` and ``OUTBOUND_BULKHEADS`` settings.
+"""
+
+import os
+from typing import Any, Callable, Optional
+
+import requests
+from django.conf import settings
+
+from outbound.bulkheads import get_bulkhead
+from outbound.policy import RequestPolicy, RetryBudget
+
+_DEFAULT_TIMEOUT = 10.0  # seconds
+_DEFAULT_POLICY = {
+    "max_attempts": 3,
+    "base_delay": 0.1,
+    "max_delay": 1.0,
+    "hedge": True,
+    "hedge_percentile": 95,
+    "budget_ratio": 0.1,
+}
+
+_policy: Optional[RequestPolicy] = None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Connection errors, timeouts, 429s and 5xx responses are transient."""
+    if isinstance(exc, requests.HTTPError):
+        status = getattr(exc.response, "status_code", None)
+        return status is None or status == 429 or status >= 500
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+def get_gbif_policy() -> RequestPolicy:
+    """Return the process-wide GBIF policy, building it from settings once."""
+    global _policy
+
+    if _policy is None:
+        config = {**_DEFAULT_POLICY, **getattr(settings, "GBIF_REQUEST_POLICY", {})}
+        budget_ratio = config.pop("budget_ratio")
+        _policy = RequestPolicy(
+            "gbif",
+            budget=RetryBudget(ratio=budget_ratio),
+            is_retryable=is_retryable,
+            executor=get_bulkhead("gbif"),
+            **config,
+        )
+    return _policy
+
+
+def _forget_inherited_policy() -> None:
+    global _policy
+
+    # The policy holds the parent's bulkhead, whose threads don't survive fork().
+    _policy = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_policy)
+
+
+def call_gbif(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a pygbif function under the GBIF policy with an explicit timeout."""
+    kwargs.setdefault("timeout", getattr(settings, "GBIF_TIMEOUT", _DEFAULT_TIMEOUT))
+    return get_gbif_policy().call(func, *args, **kwargs)
@@ -1,13 +1,48 @@
+from django.core.cache import cache
 from pygbif import species
 
+from . import store
+from .exceptions import GBIFError
+from .cache import get_taxonomy_cache_timeout, taxonomy_cache_key
+from .upstream import call_gbif
+
+_MISSING = object()
+
 
 def unslugify(slug: str) -> str:
     return slug.replace("-", " ").title()
 
 
+def normalize_name(name: str) -> str:
+    """Canonical form of a taxon name used for cache and store keys."""
+    return " ".join(name.split()).lower()
+
+
+def fetch_usage_key(name: str) -> int | None:
+    """
+    Resolve `name` against the GBIF backbone, bypassing caches and the store.
+
+    Raises:
+        GBIFError: If GBIF can't be reached, errors, or the gbif bulkhead is full.
+    """
+    try:
+        result = call_gbif(species.name_backbone, name)
+    except Exception as exc:
+        raise GBIFError("Error accessing GBIF API") from exc
+    if result and result.get("usageKey"):
+        return result["usageKey"]
+    return None
+
+
 def resolve_gbif_id(identifier: str) -> int | None:
     """
     Accepts either a GBIF ID or a slug, and returns the resolved usageKey (GBIF ID).
+
+    Name resolutions (including misses) are read from the cache, then the
+    durable store, and only then from GBIF.
+
+    Raises:
+        GBIFError: If the name has to be resolved by GBIF and that fails.
     """
     if identifier is None:
         raise ValueError("No identifier provided")
@@ -16,8 +51,17 @@ def resolve_gbif_id(identifier: str) -> int | None:
         return int(identifier)
 
     name = unslugify(identifier)
-    result = species.name_backbone(name)
+    normalized = normalize_name(name)
+    cache_key = taxonomy_cache_key("name", normalized)
+    cached = cache.get(cache_key, _MISSING)
+    if cached is not _MISSING:
+        return cached
 
-    if result and result.get("usageKey"):
-        return result["usageKey"]
-    return None
+    found, usage_key = store.get_name_resolution(normalized)
+    if found:
+        cache.set(cache_key, usage_key, get_taxonomy_cache_timeout())
+        return usage_key
+
+    usage_key = fetch_usage_key(name)
+    store.save_name_resolution(normalized, usage_key)
+    return usage_key
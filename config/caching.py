@@ -0,0 +1,35 @@
+"""
+Lifetimes of caches that are kept fresh by invalidation.
+
+Entries like the uid lookup cache (``domain.caches``) or cached list counts
+(``config.counting``) live long because every write deletes them. That only
+holds when all workers share the cache: ``LocMemCache`` is per process, so
+an invalidation never reaches the other gunicorn workers and they keep
+serving the old entry until it expires. On a process-local backend these
+lifetimes are therefore capped at ``LOCAL_CACHE_MAX_TIMEOUT`` seconds;
+configure a shared backend (Redis, Memcached) in ``CACHES`` to get the
+configured lifetimes.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+_DEFAULT_LOCAL_MAX_TIMEOUT = 5  # seconds
+
+
+def is_shared() -> bool:
+    """Whether the default cache is visible to every worker process."""
+    return not isinstance(caches["default"], LocMemCache)
+
+
+def invalidated_timeout(setting: str, default: int) -> int:
+    """
+    Timeout for an invalidated cache entry: the `setting` (or `default`),
+    capped on a process-local cache (see module docstring).
+    """
+    timeout = getattr(settings, setting, default)
+    if is_shared():
+        return timeout
+    local_max = getattr(settings, "LOCAL_CACHE_MAX_TIMEOUT", _DEFAULT_LOCAL_MAX_TIMEOUT)
+    return min(timeout, local_max)
@@ -0,0 +1,93 @@
+"""
+Count strategies for paginated lists.
+
+Most clients never display a total, so paginated endpoints only count when
+asked to, and let the client choose how much that count may cost:
+
+- ``exact``: a ``COUNT(*)`` of the (unordered) queryset;
+- ``cached``: the exact count, cached under a key supplied by the endpoint
+  (e.g. one per user) that the owning app deletes when the rows change;
+  without a key this is ``exact``, and on a process-local cache backend
+  the count is only kept for seconds (see ``config.caching``);
+- ``estimated``: the query planner's row estimate, on PostgreSQL only.
+  Estimates below ``PAGINATION_ESTIMATE_THRESHOLD`` rows, where the planner
+  is least accurate and an exact count is cheap anyway, are replaced with
+  an exact count, as are estimates on other databases.
+"""
+
+import json
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+
+from config import metrics
+from config.caching import invalidated_timeout
+
+NONE = "none"
+EXACT = "exact"
+CACHED = "cached"
+ESTIMATED = "estimated"
+COUNT_MODES = (NONE, EXACT, CACHED, ESTIMATED)
+
+_DEFAULT_CACHE_TIMEOUT = 60 * 10  # 10 minutes
+_DEFAULT_ESTIMATE_THRESHOLD = 10_000
+
+
+def exact_count(queryset: QuerySet) -> int:
+    return queryset.order_by().count()
+
+
+def cached_count(queryset: QuerySet, key: str) -> int:
+    """Return the exact count of `queryset`, cached under `key`."""
+    count = cache.get(key)
+    if count is not None:
+        metrics.increment("pagination.count_cache_hits")
+        return count
+    count = exact_count(queryset)
+    cache.set(
+        key, count, invalidated_timeout("PAGINATION_COUNT_CACHE_TIMEOUT", _DEFAULT_CACHE_TIMEOUT)
+    )
+    return count
+
+
+def estimated_count(queryset: QuerySet) -> int:
+    """Return the planner's row estimate for `queryset` (see module docstring)."""
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        threshold = getattr(
+            settings, "PAGINATION_ESTIMATE_THRESHOLD", _DEFAULT_ESTIMATE_THRESHOLD
+        )
+        if estimate >= threshold:
+            return estimate
+    return exact_count(queryset)
+
+
+def count(queryset: QuerySet, mode: str, *, cache_key: Optional[str] = None) -> Optional[int]:
+    """
+    Count `queryset` with the strategy named by `mode`.
+
+    Returns:
+        The count, or None for ``none``.
+
+    Raises:
+        ValueError: If `mode` is not one of ``COUNT_MODES``.
+    """
+    if mode == NONE:
+        return None
+    if mode == EXACT or (mode == CACHED and cache_key is None):
+        return exact_count(queryset)
+    if mode == CACHED:
+        return cached_count(queryset, cache_key)
+    if mode == ESTIMATED:
+        return estimated_count(queryset)
+    raise ValueError(f"Unknown count mode: {mode}")
@@ -0,0 +1,62 @@
+"""
+Process-local operational metrics.
+
+Counters are incremented by the code paths they describe (e.g. stale GBIF
+serves); gauges are callables registered once and sampled on demand (e.g.
+bulkhead queue depth). ``snapshot()`` returns both for the staff-only
+``/app/api/metrics/`` endpoint and for logs.
+
+Metrics are per worker process; aggregate them in whatever scrapes the
+endpoint.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict
+
+_lock = threading.Lock()
+_counters: Counter = Counter()
+_gauges: Dict[str, Callable[[], Any]] = {}
+
+
+def _metric_name(name: str, labels: Dict[str, Any]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+def increment(name: str, value: int = 1, **labels: Any) -> None:
+    """Add `value` to the counter `name` with the given labels."""
+    key = _metric_name(name, labels)
+    with _lock:
+        _counters[key] += value
+
+
+def get_count(name: str, **labels: Any) -> int:
+    """Return the current value of a counter (0 if never incremented)."""
+    with _lock:
+        return _counters[_metric_name(name, labels)]
+
+
+def register_gauge(name: str, func: Callable[[], Any], **labels: Any) -> None:
+    """Register a callable sampled on every ``snapshot()``."""
+    with _lock:
+        _gauges[_metric_name(name, labels)] = func
+
+
+def snapshot() -> Dict[str, Any]:
+    """Return all counters and freshly sampled gauges."""
+    with _lock:
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+    return {
+        "counters": counters,
+        "gauges": {name: func() for name, func in gauges.items()},
+    }
+
+
+def reset() -> None:
+    """Clear all counters (gauges stay registered). Intended for tests."""
+    with _lock:
+        _counters.clear()
@@ -0,0 +1,213 @@
+"""
+Negotiated response compression.
+
+``CompressionMiddleware`` compresses responses with the best encoding the
+client accepts (``Accept-Encoding``, honouring q-values) among those
+available in this process, in server preference order:
+
+- ``zstd`` (``compression.zstd`` on Python 3.14+, otherwise the
+  ``zstandard`` package),
+- ``br`` (the ``Brotli`` package),
+- ``gzip`` (always available).
+
+``Brotli`` and ``zstandard`` are pinned in requirements.txt; an environment
+without them falls back to the encodings it has.
+
+Only responses worth compressing are touched: non-streaming (SSE must not be
+buffered), not already encoded, at least ``COMPRESSION_MIN_SIZE`` bytes, of
+a content type in ``COMPRESSION_CONTENT_TYPES`` and not under
+``COMPRESSION_EXEMPT_PATHS`` (the health check). Small responses skip the
+CPU cost entirely.
+
+Compressed bodies are kept in a process-local LRU keyed by encoding and a
+digest of the body (at most ``COMPRESSION_CACHE_MAX_BYTES`` of compressed
+output), so identical payloads, e.g. GBIF details served from the GBIF
+cache, are compressed once. Hashing is far cheaper than compressing.
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from config import metrics
+
+_DEFAULT_MIN_SIZE = 1024
+_DEFAULT_CONTENT_TYPES = (
+    "application/json",
+    "text/",
+    "application/javascript",
+    "image/svg+xml",
+)
+_DEFAULT_EXEMPT_PATHS = ("/app/api/health/",)
+_DEFAULT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Levels tuned for dynamic responses: most of the size win, little CPU.
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+_ZSTD_LEVEL = 3
+
+
+def _codecs() -> Dict[str, Callable[[bytes], bytes]]:
+    codecs: Dict[str, Callable[[bytes], bytes]] = {}
+    try:
+        from compression import zstd  # Python 3.14+
+
+        codecs["zstd"] = lambda data: zstd.compress(data, level=_ZSTD_LEVEL)
+    except ImportError:
+        try:
+            import zstandard
+
+            compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+            codecs["zstd"] = compressor.compress
+        except ImportError:
+            pass
+    try:
+        import brotli
+
+        codecs["br"] = lambda data: brotli.compress(data, quality=_BROTLI_QUALITY)
+    except ImportError:
+        pass
+    # mtime=0 keeps output deterministic for identical bodies.
+    codecs["gzip"] = lambda data: gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+    return codecs
+
+
+CODECS = _codecs()
+
+
+def negotiate(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """
+    Pick an encoding from an ``Accept-Encoding`` header.
+
+    Args:
+        accept_encoding: The raw header value.
+        available: Encodings we can produce, most preferred first.
+
+    Returns:
+        The first available encoding the client accepts with q > 0, or None.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    wildcard = weights.get("*", 0.0)
+    for encoding in available:
+        if weights.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class _CompressedCache:
+    """Thread-safe LRU of compressed bodies, bounded by total size."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._size = 0
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: Tuple[str, bytes], body: bytes, max_bytes: int) -> None:
+        if len(body) > max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def size(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_cache = _CompressedCache()
+metrics.register_gauge("compression.cache_bytes", _cache.size)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress `body` with `encoding`, reusing an identical earlier result."""
+    key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+    compressed = _cache.get(key)
+    if compressed is not None:
+        metrics.increment("compression.cache_hits")
+        return compressed
+    compressed = CODECS[encoding](body)
+    _cache.put(
+        key,
+        compressed,
+        getattr(settings, "COMPRESSION_CACHE_MAX_BYTES", _DEFAULT_CACHE_MAX_BYTES),
+    )
+    return compressed
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if request.path.startswith(
+            tuple(getattr(settings, "COMPRESSION_EXEMPT_PATHS", _DEFAULT_EXEMPT_PATHS))
+        ):
+            return response
+        content_type = response.get("Content-Type", "").lower()
+        if not content_type.startswith(
+            tuple(getattr(settings, "COMPRESSION_CONTENT_TYPES", _DEFAULT_CONTENT_TYPES))
+        ):
+            return response
+        body = response.content
+        if len(body) < getattr(settings, "COMPRESSION_MIN_SIZE", _DEFAULT_MIN_SIZE):
+            return response
+
+        # The body now depends on Accept-Encoding, whatever this client sent.
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""), CODECS)
+        if encoding is None:
+            return response
+
+        compressed = compress(body, encoding)
+        if len(compressed) >= len(body):
+            return response
+
+        metrics.increment("compression.responses", encoding=encoding)
+        metrics.increment("compression.bytes_saved", len(body) - len(compressed))
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        # A strong ETag would claim byte equality with the identity body.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
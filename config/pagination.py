@@ -0,0 +1,170 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+``LimitOffsetPagination`` runs a ``COUNT(*)`` on every page and an
+``OFFSET`` scan whose cost grows with page depth. ``KeysetPagination``
+orders by a unique key (e.g. ``("-created_at", "-id")``) and continues
+after the last row of the previous page with a range condition that a
+composite index can seek to, so page 1000 costs the same as page 1.
+
+Cursors are opaque: URL-safe base64 of the last row's key values. The
+total count is only computed when the client asks for it with
+``count_mode`` (``exact``, ``cached`` or ``estimated``; see
+``config.counting``), ``with_count=true`` being kept as ``exact``. Endpoints
+enable ``cached`` by passing a ``count_key(request)`` function naming the
+cache entry.
+
+Views may return a ``Projection`` (a ``values()`` queryset plus a row
+mapper) instead of a queryset; only the rows of the returned page are
+mapped.
+"""
+
+import base64
+import binascii
+import json
+from math import inf
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Literal, Optional, Sequence, TypeVar
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest
+from ninja import Field, Schema
+from ninja.conf import settings as ninja_settings
+from ninja.errors import HttpError
+from ninja.pagination import PaginationBase
+
+from config import counting
+
+T = TypeVar("T")
+
+
+class KeysetPaginatedResponseSchema(Schema, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    count: Optional[int] = None
+
+
+@dataclass
+class Projection:
+    """A ``values()`` queryset and the function turning each row into an item."""
+
+    queryset: QuerySet
+    mapper: Callable[[Dict[str, Any]], Any]
+
+
+class KeysetPagination(PaginationBase):
+    """
+    Paginate on `ordering`, a sequence of fields that together are unique
+    and sort in the same direction (all ascending or all descending).
+    """
+
+    class Input(Schema):
+        limit: int = Field(
+            ninja_settings.PAGINATION_PER_PAGE,
+            ge=1,
+            le=(
+                ninja_settings.PAGINATION_MAX_LIMIT
+                if ninja_settings.PAGINATION_MAX_LIMIT != inf
+                else None
+            ),
+        )
+        cursor: Optional[str] = None
+        count_mode: Literal[counting.COUNT_MODES] = counting.NONE
+        with_count: bool = False
+
+    Output = KeysetPaginatedResponseSchema
+
+    def __init__(
+        self,
+        *,
+        ordering: Sequence[str] = ("-created_at", "-id"),
+        count_key: Optional[Callable[[HttpRequest], str]] = None,
+        **kwargs: Any,
+    ):
+        descending = {field.startswith("-") for field in ordering}
+        if len(descending) != 1:
+            raise ValueError("Keyset ordering fields must share one direction")
+        self.ordering = tuple(ordering)
+        self.descending = descending.pop()
+        self.fields = [field.lstrip("-") for field in ordering]
+        self.count_key = count_key
+        super().__init__(**kwargs)
+
+    def paginate_queryset(
+        self, queryset: Any, pagination: Input, request: HttpRequest, **params: Any
+    ) -> Any:
+        mapper = None
+        if isinstance(queryset, Projection):
+            queryset, mapper = queryset.queryset, queryset.mapper
+
+        page = queryset.order_by(*self.ordering)
+        if pagination.cursor:
+            page = page.filter(self._after(queryset, self._decode(pagination.cursor)))
+
+        # One extra row tells whether there is a next page without counting.
+        rows = list(page[: pagination.limit + 1])
+        items = rows[: pagination.limit]
+        next_cursor = None
+        if len(rows) > pagination.limit:
+            last = items[-1]
+            if isinstance(last, dict):
+                next_cursor = self._encode([last[f] for f in self.fields])
+            else:
+                next_cursor = self._encode([getattr(last, f) for f in self.fields])
+
+        return {
+            "items": [mapper(row) for row in items] if mapper else items,
+            "next_cursor": next_cursor,
+            "count": self._count(queryset, pagination, request),
+        }
+
+    def _count(self, queryset: QuerySet, pagination: Input, request: HttpRequest) -> Optional[int]:
+        mode = pagination.count_mode
+        if mode == counting.NONE and pagination.with_count:
+            mode = counting.EXACT
+        cache_key = None
+        if mode == counting.CACHED and self.count_key is not None:
+            cache_key = self.count_key(request)
+        return counting.count(queryset, mode, cache_key=cache_key)
+
+    def _after(self, queryset: QuerySet, values: List[Any]) -> Q:
+        # (a, b) > (x, y)  ==  a >= x AND (a > x OR b > y), generalised to n
+        # fields. The leading bound lets the index seek straight to the page.
+        op = "lt" if self.descending else "gt"
+        model = queryset.model
+        try:
+            values = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (TypeError, ValidationError):
+            # Decodable, but not values of the cursor fields' types.
+            raise HttpError(400, "Invalid cursor")
+        condition = Q()
+        for i in reversed(range(len(self.fields))):
+            strictly = Q(**{f"{self.fields[i]}__{op}": values[i]})
+            if condition:
+                strictly |= Q(**{self.fields[i]: values[i]}) & condition
+            condition = strictly
+        return Q(**{f"{self.fields[0]}__{op}e": values[0]}) & condition
+
+    def _encode(self, values: List[Any]) -> str:
+        raw = json.dumps(
+            [v.isoformat() if hasattr(v, "isoformat") else v for v in values],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def _decode(self, cursor: str) -> List[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+        except (binascii.Error, ValueError):
+            raise HttpError(400, "Invalid cursor")
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise HttpError(400, "Invalid cursor")
+        # Cursors only ever hold non-null scalars; None can't be compared.
+        if any(v is None or isinstance(v, (list, dict)) for v in values):
+            raise HttpError(400, "Invalid cursor")
+        return values
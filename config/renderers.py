@@ -0,0 +1,62 @@
+"""
+orjson-based renderer and parser for the API.
+
+ninja's default ``JSONRenderer`` runs every response through the stdlib
+``json`` module with ``NinjaJSONEncoder``, calling back into Python for
+each UUID and datetime. ``ORJSONRenderer`` encodes in C and only falls
+back to Python for types orjson leaves to ``default``.
+
+Responses decode to the same values as before:
+
+- datetimes, dates and times are passed through to ``NinjaJSONEncoder``
+  (``OPT_PASSTHROUGH_DATETIME``), keeping Django's millisecond precision
+  and ``Z`` suffix rather than orjson's microsecond RFC 3339 output;
+- Decimal, lazy translation strings, pydantic models, URLs and IP addresses
+  also go through ``NinjaJSONEncoder.default``;
+- non-string dict keys (e.g. the integer-keyed identification suggestions)
+  are stringified like ``json.dumps`` does (``OPT_NON_STR_KEYS``).
+
+Only the bytes differ: the output is compact and UTF-8 rather than
+ASCII-escaped with ``", "`` separators.
+"""
+
+from datetime import datetime
+from typing import Any
+
+import orjson
+from django.http import HttpRequest
+from ninja.parser import Parser
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+from ninja.types import DictStrAny
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Stateless; one instance serves every response.
+_encoder_default = NinjaJSONEncoder().default
+
+
+def _default(o: Any) -> Any:
+    # Aware datetimes are by far the most common fallback (several per list
+    # item); format them inline exactly as DjangoJSONEncoder does, skipping
+    # NinjaJSONEncoder's isinstance chain.
+    if type(o) is datetime:
+        r = o.isoformat()
+        if o.microsecond:
+            r = r[:23] + r[26:]
+        if r.endswith("+00:00"):
+            r = r[:-6] + "Z"
+        return r
+    return _encoder_default(o)
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> bytes:
+        return orjson.dumps(data, default=_default, option=_OPTIONS)
+
+
+class ORJSONParser(Parser):
+    def parse_body(self, request: HttpRequest) -> DictStrAny:
+        return orjson.loads(request.body)
@@ -64,6 +64,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "config.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -71,6 +72,19 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Response compression (see config/middleware.py): zstd/br/gzip negotiated
+# from Accept-Encoding for compressible responses of at least
+# COMPRESSION_MIN_SIZE bytes.
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+COMPRESSION_CONTENT_TYPES = (
+    "application/json",
+    "text/",
+    "application/javascript",
+    "image/svg+xml",
+)
+COMPRESSION_EXEMPT_PATHS = ("/app/api/health/",)
+COMPRESSION_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
 AUTHENTICATION_BACKENDS = [
     "config.auth.JWTAuthenticationBackend",
     "django.contrib.auth.backends.ModelBackend",
@@ -156,6 +170,96 @@ CACHES = {
         "LOCATION": "digidex-app-cache",
     }
 }
+# LocMemCache is per process, so invalidations don't reach other workers:
+# caches kept fresh by invalidation (NFC_UID_CACHE_TIMEOUT,
+# PAGINATION_COUNT_CACHE_TIMEOUT) are capped at LOCAL_CACHE_MAX_TIMEOUT
+# seconds unless a shared backend (Redis, Memcached) is configured above.
+LOCAL_CACHE_MAX_TIMEOUT = int(os.environ.get("LOCAL_CACHE_MAX_TIMEOUT", 5))
+
+
+# GBIF
+# Backbone-derived data (taxon details, name resolutions, searches) is cached
+# until GBIF publishes a new backbone release; see botany/cache.py.
+GBIF_TAXONOMY_CACHE_TIMEOUT = int(
+    os.environ.get("GBIF_TAXONOMY_CACHE_TIMEOUT", 60 * 60 * 24 * 14)
+)
+GBIF_BACKBONE_VERSION_CHECK_INTERVAL = int(
+    os.environ.get("GBIF_BACKBONE_VERSION_CHECK_INTERVAL", 60 * 60 * 6)
+)
+# Outbound GBIF calls: per-request timeout (seconds) and retry/hedging policy
+# (see botany/upstream.py and outbound/policy.py).
+GBIF_TIMEOUT = float(os.environ.get("GBIF_TIMEOUT", 10))
+GBIF_REQUEST_POLICY = {
+    "max_attempts": 3,
+    "base_delay": 0.1,
+    "max_delay": 1.0,
+    "hedge": True,
+    "hedge_percentile": 95,
+    "budget_ratio": 0.1,
+}
+# Bulkheads for outbound calls (see outbound/bulkheads.py): each upstream
+# gets its own bounded pool so a slow one can't starve the others.
+OUTBOUND_BULKHEADS = {
+    "gbif": {"max_concurrent": 8, "max_queued": 16, "queue_timeout": 2.0},
+    "kindwise": {"max_concurrent": 4, "max_queued": 8, "queue_timeout": 5.0},
+}
+# How long last-known-good GBIF responses are kept for stale-on-error serving.
+GBIF_STALE_CACHE_TIMEOUT = int(
+    os.environ.get("GBIF_STALE_CACHE_TIMEOUT", 60 * 60 * 24 * 60)
+)
+# Age after which rows in the durable GBIF store are re-fetched by the
+# refresh_gbif_store management command (run it from cron / a scheduler).
+GBIF_STORE_REFRESH_AFTER = int(
+    os.environ.get("GBIF_STORE_REFRESH_AFTER", 60 * 60 * 24 * 30)
+)
+# Back-off before a row whose refresh failed is tried again.
+GBIF_STORE_RETRY_AFTER = int(os.environ.get("GBIF_STORE_RETRY_AFTER", 60 * 60 * 24))
+
+
+# Kindwise (plant.id) identification; see botany/kindwise.py.
+KINDWISE_API_KEY = os.environ.get("KINDWISE_API_KEY")
+KINDWISE_TIMEOUT = {
+    "connect": float(os.environ.get("KINDWISE_CONNECT_TIMEOUT", 5)),
+    "read": float(os.environ.get("KINDWISE_READ_TIMEOUT", 30)),
+}
+KINDWISE_POOL = {"max_connections": 8, "max_keepalive_connections": 4}
+# Images are downsampled and re-encoded before upload; see botany/imaging.py.
+IMAGE_MAX_EDGE = int(os.environ.get("IMAGE_MAX_EDGE", 1500))
+IMAGE_QUALITY = int(os.environ.get("IMAGE_QUALITY", 85))
+IMAGE_PREPROCESS_WORKERS = int(os.environ.get("IMAGE_PREPROCESS_WORKERS", 2))
+# Identification results are cached by image content and rounded coordinates;
+# see botany/identification_cache.py.
+IDENTIFICATION_CACHE_TIMEOUT = int(
+    os.environ.get("IDENTIFICATION_CACHE_TIMEOUT", 60 * 60 * 24 * 30)
+)
+IDENTIFICATION_CACHE_MAX_ENTRIES = int(
+    os.environ.get("IDENTIFICATION_CACHE_MAX_ENTRIES", 10_000)
+)
+IDENTIFICATION_COORDINATE_PRECISION = 3
+# Asynchronous identification jobs; see botany/jobs.py.
+IDENTIFICATION_JOB_WORKERS = int(os.environ.get("IDENTIFICATION_JOB_WORKERS", 4))
+IDENTIFICATION_JOBS_PER_USER = int(os.environ.get("IDENTIFICATION_JOBS_PER_USER", 2))
+IDENTIFICATION_JOB_STALE_AFTER = 60 * 5
+# Seconds /identify/jobs/{uuid}/events keeps streaming. Each open stream
+# holds a worker thread, so keep 0 (one snapshot, then clients poll) unless
+# gunicorn runs threaded or async workers, e.g. `-k gthread --threads 8`.
+IDENTIFICATION_EVENTS_TIMEOUT = int(os.environ.get("IDENTIFICATION_EVENTS_TIMEOUT", 0))
+
+
+# NFC scan event log (see domain/scanlog.py): events are buffered and written
+# every SCAN_LOG_BATCH_SIZE events or SCAN_LOG_FLUSH_INTERVAL milliseconds.
+SCAN_LOG_BATCH_SIZE = int(os.environ.get("SCAN_LOG_BATCH_SIZE", 100))
+SCAN_LOG_FLUSH_INTERVAL = int(os.environ.get("SCAN_LOG_FLUSH_INTERVAL", 500))
+SCAN_LOG_MAX_BUFFER = 10_000
+# uid -> tag lookup cache in front of scan resolution (see domain/caches.py).
+NFC_UID_CACHE_TIMEOUT = int(os.environ.get("NFC_UID_CACHE_TIMEOUT", 60 * 60))
+# UIDs checked and inserted per batch when importing factory reels
+# (see domain/provisioning.py).
+NFC_PROVISION_BATCH_SIZE = int(os.environ.get("NFC_PROVISION_BATCH_SIZE", 1000))
+# Paginated list totals (see config/counting.py): lifetime of cached counts,
+# and the planner estimate below which an exact count is run instead.
+PAGINATION_COUNT_CACHE_TIMEOUT = int(os.environ.get("PAGINATION_COUNT_CACHE_TIMEOUT", 60 * 10))
+PAGINATION_ESTIMATE_THRESHOLD = int(os.environ.get("PAGINATION_ESTIMATE_THRESHOLD", 10_000))
 
 
 # JWT Authentication (token validation from ID service)
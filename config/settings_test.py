@@ -33,6 +33,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "config.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -76,6 +77,16 @@ CACHES = {
     }
 }
 
+# GBIF — never query the registry for the backbone version during tests.
+GBIF_BACKBONE_VERSION_CHECK_INTERVAL: int | None = None
+
+# Image preprocessing runs inline unless a test opts into the process pool.
+IMAGE_PREPROCESS_WORKERS = 0
+
+# Scan events are flushed explicitly; no background writer thread, which
+# could not see the test transaction anyway.
+SCAN_LOG_FLUSH_INTERVAL: int | None = None
+
 # JWT settings — load the ID service public key for test token validation.
 # The key pair lives in id/backend/config/keys/ (repo root is 4 levels above this file:
 # config/settings_test.py → config/ → backend/ → app/ → repo root).
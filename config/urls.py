@@ -10,9 +10,13 @@ See: https://docs.djangoproject.com/en/6.0/topics/http/urls/
 
 from django.contrib import admin
 from django.urls import path, include
+from ninja.errors import HttpError
 from ninja_extra import NinjaExtraAPI
 
-from botany.api import GBIFController
+from botany.api import GBIFController, IdentificationController
+from config import metrics
+from config.auth import JWTAuthenticationBackend
+from config.renderers import ORJSONParser, ORJSONRenderer
 from domain.api import DomainController
 
 api = NinjaExtraAPI(
@@ -20,8 +24,10 @@ api = NinjaExtraAPI(
     version="1.0.0",
     description="REST API for NFC tag management and botanical data.",
     urls_namespace="app_api",
+    renderer=ORJSONRenderer(),
+    parser=ORJSONParser(),
 )
-api.register_controllers(DomainController, GBIFController)
+api.register_controllers(DomainController, GBIFController, IdentificationController)
 
 
 @api.get("/health/", auth=None, tags=["Health"])
@@ -30,6 +36,19 @@ def health_check(request):
     return {"status": "ok", "service": "app-backend"}
 
 
+@api.get(
+    "/metrics/",
+    auth=JWTAuthenticationBackend(),
+    tags=["Health"],
+    include_in_schema=False,
+)
+def metrics_snapshot(request):
+    """Process-local operational counters and gauges (staff only)."""
+    if not getattr(request.auth, "is_staff", False):
+        raise HttpError(403, "Staff access required")
+    return metrics.snapshot()
+
+
 urlpatterns = [
     path("app/admin/", admin.site.urls),
     path("app/api/", api.urls),
@@ -14,3 +14,23 @@ def api_client():
     from django.test import Client
 
     return Client()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached upstream data can't leak."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_scan_log():
+    """Drop scan events a test buffered but didn't flush."""
+    from domain import scanlog
+
+    scanlog.reset()
+    yield
+    scanlog.reset()
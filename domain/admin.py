@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+from .models import PlantLabel, ScanEvent
+
+
+@admin.register(PlantLabel)
+class PlantLabelAdmin(admin.ModelAdmin):
+    # Edits go through save()/delete(), whose signals invalidate the scan
+    # lookup cache (domain.caches).
+    list_display = ("uid", "title", "user", "plant", "active", "created_at")
+    list_filter = ("active",)
+    search_fields = ("uid", "title")
+    raw_id_fields = ("plant",)
+
+
+@admin.register(ScanEvent)
+class ScanEventAdmin(admin.ModelAdmin):
+    list_display = ("tag", "user", "counter", "replayed", "scanned_at")
+    list_filter = ("replayed",)
+    raw_id_fields = ("tag", "user")
@@ -1,10 +1,13 @@
 import uuid as uuid_module
-from django.core.exceptions import ValidationError
+
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.shortcuts import get_object_or_404
+from ninja import File
 from ninja.errors import HttpError
+from ninja.files import UploadedFile
 
-from botany.models import Plant
 from config.auth import JWTAuthenticationBackend
+from config.pagination import KeysetPaginatedResponseSchema, KeysetPagination
 from ninja_extra import (
     api_controller,
     ControllerBase,
@@ -13,29 +16,42 @@ from ninja_extra import (
     http_post,
     http_put,
 )
-from ninja_extra.pagination import (
-    LimitOffsetPagination,
-    NinjaPaginationResponseSchema,
-    paginate,
-)
+from ninja_extra.pagination import paginate
 from ninja_extra.permissions import IsAuthenticated
 
 from nfctags import get_nfctag_model
-from .models import PlantLabel
+from nfctags.validators import canonical_uid
+from . import scanlog
+from .binding import bind_plant, bind_plants, unbind_plant
+from .caches import tag_count_key
+from .projections import FULL_FIELDS, project_tags
+from .provisioning import iter_uid_lines, provision_tags
 from .schema import (
     BindPlantRequest,
+    BulkBindOut,
+    BulkBindRequest,
     NFCTagOut,
     NFCTagRegisterIn,
+    NFCTagScanBatchIn,
+    NFCTagScanBatchOut,
     NFCTagScanIn,
     NFCTagUpdateIn,
+    PlantLabelListItem,
     PlantLabelOut,
+    ProvisionOut,
 )
-from .selectors import get_nfctag_by_scan, get_nfctags_for, get_nfctags_visible_for
-from .services import NFCTagService
+from .selectors import get_nfctags_for, resolve_scan, resolve_scans
+from .services import UNAVAILABLE, NFCTagService
 
 
 NFCTag = get_nfctag_model()
 
+TAG_LIST_ORDERING = ("-created_at", "-id")
+
+
+def _tag_count_key(request):
+    return tag_count_key(request.user.pk)
+
 
 @api_controller(
     "/nfctags",
@@ -50,30 +66,43 @@ class DomainController(ControllerBase):
     - Mutations go through NFCTagService
     """
 
-    @http_get("", response=NinjaPaginationResponseSchema[PlantLabelOut])
-    @paginate(LimitOffsetPagination)
-    def list_tags(self, include: str = ""):
-        """List the authenticated user's NFC tags.
+    @http_get("", response=KeysetPaginatedResponseSchema[PlantLabelListItem])
+    @paginate(KeysetPagination, ordering=TAG_LIST_ORDERING, count_key=_tag_count_key)
+    def list_tags(self, include: str = "", fields: str = ""):
+        """List the authenticated user's NFC tags, newest first.
+
+        Keyset-paginated on ``(created_at, id)``: pass the previous page's
+        ``next_cursor`` as ``cursor``. No total is counted unless asked for
+        with ``count_mode``: ``exact``, ``cached`` (per user, invalidated on
+        tag changes) or ``estimated`` (planner estimate for large lists).
+        Rows are read with one ``values()`` query (plant joined) and mapped
+        straight to ``PlantLabelOut``-shaped dicts.
 
         Args:
-            include: Comma-separated optional expansions (e.g., ``plant``).
-                     When ``plant`` is included, plant details are fetched via
-                     ``select_related`` to avoid N+1 queries.
+            include: Kept for compatibility; plant details are always
+                     included and always fetched in the same query.
+            fields: Optional sparse fieldset, e.g. ``uuid,plant.name``. Items
+                    then hold only these keys, and only their columns are
+                    queried.
 
         Returns:
-            Paginated list of PlantLabelOut objects.
+            Page of PlantLabelOut-shaped items with ``next_cursor``.
         """
         user = self.context.request.user
-        qs = get_nfctags_for(fetched_by=user).order_by("-uuid")
-        if "plant" in include:
-            qs = qs.select_related("plant")
-        return qs
+        try:
+            return project_tags(
+                get_nfctags_for(fetched_by=user),
+                fields or FULL_FIELDS,
+                keys=tuple(f.lstrip("-") for f in TAG_LIST_ORDERING),
+            )
+        except ValueError as e:
+            raise HttpError(400, str(e))
 
     @http_get("/{uuid:nfctag_uuid}", response=PlantLabelOut)
     def retrieve(self, nfctag_uuid):
         """Retrieve a single NFC tag by UUID."""
         user = self.context.request.user
-        qs = get_nfctags_for(fetched_by=user).select_related("plant")
+        qs = get_nfctags_for(fetched_by=user, select_related=["plant"])
         return get_object_or_404(qs, uuid=nfctag_uuid)
 
     @http_post("/scan", response={200: NFCTagOut, 404: dict})
@@ -82,15 +111,54 @@ class DomainController(ControllerBase):
         Resolve a tag from the ASCII mirror (UID+counter).
         """
         user = self.context.request.user
-        tag = get_nfctag_by_scan(ascii_mirror=payload.ascii_mirror, user=user)
-        if not tag:
+        # Served from the uid lookup cache; one indexed query on a miss.
+        entry = resolve_scan(ascii_mirror=payload.ascii_mirror, user=user)
+        if not entry:
             return 404, {"detail": "Tag not found"}
 
-        visible_ids = set(get_nfctags_visible_for(user=user))
-        if tag.id not in visible_ids:
-            return 404, {"detail": "Tag not found"}
+        # Buffered; written in batches off the request path.
+        scanlog.record_scan(tag_id=entry["id"], user_id=user.pk, counter=entry["counter"])
+        return {"uuid": entry["uuid"]}
 
-        return tag
+    @http_post("/scan/batch", response=NFCTagScanBatchOut)
+    def scan_batch(self, payload: NFCTagScanBatchIn):
+        """
+        Resolve a sweep of ASCII mirrors in one request.
+
+        Results follow the request order; mirrors that are invalid or don't
+        resolve to an active tag of the user come back with ``found: false``.
+        """
+        user = self.context.request.user
+        entries = resolve_scans(ascii_mirrors=payload.ascii_mirrors, user=user)
+
+        results = []
+        scans = []
+        for ascii_mirror, entry in zip(payload.ascii_mirrors, entries):
+            if entry is None:
+                results.append({"ascii_mirror": ascii_mirror, "found": False})
+                continue
+            scans.append({"tag_id": entry["id"], "user_id": user.pk, "counter": entry["counter"]})
+            results.append(
+                {
+                    "ascii_mirror": ascii_mirror,
+                    "found": True,
+                    "uuid": entry["uuid"],
+                    "plant_id": entry["plant_uuid"],
+                }
+            )
+        # One buffered append for the whole sweep.
+        scanlog.record_scans(scans)
+        return {"results": results}
+
+    @http_post("/provision", response={200: ProvisionOut, 403: dict})
+    def provision(self, file: UploadedFile = File(...)):
+        """
+        Import a manufacturer UID file (one UID per line) as unowned tags.
+        Staff only; the upload is streamed line by line, not read whole.
+        """
+        if not getattr(self.context.request.auth, "is_staff", False):
+            return 403, {"detail": "Staff access required"}
+        return 200, provision_tags(iter_uid_lines(file))
 
     @http_post("/register", response={201: NFCTagOut, 200: NFCTagOut, 409: dict})
     def register(self, payload: NFCTagRegisterIn):
@@ -103,17 +171,17 @@ class DomainController(ControllerBase):
         user = self.context.request.user
         service = NFCTagService(user=user)
 
-        tag = NFCTag.objects.filter(uid=payload.uid).first()
-        if tag is None:
-            tag = service.create_tag(uid=payload.uid)
-            return 201, tag
-
+        # Scans and provisioning store UIDs upper-cased.
+        uid = canonical_uid(payload.uid)
+        tag = NFCTag.objects.filter(uid=uid).first()
         try:
-            if getattr(tag, "is_available_to_register", False):
-                tag = service.register_user(tag=tag)
-                return 200, tag
-            return 409, {"detail": "This tag is already registered to another account."}
+            if tag is None:
+                return 201, service.create_tag(uid=uid)
+            return 200, service.register_user(tag=tag)
         except ValidationError as e:
+            # The guarded write lost: the tag is (or just became) taken.
+            if getattr(e, "code", None) == UNAVAILABLE:
+                return 409, {"detail": "This tag is already registered to another account."}
             raise HttpError(400, str(e))
 
     @http_put("/{uuid:nfctag_uuid}", response=NFCTagOut)
@@ -141,6 +209,32 @@ class DomainController(ControllerBase):
     # NFC Tag ↔ Plant binding endpoints
     # ------------------------------------------------------------------
 
+    @http_post("/bind/batch", response=BulkBindOut)
+    def bind_plants(self, payload: BulkBindRequest):
+        """Bind many NFC tags to the requesting user's plants at once.
+
+        All bindings are applied in one transaction with a fixed number of
+        queries, or none are.
+
+        Returns:
+            The bound tags as PlantLabelOut, in request order.
+
+        Raises:
+            400: A tag appears more than once.
+            404: Any tag or plant is not found or not owned by the user.
+        """
+        user = self.context.request.user
+        try:
+            tags = bind_plants(
+                user=user,
+                bindings=[(pair.tag_id, pair.plant_id) for pair in payload.bindings],
+            )
+        except ValueError as e:
+            raise HttpError(400, str(e))
+        except ObjectDoesNotExist as e:
+            raise HttpError(404, str(e))
+        return {"items": tags}
+
     @http_post("/{uuid:nfctag_uuid}/bind", response=PlantLabelOut)
     def bind_plant(self, nfctag_uuid: uuid_module.UUID, payload: BindPlantRequest):
         """Bind an NFC tag to a plant owned by the requesting user.
@@ -156,17 +250,10 @@ class DomainController(ControllerBase):
             404: Tag not found, not owned by user, or plant not owned by user.
         """
         user = self.context.request.user
-        tag = get_object_or_404(PlantLabel, uuid=nfctag_uuid, user=user)
-        plant = get_object_or_404(Plant, uuid=payload.plant_id, user=user)
-
-        tag.plant = plant
-        tag.save(update_fields=["plant_id", "updated_at"])
-
-        # Reload with select_related so the plant object is pre-fetched and
-        # the serializer can access all plant fields without an extra query.
-        tag = PlantLabel.objects.select_related("plant").get(pk=tag.pk)
-
-        return tag
+        try:
+            return bind_plant(user=user, tag_uuid=nfctag_uuid, plant_uuid=payload.plant_id)
+        except ObjectDoesNotExist as e:
+            raise HttpError(404, str(e))
 
     @http_post("/{uuid:nfctag_uuid}/unbind", response=PlantLabelOut)
     def unbind_plant(self, nfctag_uuid: uuid_module.UUID):
@@ -182,16 +269,10 @@ class DomainController(ControllerBase):
             404: Tag not found or not owned by user.
         """
         user = self.context.request.user
-        tag = get_object_or_404(PlantLabel, uuid=nfctag_uuid, user=user)
-
-        tag.plant = None
-        tag.save(update_fields=["plant_id", "updated_at"])
-
-        # Reload with select_related for a consistent fetch pattern.
-        # plant will be None here since we just cleared it.
-        tag = PlantLabel.objects.select_related("plant").get(pk=tag.pk)
-
-        return tag
+        try:
+            return unbind_plant(user=user, tag_uuid=nfctag_uuid)
+        except ObjectDoesNotExist as e:
+            raise HttpError(404, str(e))
 
     @http_post("/{uuid:nfctag_uuid}/disconnect", response={200: NFCTagOut, 400: dict})
     def disconnect(self, nfctag_uuid):
@@ -207,15 +288,19 @@ class DomainController(ControllerBase):
         except ValidationError as e:
             return 400, {"detail": str(e)}
 
-    @http_post("/{uuid:nfctag_uuid}/deactivate", response=NFCTagOut)
+    @http_post("/{uuid:nfctag_uuid}/deactivate", response={200: NFCTagOut, 409: dict})
     def deactivate(self, nfctag_uuid):
         """
-        Sets active=False via the service.
+        Sets active=False via the service; 409 if a concurrent change got
+        there first.
         """
         user = self.context.request.user
         tag = get_object_or_404(get_nfctags_for(fetched_by=user), uuid=nfctag_uuid)
         service = NFCTagService(user=user)
-        return service.deactivate_tag(tag)
+        try:
+            return 200, service.deactivate_tag(tag)
+        except ValidationError as e:
+            return 409, {"detail": str(e)}
 
     @http_delete("/{uuid:nfctag_uuid}", response={200: dict, 400: dict})
     def delete(self, nfctag_uuid):
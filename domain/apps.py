@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class DomainConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "domain"
+
+    def ready(self):
+        from .caches import connect_signals
+
+        connect_signals()
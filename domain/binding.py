@@ -0,0 +1,146 @@
+"""
+Binding NFC labels to plants.
+
+A binding is written with one conditional ``UPDATE``: it only matches a
+label owned by the user, and only while the plant is owned by the user
+(an ``EXISTS`` in the same statement), so ownership can't change between
+the check and the write. Responses are built from the rows read before the
+update; nothing is fetched again afterwards.
+
+``QuerySet.update`` bypasses model signals, so every function here
+invalidates the uid lookup cache itself. Binding never changes who owns a
+label, so tag counts are unaffected.
+"""
+
+from typing import List, Sequence, Tuple
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db import transaction
+from django.db.models import Case, Exists, Subquery, When
+from django.utils import timezone
+
+from botany.models import Plant
+from .caches import invalidate_uids
+from .models import PlantLabel
+
+# Label columns a PlantLabelOut response (and cache invalidation) needs.
+_LABEL_FIELDS = ("id", "uuid", "uid", "active", "created_at")
+
+
+def bind_plant(*, user: AbstractBaseUser, tag_uuid: UUID, plant_uuid: UUID) -> PlantLabel:
+    """
+    Bind the user's label `tag_uuid` to their plant `plant_uuid`.
+
+    Two queries: the plant, with the label's columns as scalar subqueries,
+    and the guarded update.
+
+    Raises:
+        Plant.DoesNotExist: If the user has no such plant.
+        PlantLabel.DoesNotExist: If the user has no such label.
+    """
+    labels = PlantLabel.objects.filter(uuid=tag_uuid, user=user)
+    plant = (
+        Plant.objects.filter(uuid=plant_uuid, user=user)
+        .annotate(
+            **{f"label_{name}": Subquery(labels.values(name)[:1]) for name in _LABEL_FIELDS}
+        )
+        .first()
+    )
+    if plant is None:
+        raise Plant.DoesNotExist("Plant not found")
+    if plant.label_id is None:
+        raise PlantLabel.DoesNotExist("Tag not found")
+
+    now = timezone.now()
+    updated = labels.filter(Exists(Plant.objects.filter(pk=plant.pk, user=user))).update(
+        plant=plant.pk, updated_at=now
+    )
+    if not updated:
+        raise PlantLabel.DoesNotExist("Tag not found")
+    invalidate_uids([plant.label_uid])
+
+    return PlantLabel(
+        **{name: getattr(plant, f"label_{name}") for name in _LABEL_FIELDS},
+        user=user,
+        plant=plant,
+        updated_at=now,
+    )
+
+
+def unbind_plant(*, user: AbstractBaseUser, tag_uuid: UUID) -> PlantLabel:
+    """
+    Clear the plant of the user's label `tag_uuid`.
+
+    Raises:
+        PlantLabel.DoesNotExist: If the user has no such label.
+    """
+    tag = PlantLabel.objects.only(*_LABEL_FIELDS).get(uuid=tag_uuid, user=user)
+    now = timezone.now()
+    if not PlantLabel.objects.filter(pk=tag.pk, user=user).update(plant=None, updated_at=now):
+        raise PlantLabel.DoesNotExist("Tag not found")
+    invalidate_uids([tag.uid])
+
+    tag.plant = None
+    tag.updated_at = now
+    return tag
+
+
+def bind_plants(
+    *, user: AbstractBaseUser, bindings: Sequence[Tuple[UUID, UUID]]
+) -> List[PlantLabel]:
+    """
+    Apply many ``(tag_uuid, plant_uuid)`` bindings atomically.
+
+    All or nothing, in three queries whatever the number of pairs: the
+    plants and the labels (both locked, so their ownership holds until
+    commit), then one ``UPDATE`` with a ``CASE`` per label.
+
+    Returns:
+        The bound labels, in request order.
+
+    Raises:
+        ValueError: If a label appears more than once.
+        Plant.DoesNotExist: If any plant isn't the user's.
+        PlantLabel.DoesNotExist: If any label isn't the user's.
+    """
+    tag_uuids = [tag_uuid for tag_uuid, _ in bindings]
+    if len(set(tag_uuids)) != len(tag_uuids):
+        raise ValueError("Each tag may only appear once")
+
+    with transaction.atomic():
+        plant_uuids = {plant_uuid for _, plant_uuid in bindings}
+        plants = {
+            plant.uuid: plant
+            for plant in Plant.objects.select_for_update().filter(uuid__in=plant_uuids, user=user)
+        }
+        missing = sorted(str(plant_uuid) for plant_uuid in plant_uuids - plants.keys())
+        if missing:
+            raise Plant.DoesNotExist(f"Plants not found: {', '.join(missing)}")
+
+        labels = {
+            tag.uuid: tag
+            for tag in PlantLabel.objects.select_for_update()
+            .only(*_LABEL_FIELDS)
+            .filter(uuid__in=tag_uuids, user=user)
+        }
+        missing = [str(tag_uuid) for tag_uuid in tag_uuids if tag_uuid not in labels]
+        if missing:
+            raise PlantLabel.DoesNotExist(f"Tags not found: {', '.join(missing)}")
+
+        now = timezone.now()
+        PlantLabel.objects.filter(pk__in=[tag.pk for tag in labels.values()]).update(
+            plant=Case(
+                *[
+                    When(pk=labels[tag_uuid].pk, then=plants[plant_uuid].pk)
+                    for tag_uuid, plant_uuid in bindings
+                ]
+            ),
+            updated_at=now,
+        )
+        invalidate_uids([tag.uid for tag in labels.values()])
+
+    for tag_uuid, plant_uuid in bindings:
+        labels[tag_uuid].plant = plants[plant_uuid]
+        labels[tag_uuid].updated_at = now
+    return [labels[tag_uuid] for tag_uuid in tag_uuids]
@@ -0,0 +1,149 @@
+"""
+Hot lookup cache for NFC scan resolution.
+
+Maps a tag UID to the few fields a scan needs (tag id and uuid, owner id,
+active flag, bound plant uuid), so repeat scans don't query the database.
+Owners, the active flag and plant bindings change rarely, and every change
+invalidates the entry:
+
+- ``NFCTagService`` mutations and ``domain.binding`` call
+  ``invalidate_uids`` explicitly;
+- ``post_save``/``post_delete`` on the tag model cover every other
+  ``save()``/``delete()``, including the admin;
+- deleting a plant (which nulls its labels' ``plant`` without signals)
+  invalidates the labels bound to it.
+
+Writes that bypass model signals (``QuerySet.update``, ``bulk_create``,
+``bulk_update``) must call ``invalidate_uids`` themselves.
+
+Invalidation deletes the entry immediately and again when the surrounding
+transaction commits, so a concurrent scan can't re-cache pre-commit state.
+It only reaches other workers through a shared cache backend; on a
+process-local one the entries expire within seconds (``config.caching``).
+
+The same module owns the per-user tag counts behind ``count_mode=cached``
+on the tag list (``tag_count_key``). Tag saves and deletes invalidate the
+count of the tag's current owner; code that moves a tag away from an owner
+or writes without signals (``NFCTagService``) calls
+``invalidate_tag_counts`` for the users it affected. Deleting a plant only
+unbinds its labels, which leaves every count unchanged.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from config.caching import invalidated_timeout
+from nfctags import get_nfctag_model
+
+NFCTag = get_nfctag_model()
+
+_DEFAULT_TIMEOUT = 60 * 60  # 1 hour
+
+_FIELDS = ("id", "uuid", "user_id", "active", "plant__uuid")
+
+
+def _key(uid: str) -> str:
+    return f"nfc:uid:{uid}"
+
+
+def tag_count_key(user_id: Any) -> str:
+    """Cache key of the number of active tags owned by `user_id`."""
+    return f"nfc:count:user:{user_id}"
+
+
+def get_uid_entry(uid: str) -> Optional[Dict[str, Any]]:
+    """
+    Return ``{id, uuid, user_id, active, plant_uuid}`` for the tag with
+    `uid`, from the cache or one query. Unknown UIDs return None (and are
+    not cached, so newly provisioned tags are found immediately).
+    """
+    key = _key(uid)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+
+    row = NFCTag.objects.filter(uid=uid).values_list(*_FIELDS).first()
+    if row is None:
+        return None
+    entry = _entry(row)
+    cache.set(key, entry, invalidated_timeout("NFC_UID_CACHE_TIMEOUT", _DEFAULT_TIMEOUT))
+    return entry
+
+
+def get_uid_entries(uids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Batch form of ``get_uid_entry``: one ``get_many`` from the cache, then a
+    single ``uid IN (...)`` query for the misses. Unknown UIDs are absent
+    from the result.
+    """
+    keys = {_key(uid): uid for uid in uids}
+    found = {keys[key]: entry for key, entry in cache.get_many(list(keys)).items()}
+    missing = [uid for uid in keys.values() if uid not in found]
+    if not missing:
+        return found
+
+    fetched = {}
+    for row in NFCTag.objects.filter(uid__in=missing).values_list("uid", *_FIELDS):
+        fetched[row[0]] = _entry(row[1:])
+    if fetched:
+        cache.set_many(
+            {_key(uid): entry for uid, entry in fetched.items()},
+            invalidated_timeout("NFC_UID_CACHE_TIMEOUT", _DEFAULT_TIMEOUT),
+        )
+    found.update(fetched)
+    return found
+
+
+def _entry(row) -> Dict[str, Any]:
+    tag_id, tag_uuid, user_id, active, plant_uuid = row
+    return {
+        "id": tag_id,
+        "uuid": tag_uuid,
+        "user_id": user_id,
+        "active": active,
+        "plant_uuid": plant_uuid,
+    }
+
+
+def invalidate_uids(uids: Iterable[str]) -> None:
+    """Drop the entries for `uids` now and again once the transaction commits."""
+    keys = [_key(uid) for uid in uids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_tag_counts(user_ids: Iterable[Any]) -> None:
+    """Drop the cached tag counts of `user_ids`, now and on commit."""
+    keys = [tag_count_key(user_id) for user_id in set(user_ids) if user_id is not None]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def _invalidate_tag(sender, instance, **kwargs) -> None:
+    invalidate_uids([instance.uid])
+    invalidate_tag_counts([instance.user_id])
+
+
+def _invalidate_plant_labels(sender, instance, **kwargs) -> None:
+    related = getattr(instance, "nfc_labels", None)
+    if related is not None:
+        invalidate_uids(related.values_list("uid", flat=True))
+
+
+def connect_signals() -> None:
+    """Wire the invalidation receivers; called from ``DomainConfig.ready``."""
+    from django.db.models.signals import post_delete, post_save, pre_delete
+
+    from botany.models import Plant
+
+    post_save.connect(_invalidate_tag, sender=NFCTag, dispatch_uid="nfc_uid_cache_save")
+    post_delete.connect(_invalidate_tag, sender=NFCTag, dispatch_uid="nfc_uid_cache_delete")
+    pre_delete.connect(
+        _invalidate_plant_labels, sender=Plant, dispatch_uid="nfc_uid_cache_plant_delete"
+    )
@@ -0,0 +1,39 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from domain.provisioning import iter_uid_lines, provision_tags
+
+
+class Command(BaseCommand):
+    help = (
+        "Provision unowned NFC tags from a manufacturer UID file (one UID per "
+        "line; '-' reads stdin).\n"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="UID file to import, or '-' for stdin.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="UIDs to check and insert per batch (default: NFC_PROVISION_BATCH_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        try:
+            stream = sys.stdin if path == "-" else open(path, encoding="ascii", errors="replace")
+        except OSError as e:
+            raise CommandError(f"Cannot read {path}: {e}")
+
+        with stream:
+            counts = provision_tags(iter_uid_lines(stream), batch_size=options["batch_size"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Provisioning complete!\n"
+                f"Created: {counts['created']}, Duplicates: {counts['duplicates']}, "
+                f"Invalid: {counts['invalid']}\n"
+            )
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain', '0004_plantlabel_plant'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='plantlabel',
+            index=models.Index(fields=['uid', 'user', 'active'], name='plantlabel_scan_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain', '0005_plantlabel_scan_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='plantlabel',
+            name='last_counter',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Highest NTAG scan counter seen for this label.', null=True, verbose_name='last counter'),
+        ),
+        migrations.CreateModel(
+            name='ScanEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('counter', models.PositiveIntegerField(blank=True, help_text='The NTAG scan counter from the ASCII mirror, if present.', null=True, verbose_name='counter')),
+                ('replayed', models.BooleanField(default=False, help_text='The counter did not advance: likely a cloned or replayed URL.', verbose_name='replayed')),
+                ('scanned_at', models.DateTimeField(verbose_name='scanned at')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scan_events', to='domain.plantlabel', verbose_name='tag')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'scan event',
+                'verbose_name_plural': 'scan events',
+                'indexes': [models.Index(fields=['tag', 'scanned_at'], name='domain_scan_tag_id_f8ffb3_idx')],
+            },
+        ),
+    ]
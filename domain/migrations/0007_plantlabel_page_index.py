@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 12:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain', '0006_scan_events'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='plantlabel',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='plantlabel_user_page_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-19 13:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain', '0007_plantlabel_page_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='plantlabel',
+            name='plantlabel_user_page_idx',
+        ),
+        migrations.AddIndex(
+            model_name='plantlabel',
+            index=models.Index(condition=models.Q(('active', True)), fields=['user', 'created_at', 'id'], name='plantlabel_active_user_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-19 13:55
+
+import nfctags.fields
+import nfctags.validators
+from django.db import migrations
+from django.db.models.functions import Upper
+
+
+def canonicalize_uids(apps, schema_editor):
+    """Upper-case stored UIDs, which scans and provisioning look up upper-cased.
+
+    A lower-case UID whose upper-case form also exists (registered by hand
+    after the reel was provisioned) replaces the upper-case row when that
+    row is an unowned, never-used placeholder; otherwise both are left for
+    manual review.
+    """
+    Tag = apps.get_model("domain", "plantlabel")
+    for tag in Tag.objects.exclude(uid=Upper("uid")).iterator():
+        canonical = tag.uid.upper()
+        duplicate = Tag.objects.filter(uid=canonical).first()
+        if duplicate is not None:
+            if duplicate.user_id is not None or duplicate.plant_id is not None:
+                continue
+            duplicate.delete()
+        Tag.objects.filter(pk=tag.pk).update(uid=canonical)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain', '0008_plantlabel_active_user_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(canonicalize_uids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='plantlabel',
+            name='uid',
+            field=nfctags.fields.UIDField(db_index=True, editable=False, max_length=32, unique=True, validators=[nfctags.validators.validate_ascii_mirror_uid]),
+        ),
+    ]
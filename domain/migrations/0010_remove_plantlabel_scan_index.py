@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-19 14:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain', '0009_plantlabel_canonical_uid'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='plantlabel',
+            name='plantlabel_scan_idx',
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -23,6 +24,13 @@ class PlantLabel(AbstractNFCTag):
         verbose_name=_("plant"),
         help_text=_("The plant this NFC label is bound to."),
     )
+    last_counter = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("last counter"),
+        help_text=_("Highest NTAG scan counter seen for this label."),
+    )
 
     def __str__(self) -> str:
         if self.plant_id is not None:
@@ -33,3 +41,57 @@ class PlantLabel(AbstractNFCTag):
         ordering = ["title"]
         verbose_name = _("plant label")
         verbose_name_plural = _("plant labels")
+        indexes = [
+            # Visibility (user_id = %s AND active) plus keyset pagination on
+            # (created_at, id); partial, so inactive labels don't bloat it.
+            models.Index(
+                fields=["user", "created_at", "id"],
+                condition=models.Q(active=True),
+                name="plantlabel_active_user_idx",
+            ),
+        ]
+
+
+class ScanEvent(models.Model):
+    """
+    Append-only record of one NFC scan, written in batches by ``domain.scanlog``.
+
+    ``replayed`` is set when the scan counter did not advance past the
+    label's ``last_counter``: the URL was copied or replayed rather than read
+    from the physical tag.
+    """
+
+    tag = models.ForeignKey(
+        PlantLabel,
+        on_delete=models.CASCADE,
+        related_name="scan_events",
+        verbose_name=_("tag"),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("user"),
+    )
+    counter = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name=_("counter"),
+        help_text=_("The NTAG scan counter from the ASCII mirror, if present."),
+    )
+    replayed = models.BooleanField(
+        default=False,
+        verbose_name=_("replayed"),
+        help_text=_("The counter did not advance: likely a cloned or replayed URL."),
+    )
+    scanned_at = models.DateTimeField(verbose_name=_("scanned at"))
+
+    class Meta:
+        verbose_name = _("scan event")
+        verbose_name_plural = _("scan events")
+        indexes = [models.Index(fields=["tag", "scanned_at"])]
+
+    def __str__(self) -> str:
+        return f"Scan of {self.tag_id} at {self.scanned_at:%Y-%m-%d %H:%M:%S}"
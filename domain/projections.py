@@ -0,0 +1,99 @@
+"""
+Projection-driven NFC tag lists.
+
+``?fields=uuid,plant.name`` selects which ``PlantLabelOut`` fields (and
+which nested ``PlantOutNested`` fields, as ``plant.<field>``) a list returns.
+Requested fields are mapped to a ``values()`` projection, so unrequested
+columns, in particular the unbounded plant ``description`` and ``notes``
+text, never leave the database, and each row is mapped to a dict holding
+exactly the requested keys.
+
+Full lists take the same path with ``FULL_FIELDS``: rows come straight
+from our own database, so mapping them to dicts in ``PlantLabelOut`` shape
+replaces per-row model instantiation and Pydantic validation.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import QuerySet
+
+from config.pagination import Projection
+from .schema import PlantOutNested
+
+# PlantLabelOut field -> values() column.
+TAG_COLUMNS = {
+    "uuid": "uuid",
+    "plant_id": "plant__uuid",
+    "active": "active",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+PLANT_FIELDS = tuple(PlantOutNested.model_fields)
+# Every PlantLabelOut field, in schema order.
+FULL_FIELDS = "uuid,plant_id,plant,active,created_at,updated_at"
+
+
+def parse_fields(spec: str) -> Tuple[List[str], Optional[List[str]]]:
+    """
+    Split a ``fields`` parameter into top-level fields and nested plant fields.
+
+    Top-level fields keep the requested order, with ``plant`` in the
+    position it was first requested. ``plant`` selects every plant field;
+    plant fields are None when the plant isn't requested at all.
+
+    Raises:
+        ValueError: If a field is unknown.
+    """
+    fields: List[str] = []
+    plant_fields: Optional[List[str]] = None
+    for name in filter(None, (part.strip() for part in spec.split(","))):
+        if name in TAG_COLUMNS:
+            top = name
+        elif name == "plant":
+            top, plant_fields = "plant", list(PLANT_FIELDS)
+        elif name.startswith("plant.") and name[6:] in PLANT_FIELDS:
+            top, plant_fields = "plant", plant_fields if plant_fields is not None else []
+            if name[6:] not in plant_fields:
+                plant_fields.append(name[6:])
+        else:
+            raise ValueError(f"Unknown field: {name}")
+        if top not in fields:
+            fields.append(top)
+    if not fields:
+        raise ValueError("No fields requested")
+    return fields, plant_fields
+
+
+def project_tags(queryset: QuerySet, spec: str, *, keys: Tuple[str, ...] = ()) -> Projection:
+    """
+    Narrow a tag queryset to the fields in `spec`.
+
+    Args:
+        queryset: Tags to list.
+        spec: The ``fields`` parameter (see ``parse_fields``).
+        keys: Extra columns the caller needs on each row, e.g. the
+            pagination keys; they are fetched but not returned.
+
+    Raises:
+        ValueError: If `spec` names an unknown field.
+    """
+    fields, plant_fields = parse_fields(spec)
+    columns = [TAG_COLUMNS[name] for name in fields if name != "plant"]
+    if plant_fields is not None:
+        # The raw FK tells an unbound tag from a plant with empty fields.
+        columns += ["plant_id"] + [f"plant__{name}" for name in plant_fields]
+    columns += [key for key in keys if key not in columns]
+    plant_columns = [(name, f"plant__{name}") for name in plant_fields or ()]
+
+    def mapper(row: Dict[str, Any]) -> Dict[str, Any]:
+        item = {}
+        for name in fields:
+            if name != "plant":
+                item[name] = row[TAG_COLUMNS[name]]
+            elif row["plant_id"] is None:
+                item["plant"] = None
+            else:
+                item["plant"] = {name: row[column] for name, column in plant_columns}
+        return item
+
+    return Projection(queryset.values(*columns), mapper)
@@ -0,0 +1,89 @@
+"""
+Bulk provisioning of factory NFC tag reels.
+
+Manufacturers ship UID lists (one ASCII-mirror UID per line) for reels of
+thousands of labels. ``provision_tags`` streams such a file in batches of
+``batch_size`` lines, and for each batch it:
+
+1. parses the lines with ``parse_many`` (invalid lines are counted, not raised);
+2. drops UIDs already seen earlier in the file;
+3. finds UIDs that already exist with one ``uid IN (...)`` query;
+4. inserts the rest with ``bulk_create(ignore_conflicts=True)``.
+
+Provisioned tags are active and unowned, ready for users to register. No
+scan cache invalidation is needed: the uid lookup cache never stores misses.
+"""
+
+from typing import IO, Dict, Iterable, Iterator, List, Set, Union
+
+from django.conf import settings
+from django.db import transaction
+
+from nfctags import get_nfctag_model
+from nfctags.validators import parse_many
+
+NFCTag = get_nfctag_model()
+
+_DEFAULT_BATCH_SIZE = 1000
+
+
+def iter_uid_lines(stream: Union[IO[str], IO[bytes], Iterable]) -> Iterator[str]:
+    """Yield stripped, non-empty, non-comment lines from a text or binary stream."""
+    for line in stream:
+        if isinstance(line, bytes):
+            line = line.decode("ascii", errors="replace")
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def _batches(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch: List[str] = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def provision_tags(lines: Iterable[str], *, batch_size: int = None) -> Dict[str, int]:
+    """
+    Create unowned, active tags for every new UID in `lines`.
+
+    Returns:
+        Dict with ``created``, ``duplicates`` (already in the database or
+        repeated in the input) and ``invalid`` counts.
+    """
+    if batch_size is None:
+        batch_size = getattr(settings, "NFC_PROVISION_BATCH_SIZE", _DEFAULT_BATCH_SIZE)
+    counts = {"created": 0, "duplicates": 0, "invalid": 0}
+    seen: Set[str] = set()
+
+    for batch in _batches(lines, batch_size):
+        uids = []
+        for uid, _counter in parse_many(batch):
+            if uid is None:
+                counts["invalid"] += 1
+            elif uid in seen:
+                counts["duplicates"] += 1
+            else:
+                seen.add(uid)
+                uids.append(uid)
+        if not uids:
+            continue
+
+        with transaction.atomic():
+            existing = set(
+                NFCTag.objects.filter(uid__in=uids).values_list("uid", flat=True)
+            )
+            new = [NFCTag(uid=uid) for uid in uids if uid not in existing]
+            # ignore_conflicts covers UIDs inserted concurrently since the
+            # IN query; those are (rarely) counted as created.
+            NFCTag.objects.bulk_create(new, batch_size=batch_size, ignore_conflicts=True)
+
+        counts["created"] += len(new)
+        counts["duplicates"] += len(existing)
+
+    return counts
@@ -0,0 +1,240 @@
+"""
+Buffered, append-only NFC scan event log.
+
+Scans are recorded into an in-process buffer and written with one
+``bulk_create`` every ``SCAN_LOG_BATCH_SIZE`` events or
+``SCAN_LOG_FLUSH_INTERVAL`` milliseconds, whichever comes first, so the scan
+endpoint never waits on an INSERT. All writes happen on a daemon flusher
+thread, which a full batch wakes early; recording a scan runs no queries.
+With the interval set to None (as in the test settings) there is no flusher
+thread and events are only written by an explicit ``flush()``.
+
+Each flush also maintains ``PlantLabel.last_counter``, the highest NTAG scan
+counter seen per label: the batch's stored counters are read once, and each
+label gets one conditional ``UPDATE ... WHERE last_counter < %s`` to the
+batch's highest counter instead of a row lock. An event whose counter does
+not advance past the stored counter or an earlier event in the batch is
+``replayed``: the URL was copied rather than read from the physical tag.
+Events of labels deleted while buffered are dropped in the same read, and
+scanners deleted meanwhile are recorded as None, so one stale event can't
+fail the whole batch.
+
+Events still buffered when a worker dies are lost; the log is best-effort by
+design. The buffer is capped at ``SCAN_LOG_MAX_BUFFER`` events (the oldest
+are dropped) so a database outage cannot exhaust memory.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from config import metrics
+from .models import PlantLabel, ScanEvent
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BATCH_SIZE = 100
+_DEFAULT_FLUSH_INTERVAL = 500  # ms
+_DEFAULT_MAX_BUFFER = 10_000
+
+_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_buffer: deque = deque()
+_flusher: Optional[threading.Thread] = None
+_stop = threading.Event()
+# Set when a batch is full, to flush before the interval is up.
+_wake = threading.Event()
+
+
+def record_scan(
+    *, tag_id: int, user_id: Optional[int] = None, counter: Optional[int] = None
+) -> None:
+    """Buffer one scan of `tag_id`; a full batch wakes the flusher thread."""
+    record_scans([{"tag_id": tag_id, "user_id": user_id, "counter": counter}])
+
+
+def record_scans(scans: Iterable[Dict[str, Any]]) -> None:
+    """
+    Buffer many scans, e.g. a sweep's, in one append.
+
+    Each scan is a dict of ``record_scan``'s keyword arguments. Like
+    ``record_scan``, this never writes on the calling thread.
+    """
+    _ensure_flusher()
+    scanned_at = timezone.now()
+    events = [
+        {
+            "tag_id": scan["tag_id"],
+            "user_id": scan.get("user_id"),
+            "counter": scan.get("counter"),
+            "scanned_at": scanned_at,
+        }
+        for scan in scans
+    ]
+    if not events:
+        return
+    max_buffer = getattr(settings, "SCAN_LOG_MAX_BUFFER", _DEFAULT_MAX_BUFFER)
+    with _lock:
+        # The buffer keeps the newest `max_buffer` events.
+        dropped = max(len(_buffer) + len(events) - max_buffer, 0)
+        _buffer.extend(events)
+        for _ in range(dropped):
+            _buffer.popleft()
+        full = len(_buffer) >= getattr(
+            settings, "SCAN_LOG_BATCH_SIZE", _DEFAULT_BATCH_SIZE
+        )
+    if dropped:
+        metrics.increment("nfc.scan_events_dropped", dropped)
+    if full:
+        _wake.set()
+
+
+def pending() -> int:
+    """Number of buffered, unwritten events."""
+    return len(_buffer)
+
+
+def flush() -> int:
+    """
+    Write all buffered events and advance per-label counters.
+
+    Returns:
+        Number of events written; events of tags deleted since they were
+        buffered are dropped.
+    """
+    with _flush_lock:
+        with _lock:
+            events = list(_buffer)
+            _buffer.clear()
+        if not events:
+            return 0
+        try:
+            written = _write(events)
+        except Exception:
+            metrics.increment("nfc.scan_events_dropped", len(events))
+            logger.exception("Could not write %d scan events", len(events))
+            return 0
+    return written
+
+
+def reset() -> None:
+    """Drop buffered events without writing them. Intended for tests."""
+    with _lock:
+        _buffer.clear()
+    _wake.clear()
+
+
+def _write(events: List[Dict[str, Any]]) -> int:
+    with transaction.atomic():
+        # One read for every label in the batch: events of labels deleted
+        # since they were buffered are dropped, rather than failing the
+        # batch's foreign key checks and losing everyone else's scans.
+        stored = dict(
+            PlantLabel.objects.filter(pk__in={event["tag_id"] for event in events}).values_list(
+                "pk", "last_counter"
+            )
+        )
+        orphaned = len(events)
+        events = [event for event in events if event["tag_id"] in stored]
+        orphaned -= len(events)
+        user_ids = {event["user_id"] for event in events if event["user_id"] is not None}
+        if user_ids:
+            users = set(
+                get_user_model().objects.filter(pk__in=user_ids).values_list("pk", flat=True)
+            )
+            for event in events:
+                if event["user_id"] not in users:
+                    event["user_id"] = None
+
+        by_tag: Dict[int, List[Dict[str, Any]]] = {}
+        for event in events:
+            event["replayed"] = False
+            if event["counter"] is not None:
+                by_tag.setdefault(event["tag_id"], []).append(event)
+        for tag_id, tag_events in by_tag.items():
+            before = stored[tag_id]
+            high = -1 if before is None else before
+            for event in tag_events:
+                if event["counter"] <= high:
+                    event["replayed"] = True
+                else:
+                    high = event["counter"]
+            if all(event["replayed"] for event in tag_events):
+                continue
+            advanced = (
+                PlantLabel.objects.filter(pk=tag_id)
+                .filter(Q(last_counter__isnull=True) | Q(last_counter__lt=high))
+                .update(last_counter=high)
+            )
+            if not advanced:
+                # A concurrent flush got past `high` since the read above.
+                for event in tag_events:
+                    event["replayed"] = True
+        replays = sum(event["replayed"] for event in events)
+        ScanEvent.objects.bulk_create(ScanEvent(**event) for event in events)
+
+    if orphaned:
+        metrics.increment("nfc.scan_events_dropped", orphaned)
+        logger.warning("Dropped %d scan event(s) of deleted tags", orphaned)
+    metrics.increment("nfc.scan_events", len(events))
+    if replays:
+        metrics.increment("nfc.scan_replays", replays)
+        logger.warning("Flagged %d replayed NFC scan counter(s)", replays)
+    return len(events)
+
+
+def _run_flusher(interval: float) -> None:
+    while not _stop.is_set():
+        _wake.wait(interval)
+        _wake.clear()
+        if _buffer:
+            flush()
+            connections.close_all()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    interval = getattr(settings, "SCAN_LOG_FLUSH_INTERVAL", _DEFAULT_FLUSH_INTERVAL)
+    if interval is None or _flusher is not None:
+        return
+    with _lock:
+        if _flusher is None:
+            _flusher = threading.Thread(
+                target=_run_flusher,
+                args=(interval / 1000,),
+                name="scanlog-flusher",
+                daemon=True,
+            )
+            _flusher.start()
+
+
+def _shutdown() -> None:
+    _stop.set()
+    _wake.set()
+    flush()
+
+
+def _forget_inherited_state() -> None:
+    # The parent's flusher thread doesn't exist here, and its buffered events
+    # are the parent's to write.
+    global _flusher, _lock, _flush_lock
+    _flusher = None
+    _lock = threading.Lock()
+    _flush_lock = threading.Lock()
+    _buffer.clear()
+    _wake.clear()
+
+
+metrics.register_gauge("nfc.scan_buffer", pending)
+atexit.register(_shutdown)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_state)
@@ -1,8 +1,14 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Annotated, Any, Dict, List, Optional, Union
 from uuid import UUID
 
 from ninja import Schema
+from pydantic import Field
+
+# Upper bound on mirrors per batch scan request.
+MAX_SCAN_BATCH = 500
+# Upper bound on tag -> plant pairs per bulk bind request.
+MAX_BIND_BATCH = 500
 
 
 class NFCTagRegisterIn(Schema):
@@ -17,6 +23,27 @@ class NFCTagScanIn(Schema):
     ascii_mirror: str
 
 
+class NFCTagScanBatchIn(Schema):
+    """A sweep of ASCII mirrors resolved in one request."""
+
+    ascii_mirrors: List[str] = Field(..., min_length=1, max_length=MAX_SCAN_BATCH)
+
+
+class NFCTagScanResult(Schema):
+    """One batch scan result; ``uuid`` is None when the tag was not found."""
+
+    ascii_mirror: str
+    found: bool
+    uuid: Optional[UUID] = None
+    plant_id: Optional[UUID] = None
+
+
+class NFCTagScanBatchOut(Schema):
+    """Batch scan results, in request order."""
+
+    results: List[NFCTagScanResult]
+
+
 class NFCTagUpdateIn(Schema):
     """
     Only include fields that are actually editable by clients.
@@ -26,6 +53,14 @@ class NFCTagUpdateIn(Schema):
     label: Optional[str] = None
 
 
+class ProvisionOut(Schema):
+    """Outcome of importing a manufacturer UID file."""
+
+    created: int
+    duplicates: int
+    invalid: int
+
+
 class NFCTagOut(Schema):
     """
     Minimal, privacy-safe outward schema.
@@ -66,6 +101,19 @@ class BindPlantRequest(Schema):
     plant_id: UUID
 
 
+class BindPlantPair(Schema):
+    """One tag -> plant binding of a bulk bind request."""
+
+    tag_id: UUID
+    plant_id: UUID
+
+
+class BulkBindRequest(Schema):
+    """Request body for binding many tags at once; applied all or nothing."""
+
+    bindings: List[BindPlantPair] = Field(..., min_length=1, max_length=MAX_BIND_BATCH)
+
+
 class PlantLabelOut(Schema):
     """NFC PlantLabel detail with optional plant binding.
 
@@ -92,9 +140,25 @@ class PlantLabelOut(Schema):
         return plant.uuid
 
     @staticmethod
-    def resolve_plant(obj: object) -> Optional[PlantOutNested]:
-        """Return full plant metadata, or None when tag is unbound."""
-        plant = getattr(obj, "plant", None)
-        if plant is None:
-            return None
-        return PlantOutNested.from_orm(plant)
+    def resolve_plant(obj: object) -> Optional[object]:
+        """Return the bound plant, or None when tag is unbound.
+
+        The ORM object is returned as-is; the ``plant`` field validates it
+        into ``PlantOutNested`` once (building the schema here would
+        validate every plant twice).
+        """
+        return getattr(obj, "plant", None)
+
+
+# Item type of tag lists. Lists are served from values() rows already
+# shaped like PlantLabelOut (see domain.projections); dicts pass through
+# without re-validation, model instances still go through PlantLabelOut.
+PlantLabelListItem = Annotated[
+    Union[Dict[str, Any], PlantLabelOut], Field(union_mode="left_to_right")
+]
+
+
+class BulkBindOut(Schema):
+    """The bound tags, in request order."""
+
+    items: List[PlantLabelOut]
@@ -1,55 +1,97 @@
-from typing import Iterable, Optional
-from django.db.models import Q
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from django.db.models import QuerySet
 from django.contrib.auth.models import AbstractBaseUser
 
 from nfctags import get_nfctag_model
-from nfctags.models import AbstractNFCTag
-from nfctags.validators import parse_ascii_mirror
+from nfctags.validators import parse_ascii_mirror, parse_many
+from .caches import get_uid_entries, get_uid_entry
 
 NFCTag = get_nfctag_model()
 
 
-def get_nfctag_by_scan(
-    *, ascii_mirror: str, user: Optional[AbstractBaseUser] = None
-) -> Optional[NFCTag]:
+def resolve_scan(
+    *, ascii_mirror: str, user: AbstractBaseUser
+) -> Optional[Dict[str, Any]]:
     """
-    Returns the NFCTag object corresponding to the given NFC tag scan.
+    Cached scan resolution for the scan endpoint.
 
-    The function parses the ASCII mirror (UID + counter) of the scanned tag
-    and attempts to retrieve the NFCTag instance from the database.
-
-    Args:
-        ascii_mirror (str): The ASCII mirror string containing the NFC tag UID and scan counter.
-        user (Optional[AbstractBaseUser]): The user performing the scan. If provided,
-            you can add additional filtering logic (e.g., ownership, permissions).
+    Parses the ASCII mirror (UID + counter) and returns the cached
+    ``domain.caches`` entry (``id``, ``uuid``, ``user_id``, ``active``,
+    ``plant_uuid``) plus the scan ``counter``, so repeat scans of a tag need
+    no query and a miss is one lookup on the unique ``uid`` index. Ownership
+    and the active flag are checked against the entry.
 
     Returns:
-        Optional[NFCTag]: The NFCTag object if it exists; otherwise, None.
+        The entry if the tag exists, is active and is owned by `user`;
+        otherwise None.
     """
     uid, counter = parse_ascii_mirror(ascii_mirror)
+    if uid is None or not user.is_authenticated:
+        return None
 
-    try:
-        nfctag = NFCTag.objects.get(uid=uid)
-        # (Optional future check: If user is provided, enforce ownership)
-        # if user and nfctag.user != user:
-        #     return None
-        return nfctag
-    except NFCTag.DoesNotExist:
+    entry = get_uid_entry(uid)
+    if entry is None or not entry["active"] or entry["user_id"] != user.pk:
         return None
+    return {**entry, "counter": counter}
 
 
-def get_nfctags_visible_for(*, user: AbstractBaseUser) -> Iterable[int]:
+def resolve_scans(
+    *, ascii_mirrors: Iterable[str], user: AbstractBaseUser
+) -> List[Optional[Dict[str, Any]]]:
     """
-    Returns a list of nfctag IDs that are visible to the given user.
+    Batch form of ``resolve_scan`` for inventory sweeps.
+
+    Parses every mirror in one pass and resolves all UIDs with one cache
+    ``get_many`` plus at most one ``uid IN (...)`` query.
+
+    Returns:
+        One entry (with ``counter``) or None per input, in input order.
     """
+    parsed = parse_many(ascii_mirrors)
     if not user.is_authenticated:
-        return []
-    return NFCTag.objects.filter(
-        user=user,
-        active=True,
-    ).values_list("id", flat=True)
+        return [None] * len(parsed)
+
+    entries = get_uid_entries({uid for uid, _ in parsed if uid is not None})
+    results: List[Optional[Dict[str, Any]]] = []
+    for uid, counter in parsed:
+        entry = entries.get(uid)
+        if entry is None or not entry["active"] or entry["user_id"] != user.pk:
+            results.append(None)
+        else:
+            results.append({**entry, "counter": counter})
+    return results
+
 
+def get_nfctags_visible_for(*, user: AbstractBaseUser) -> QuerySet:
+    """
+    Returns the ids of the nfctags that are visible to the given user.
+    """
+    return get_nfctags_for(fetched_by=user).values_list("id", flat=True)
+
+
+def get_nfctags_for(
+    *,
+    fetched_by: AbstractBaseUser,
+    select_related: Sequence[str] = (),
+    only: Optional[Sequence[str]] = None,
+) -> QuerySet:
+    """
+    Returns the nfctags visible to `fetched_by`: its own active tags.
+
+    Visibility is a plain ``user_id = %s AND active`` predicate, served by
+    the partial ``plantlabel_active_user_idx`` index, so the result stays a
+    composable queryset that callers can filter, order and paginate further.
 
-def get_nfctags_for(*, fetched_by: AbstractBaseUser) -> Iterable[AbstractNFCTag]:
-    query = Q(id__in=get_nfctags_visible_for(user=fetched_by))
-    return NFCTag.objects.filter(query)
+    Args:
+        fetched_by: The user whose tags are listed. Anonymous users see none.
+        select_related: Relations to fetch in the same query (e.g. ``plant``).
+        only: Optional field projection passed to ``QuerySet.only``.
+    """
+    if not fetched_by.is_authenticated:
+        return NFCTag.objects.none()
+    queryset = NFCTag.objects.filter(user=fetched_by, active=True)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if only is not None:
+        queryset = queryset.only(*only)
+    return queryset
@@ -1,60 +1,105 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.contrib.auth.models import AbstractBaseUser
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from nfctags import get_nfctag_model
 from nfctags.models import AbstractNFCTag
+from nfctags.validators import canonical_uid
+
+from .caches import invalidate_tag_counts, invalidate_uids
 
 NFCTag = get_nfctag_model()
 
+# ValidationError code of a transition whose guard no longer held.
+UNAVAILABLE = "unavailable"
+
 
 class NFCTagService:
     """
     Service layer for managing NFC tags and their content.
+
+    Each mutation is a single ``UPDATE`` guarded by the state it transitions
+    from (e.g. ``user_id IS NULL AND active`` to register), so concurrent
+    writers can't overwrite each other: whoever loses matches no row and
+    gets a ``ValidationError`` with code ``UNAVAILABLE``. Only the changed
+    fields are validated; the database enforces uniqueness and foreign keys.
     """
 
     def __init__(self, user: Optional[AbstractBaseUser] = None):
         self.user = user
 
-    @transaction.atomic
     def create_tag(self, uid: str) -> AbstractNFCTag:
         """
-        Create a new NFCTag instance.
+        Create a new NFCTag instance; `uid` is stored in canonical form.
         """
+        uid = canonical_uid(uid)
         tag = NFCTag(uid=uid, user=self.user)
-        tag.full_clean()
-        tag.save()
+        tag.clean_fields(exclude=[f.name for f in tag._meta.fields if f.name != "uid"])
+        try:
+            with transaction.atomic():
+                tag.save(force_insert=True)
+        except IntegrityError:
+            raise ValidationError(f"Tag {uid} is already registered.", code=UNAVAILABLE)
         return tag
 
-    @transaction.atomic
     def register_user(self, tag: AbstractNFCTag) -> AbstractNFCTag:
         """
         Attach a user to an existing NFCTag (if not already registered).
         """
-        if not tag.is_available_to_register:
-            raise ValidationError(f"Tag {tag.uid} is already registered.")
-        tag.user = self.user
-        tag.full_clean()
-        tag.save()
+        if not self._transition(tag, {"user__isnull": True, "active": True}, user=self.user):
+            raise ValidationError(f"Tag {tag.uid} is already registered.", code=UNAVAILABLE)
         return tag
 
-    @transaction.atomic
     def disconnect_tag(self, tag: AbstractNFCTag) -> AbstractNFCTag:
-        if tag.user != self.user:
-            raise ValidationError(_("This tag is not registered to your account."))
-        tag.user = None
-        tag.full_clean()
-        tag.save()
+        if not self._transition(tag, {"user": self.user}, user=None):
+            raise ValidationError(
+                _("This tag is not registered to your account."), code=UNAVAILABLE
+            )
         return tag
 
-    @transaction.atomic
     def deactivate_tag(self, tag: AbstractNFCTag) -> AbstractNFCTag:
         """
         Deactivate an NFCTag by setting active=False.
         """
-        tag.active = False
-        tag.full_clean()
-        tag.save()
+        # Only while it still has the owner it was loaded with.
+        if not self._transition(tag, {"active": True, "user_id": tag.user_id}, active=False):
+            raise ValidationError(
+                _("This tag has already been deactivated or changed owner."), code=UNAVAILABLE
+            )
         return tag
+
+    def _transition(self, tag: AbstractNFCTag, guard: Dict[str, Any], **changes: Any) -> bool:
+        """
+        Write `changes` to `tag` with one ``UPDATE`` matching only while
+        `guard` holds, and report whether it did. `tag` reflects the changes
+        only if it did.
+        """
+        previous = {name: getattr(tag, name) for name in changes}
+        previous_owner = tag.user_id
+        for name, value in changes.items():
+            setattr(tag, name, value)
+        try:
+            # Relations are left to the database's foreign key checks.
+            tag.clean_fields(
+                exclude=[
+                    f.name for f in tag._meta.fields if f.name not in changes or f.is_relation
+                ]
+            )
+        finally:
+            for name, value in previous.items():
+                setattr(tag, name, value)
+
+        now = timezone.now()
+        if not NFCTag.objects.filter(pk=tag.pk, **guard).update(updated_at=now, **changes):
+            return False
+        for name, value in changes.items():
+            setattr(tag, name, value)
+        tag.updated_at = now
+
+        # update() bypasses the cache-invalidating signals.
+        invalidate_uids([tag.uid])
+        invalidate_tag_counts([previous_owner, tag.user_id])
+        return True
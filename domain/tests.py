@@ -1,4 +1,6 @@
+import json
 import time
+from io import StringIO
 import uuid as uuid_module
 from unittest.mock import patch
 
@@ -6,11 +8,18 @@ import jwt
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.base_user import AbstractBaseUser
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.urls import reverse
+from django.utils import timezone
 
 from botany.models import Plant
-from domain.models import PlantLabel
-from domain.services import NFCTagService
+from domain import caches, scanlog
+from domain.models import PlantLabel, ScanEvent
+from domain.provisioning import provision_tags
+from domain.schema import MAX_SCAN_BATCH
+from domain.selectors import get_nfctags_for, resolve_scan, resolve_scans
+from domain.services import UNAVAILABLE, NFCTagService
 
 User = get_user_model()
 
@@ -378,6 +387,94 @@ class TestNFCPlantBinding:
         assert data["plant_id"] is None
 
 
+@pytest.mark.django_db
+class TestBindingQueries:
+    """Bind/unbind are one guarded UPDATE; bulk bind has a fixed query count."""
+
+    def _post(self, client, user, url, body=None):
+        return client.post(
+            url,
+            data=json.dumps(body) if body is not None else None,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+
+    def _bulk(self, client, user, pairs):
+        bindings = [{"tag_id": str(t.uuid), "plant_id": str(p.uuid)} for t, p in pairs]
+        return self._post(client, user, "/app/api/nfctags/bind/batch", {"bindings": bindings})
+
+    def test_bind_and_unbind_skip_the_refetch(self, client, django_assert_num_queries) -> None:
+        user = _make_user("bq1")
+        plant = _make_plant(user, name="Calathea")
+        tag = _make_plant_label(user)
+        client.force_login(user)
+
+        # 3 auth queries, then plant (+ label columns) and the UPDATE.
+        with django_assert_num_queries(5):
+            bound = self._post(
+                client, user, f"/app/api/nfctags/{tag.uuid}/bind", {"plant_id": str(plant.uuid)}
+            )
+        # 3 auth queries, then label and the UPDATE.
+        with django_assert_num_queries(5):
+            unbound = self._post(client, user, f"/app/api/nfctags/{tag.uuid}/unbind")
+
+        tag.refresh_from_db()
+        assert bound.json()["plant"]["name"] == "Calathea"
+        assert bound.json()["updated_at"] != unbound.json()["updated_at"]
+        assert unbound.json()["created_at"] == bound.json()["created_at"]
+        assert tag.plant_id is None
+
+    def test_bulk_bind_query_count_is_fixed(self, client) -> None:
+        from django.test.utils import CaptureQueriesContext
+
+        user = _make_user("bq2")
+        client.force_login(user)
+        counts = []
+        for size in (2, 10):
+            pairs = [(_make_plant_label(user), _make_plant(user)) for _ in range(size)]
+            with CaptureQueriesContext(connection) as queries:
+                response = self._bulk(client, user, pairs)
+            assert [item["uuid"] for item in response.json()["items"]] == [
+                str(t.uuid) for t, _ in pairs
+            ]
+            counts.append(len(queries))
+
+        assert counts[0] == counts[1]
+        assert PlantLabel.objects.filter(user=user, plant__isnull=True).count() == 0
+
+    def test_bulk_bind_is_all_or_nothing(self, client) -> None:
+        user = _make_user("bq3")
+        client.force_login(user)
+        own = (_make_plant_label(user), _make_plant(user))
+        foreign = (_make_plant_label(user), _make_plant(_make_user("bq3b")))
+
+        response = self._bulk(client, user, [own, foreign])
+
+        assert response.status_code == 404
+        assert str(foreign[1].uuid) in response.json()["detail"]
+        assert not PlantLabel.objects.filter(plant__isnull=False).exists()
+
+    def test_bulk_bind_rejects_repeated_tags(self, client) -> None:
+        user = _make_user("bq4")
+        client.force_login(user)
+        tag = _make_plant_label(user)
+
+        response = self._bulk(client, user, [(tag, _make_plant(user)), (tag, _make_plant(user))])
+
+        assert response.status_code == 400
+
+    def test_bulk_bind_invalidates_scan_cache(self, client) -> None:
+        user = _make_user("bq5")
+        client.force_login(user)
+        tag, plant = _make_scannable_label(user), _make_plant(user)
+        mirror = f"{tag.uid}x000001"
+
+        assert resolve_scan(ascii_mirror=mirror, user=user)["plant_uuid"] is None
+        self._bulk(client, user, [(tag, plant)])
+
+        assert resolve_scan(ascii_mirror=mirror, user=user)["plant_uuid"] == plant.uuid
+
+
 # ---------------------------------------------------------------------------
 # Create Plant from GBIF endpoint tests
 # ---------------------------------------------------------------------------
@@ -488,3 +585,850 @@ class TestCreatePlantFromGBIF:
         # user A has one plant
         plants_a = Plant.objects.filter(user=user_a)
         assert plants_a.count() == 1
+
+
+# ---------------------------------------------------------------------------
+# NFC scan resolution
+# ---------------------------------------------------------------------------
+
+
+def _make_scannable_label(
+    user: AbstractBaseUser | None, plant: Plant | None = None, active: bool = True
+) -> PlantLabel:
+    """Create a PlantLabel with a valid 14-hex-digit UID."""
+    return PlantLabel.objects.create(
+        uid=uuid_module.uuid4().hex[:14].upper(),
+        user=user,
+        plant=plant,
+        active=active,
+    )
+
+
+@pytest.mark.django_db
+class TestNFCScanLookup:
+    """Scan resolution checks uid, ownership and active flag in one query."""
+
+    def test_selector_resolves_tag_and_plant_in_one_query(
+        self, django_assert_num_queries
+    ) -> None:
+        user = _make_user("scan1")
+        plant = _make_plant(user, name="Scanned Plant")
+        tag = _make_scannable_label(user, plant=plant)
+        for _ in range(20):
+            _make_scannable_label(user)
+
+        with django_assert_num_queries(1):
+            found = resolve_scan(ascii_mirror=f"{tag.uid}x00002A", user=user)
+
+        assert (found["id"], found["plant_uuid"], found["counter"]) == (tag.pk, plant.uuid, 42)
+
+    def test_selector_ignores_other_users_and_inactive_tags(self) -> None:
+        user = _make_user("scan2a")
+        other = _make_user("scan2b")
+        foreign = _make_scannable_label(other)
+        inactive = _make_scannable_label(user, active=False)
+
+        assert resolve_scan(ascii_mirror=foreign.uid, user=user) is None
+        assert resolve_scan(ascii_mirror=inactive.uid, user=user) is None
+        assert resolve_scan(ascii_mirror="not-a-uid", user=user) is None
+
+    def test_scan_endpoint(self, client) -> None:
+        user = _make_user("scan3a")
+        tag = _make_scannable_label(user)
+        foreign = _make_scannable_label(_make_user("scan3b"))
+
+        client.login(username=getattr(user, "username"), password="testpass")
+        found = client.post(
+            "/app/api/nfctags/scan",
+            data=f'{{"ascii_mirror": "{tag.uid}x000001"}}',
+            content_type="application/json",
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+        not_found = client.post(
+            "/app/api/nfctags/scan",
+            data=f'{{"ascii_mirror": "{foreign.uid}x000001"}}',
+            content_type="application/json",
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+
+        assert found.status_code == 200
+        assert found.json()["uuid"] == str(tag.uuid)
+        assert not_found.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Scan event log
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+class TestScanEventLog:
+    """Scans are buffered, written in batches and counter replays flagged.
+
+    Flushes are triggered explicitly: the test settings disable the
+    background flusher thread.
+    """
+
+    def test_scans_are_buffered_until_flush(self) -> None:
+        tag = _make_scannable_label(_make_user("log1"))
+
+        scanlog.record_scan(tag_id=tag.pk, counter=1)
+        assert ScanEvent.objects.count() == 0
+
+        assert scanlog.flush() == 1
+        assert ScanEvent.objects.get().counter == 1
+
+    def test_full_batch_wakes_the_flusher_without_writing_inline(
+        self, settings, django_assert_num_queries
+    ) -> None:
+        settings.SCAN_LOG_BATCH_SIZE = 100
+        tag = _make_scannable_label(_make_user("log2"))
+        for counter in range(99):
+            scanlog.record_scan(tag_id=tag.pk, counter=counter)
+        assert not scanlog._wake.is_set()
+
+        with django_assert_num_queries(0):
+            scanlog.record_scan(tag_id=tag.pk, counter=99)
+
+        assert scanlog._wake.is_set()
+        assert scanlog.pending() == 100
+
+    def test_non_monotonic_counters_are_flagged(self) -> None:
+        tag = _make_scannable_label(_make_user("log3"))
+        for counter in (5, 6, 6, 3):
+            scanlog.record_scan(tag_id=tag.pk, counter=counter)
+        scanlog.flush()
+        # Replay of an old URL in a later batch.
+        scanlog.record_scan(tag_id=tag.pk, counter=6)
+        scanlog.record_scan(tag_id=tag.pk, counter=None)
+        scanlog.flush()
+
+        events = ScanEvent.objects.order_by("id")
+        assert [e.replayed for e in events] == [False, False, True, True, True, False]
+        tag.refresh_from_db()
+        assert tag.last_counter == 6
+
+    def test_bulk_append_keeps_the_newest_events_when_full(self, settings) -> None:
+        settings.SCAN_LOG_MAX_BUFFER = 5
+        tag = _make_scannable_label(_make_user("log7"))
+
+        scanlog.record_scan(tag_id=tag.pk, counter=0)
+        scanlog.record_scans([{"tag_id": tag.pk, "counter": c} for c in range(1, 8)])
+
+        assert scanlog.pending() == 5
+        scanlog.flush()
+        assert list(ScanEvent.objects.order_by("id").values_list("counter", flat=True)) == [
+            3, 4, 5, 6, 7,
+        ]
+
+    def test_flush_updates_each_label_once(self, django_assert_num_queries) -> None:
+        tags = [_make_scannable_label(_make_user(f"log6{i}")) for i in range(2)]
+        for counter in range(50):
+            for tag in tags:
+                scanlog.record_scan(tag_id=tag.pk, counter=counter)
+
+        # SAVEPOINT, counter read, one UPDATE per label, INSERT, RELEASE.
+        with django_assert_num_queries(6):
+            assert scanlog.flush() == 100
+
+        for tag in tags:
+            tag.refresh_from_db()
+            assert tag.last_counter == 49
+        assert not ScanEvent.objects.filter(replayed=True).exists()
+
+    def test_flush_uses_one_insert(self, django_assert_max_num_queries) -> None:
+        tags = [_make_scannable_label(_make_user(f"log4{i}")) for i in range(3)]
+        for tag in tags:
+            scanlog.record_scan(tag_id=tag.pk)
+
+        # SAVEPOINT/RELEASE around the label read and a single INSERT; no
+        # counter UPDATEs and, without users, no user read.
+        with django_assert_max_num_queries(4):
+            scanlog.flush()
+
+    @pytest.mark.django_db(transaction=True)
+    def test_deleted_tags_and_users_do_not_fail_the_batch(self) -> None:
+        owner = _make_user("log8a")
+        scanner = _make_user("log8b")
+        kept = _make_scannable_label(owner)
+        deleted = _make_scannable_label(owner)
+        scanlog.record_scan(tag_id=kept.pk, user_id=owner.pk, counter=1)
+        scanlog.record_scan(tag_id=deleted.pk, user_id=owner.pk, counter=1)
+        scanlog.record_scan(tag_id=kept.pk, user_id=scanner.pk, counter=2)
+
+        deleted.delete()
+        scanner.delete()
+
+        assert scanlog.flush() == 2
+        events = ScanEvent.objects.order_by("id")
+        assert [(e.tag_id, e.user_id) for e in events] == [(kept.pk, owner.pk), (kept.pk, None)]
+        kept.refresh_from_db()
+        assert kept.last_counter == 2
+
+    def test_scan_endpoint_records_event(self, client) -> None:
+        user = _make_user("log5")
+        tag = _make_scannable_label(user)
+
+        client.login(username=getattr(user, "username"), password="testpass")
+        client.post(
+            "/app/api/nfctags/scan",
+            data=f'{{"ascii_mirror": "{tag.uid}x00002A"}}',
+            content_type="application/json",
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+        scanlog.flush()
+
+        event = ScanEvent.objects.get()
+        assert (event.tag_id, event.user_id, event.counter) == (tag.pk, user.pk, 42)
+
+
+# ---------------------------------------------------------------------------
+# UID lookup cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+class TestUIDLookupCache:
+    """Scans are served from the cache and never see stale ownership,
+    active flags or plant bindings after a mutation."""
+
+    def _scan(self, tag: PlantLabel, user: AbstractBaseUser):
+        return resolve_scan(ascii_mirror=f"{tag.uid}x000001", user=user)
+
+    def test_repeat_scans_need_no_query(self, django_assert_num_queries) -> None:
+        user = _make_user("cache1")
+        tag = _make_scannable_label(user)
+
+        with django_assert_num_queries(1):
+            self._scan(tag, user)
+        with django_assert_num_queries(0):
+            entry = self._scan(tag, user)
+
+        assert entry["uuid"] == tag.uuid
+        assert entry["counter"] == 1
+
+    def test_lifetime_is_capped_on_a_process_local_cache(self, settings, monkeypatch) -> None:
+        settings.NFC_UID_CACHE_TIMEOUT = 3600
+        settings.LOCAL_CACHE_MAX_TIMEOUT = 5
+        tag = _make_scannable_label(_make_user("cache9"))
+
+        with patch.object(caches.cache, "set") as cache_set:
+            caches.get_uid_entry(tag.uid)
+            monkeypatch.setattr("config.caching.is_shared", lambda: True)
+            caches.get_uid_entry(tag.uid)
+
+        assert [c.args[2] for c in cache_set.call_args_list] == [5, 3600]
+
+    def test_service_mutations_invalidate(self) -> None:
+        owner = _make_user("cache2a")
+        other = _make_user("cache2b")
+        tag = _make_scannable_label(owner)
+
+        assert self._scan(tag, owner) is not None
+        NFCTagService(user=owner).disconnect_tag(tag)
+        assert self._scan(tag, owner) is None
+
+        NFCTagService(user=other).register_user(tag)
+        assert self._scan(tag, owner) is None
+        assert self._scan(tag, other) is not None
+
+        NFCTagService(user=other).deactivate_tag(tag)
+        assert self._scan(tag, other) is None
+
+    def test_bind_and_unbind_invalidate(self, client) -> None:
+        user = _make_user("cache3")
+        plant = _make_plant(user)
+        tag = _make_scannable_label(user)
+        client.login(username=getattr(user, "username"), password="testpass")
+
+        assert self._scan(tag, user)["plant_uuid"] is None
+        client.post(
+            f"/app/api/nfctags/{tag.uuid}/bind",
+            data=f'{{"plant_id": "{plant.uuid}"}}',
+            content_type="application/json",
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+        assert self._scan(tag, user)["plant_uuid"] == plant.uuid
+
+        client.post(f"/app/api/nfctags/{tag.uuid}/unbind", HTTP_AUTHORIZATION=_auth_header(user))
+        assert self._scan(tag, user)["plant_uuid"] is None
+
+    def test_plant_and_tag_deletion_invalidate(self) -> None:
+        user = _make_user("cache4")
+        plant = _make_plant(user)
+        tag = _make_scannable_label(user, plant=plant)
+
+        assert self._scan(tag, user)["plant_uuid"] == plant.uuid
+        plant.delete()
+        assert self._scan(tag, user)["plant_uuid"] is None
+
+        tag.delete()
+        assert self._scan(tag, user) is None
+
+    def test_admin_edit_invalidates(self, admin_client) -> None:
+        user = _make_user("cache5")
+        tag = _make_scannable_label(user)
+        assert self._scan(tag, user) is not None
+
+        response = admin_client.post(
+            f"/app/admin/domain/plantlabel/{tag.pk}/change/",
+            {"title": tag.title, "plant": "", "active": ""},
+        )
+
+        assert response.status_code == 302
+        assert self._scan(tag, user) is None
+
+
+# ---------------------------------------------------------------------------
+# Guarded service transitions
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+class TestServiceTransitions:
+    """Service mutations are single guarded UPDATEs; a stale caller loses."""
+
+    def test_register_is_one_update(self, django_assert_num_queries) -> None:
+        user = _make_user("svc1")
+        tag = _make_plant_label(None)
+
+        with django_assert_num_queries(1):
+            NFCTagService(user=user).register_user(tag)
+
+        tag.refresh_from_db()
+        assert tag.user == user
+
+    def test_stale_register_does_not_overwrite_owner(self) -> None:
+        first, second = _make_user("svc2a"), _make_user("svc2b")
+        tag = _make_plant_label(None)
+        stale = PlantLabel.objects.get(pk=tag.pk)
+
+        NFCTagService(user=first).register_user(tag)
+        with pytest.raises(ValidationError) as exc:
+            NFCTagService(user=second).register_user(stale)
+
+        assert exc.value.code == UNAVAILABLE
+        assert stale.user is None
+        assert PlantLabel.objects.get(pk=tag.pk).user == first
+
+    def test_disconnect_and_deactivate_are_guarded(self) -> None:
+        owner, other = _make_user("svc3a"), _make_user("svc3b")
+        tag = _make_plant_label(owner)
+
+        with pytest.raises(ValidationError):
+            NFCTagService(user=other).disconnect_tag(tag)
+        NFCTagService(user=owner).deactivate_tag(tag)
+        with pytest.raises(ValidationError):
+            NFCTagService(user=owner).deactivate_tag(tag)
+
+        tag.refresh_from_db()
+        assert (tag.user, tag.active) == (owner, False)
+
+    def test_create_reports_duplicate_uid(self) -> None:
+        user = _make_user("svc4")
+        tag = _make_plant_label(None)
+
+        with pytest.raises(ValidationError) as exc:
+            NFCTagService(user=user).create_tag(uid=tag.uid)
+
+        assert exc.value.code == UNAVAILABLE
+
+    def test_tag_registered_in_lower_case_resolves_on_scan(self, client) -> None:
+        user = _make_user("svc6")
+        provisioned = PlantLabel.objects.create(uid="04AABBCCDDEE01")
+        client.force_login(user)
+
+        def register(uid):
+            return client.post(
+                "/app/api/nfctags/register",
+                data=json.dumps({"uid": uid}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=_auth_header(user),
+            )
+
+        created = register("04e141124c2880")
+        claimed = register("04aabbccddee01")
+
+        assert created.status_code == 201 and claimed.status_code == 200
+        assert PlantLabel.objects.filter(uid__iexact="04AABBCCDDEE01").count() == 1
+        assert claimed.json()["uuid"] == str(provisioned.uuid)
+        for uid in ("04E141124C2880", "04AABBCCDDEE01"):
+            mirror = f"{uid.lower()}x000001"
+            assert resolve_scan(ascii_mirror=mirror, user=user) is not None
+            assert all(resolve_scans(ascii_mirrors=[mirror], user=user))
+
+    def test_register_endpoint_returns_409_when_taken(self, client) -> None:
+        user = _make_user("svc5")
+        tag = _make_plant_label(_make_user("svc5b"))
+        client.force_login(user)
+
+        response = client.post(
+            "/app/api/nfctags/register",
+            data=json.dumps({"uid": tag.uid}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+
+        assert response.status_code == 409
+
+
+# ---------------------------------------------------------------------------
+# Factory reel provisioning
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+class TestProvisioning:
+    """Reels are deduplicated in batches and reported as counts."""
+
+    def test_counts_created_duplicate_and_invalid(self) -> None:
+        existing = _make_scannable_label(None)
+        lines = [
+            "04A1B2C3D4E5F6",
+            "04a1b2c3d4e5f6",  # same UID, lower-case
+            existing.uid,
+            "not-a-uid",
+            "04A1B2C3D4E5F7x000010",
+        ]
+
+        counts = provision_tags(lines, batch_size=2)
+
+        assert counts == {"created": 2, "duplicates": 2, "invalid": 1}
+        tag = PlantLabel.objects.get(uid="04A1B2C3D4E5F7")
+        assert tag.user is None and tag.active
+
+    def test_one_in_query_and_one_insert_per_batch(self, django_assert_num_queries) -> None:
+        lines = [f"04{i:012X}" for i in range(10)]
+
+        # Per batch: SAVEPOINT, SELECT ... IN, INSERT, RELEASE.
+        with django_assert_num_queries(8):
+            counts = provision_tags(lines, batch_size=5)
+
+        assert counts["created"] == 10
+
+    def test_command_reads_file(self, tmp_path) -> None:
+        from django.core.management import call_command
+
+        reel = tmp_path / "reel.txt"
+        reel.write_text("# reel 42\n04000000000001\n\n04000000000002\nbad\n")
+
+        out = StringIO()
+        call_command("provision_nfctags", str(reel), stdout=out)
+
+        assert "Created: 2, Duplicates: 0, Invalid: 1" in out.getvalue()
+
+    def test_endpoint_is_staff_only(self, client) -> None:
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        def upload(user):
+            client.force_login(user)
+            return client.post(
+                "/app/api/nfctags/provision",
+                {"file": SimpleUploadedFile("reel.txt", b"04000000000003\n04000000000004\n")},
+                HTTP_AUTHORIZATION=_auth_header(user),
+            )
+
+        assert upload(_make_user("prov1")).status_code == 403
+
+        staff = _make_user("prov2")
+        staff.is_staff = True
+        staff.save()
+        response = upload(staff)
+
+        assert response.status_code == 200
+        assert response.json() == {"created": 2, "duplicates": 0, "invalid": 0}
+
+
+@pytest.mark.django_db
+class TestBatchScan:
+    """A sweep of scans resolves in one request with at most one query."""
+
+    URL = "/app/api/nfctags/scan/batch"
+
+    def _post(self, client, user, mirrors):
+        client.force_login(user)
+        return client.post(
+            self.URL,
+            data=json.dumps({"ascii_mirrors": mirrors}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=_auth_header(user),
+        )
+
+    def test_results_in_input_order_with_not_found_entries(self, client) -> None:
+        user = _make_user("batch1")
+        plant = _make_plant(user)
+        bound = _make_scannable_label(user, plant=plant)
+        unbound = _make_scannable_label(user)
+        foreign = _make_scannable_label(_make_user("batch1b"))
+        inactive = _make_scannable_label(user, active=False)
+        mirrors = [
+            f"{unbound.uid}x000001",
+            "garbage",
+            f"{foreign.uid}x000001",
+            f"{bound.uid}x000002",
+            f"{inactive.uid}x000001",
+        ]
+
+        response = self._post(client, user, mirrors)
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["ascii_mirror"] for r in results] == mirrors
+        assert [r["found"] for r in results] == [True, False, False, True, False]
+        assert results[0]["uuid"] == str(unbound.uuid)
+        assert results[3]["plant_id"] == str(plant.uuid)
+        assert results[1]["uuid"] is None
+
+        scanlog.flush()
+        assert set(ScanEvent.objects.values_list("tag_id", flat=True)) == {
+            bound.pk,
+            unbound.pk,
+        }
+
+    def test_selector_uses_one_query_then_cache(self, django_assert_num_queries) -> None:
+        user = _make_user("batch2")
+        mirrors = [f"{_make_scannable_label(user).uid}x000001" for _ in range(20)]
+
+        with django_assert_num_queries(1):
+            first = resolve_scans(ascii_mirrors=mirrors, user=user)
+        with django_assert_num_queries(0):
+            second = resolve_scans(ascii_mirrors=mirrors, user=user)
+
+        assert all(first) and first == second
+
+    def test_sweep_records_events_without_writing_inline(
+        self, client, settings, django_assert_num_queries
+    ) -> None:
+        settings.SCAN_LOG_BATCH_SIZE = 10
+        user = _make_user("batch4")
+        mirrors = [f"{_make_scannable_label(user).uid}x000001" for _ in range(25)]
+        client.force_login(user)
+
+        # Authentication and the one resolving query; the 25 events, more
+        # than a batch, are only buffered.
+        with django_assert_num_queries(4):
+            response = client.post(
+                self.URL,
+                data=json.dumps({"ascii_mirrors": mirrors}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=_auth_header(user),
+            )
+
+        assert response.status_code == 200
+        assert scanlog.pending() == 25
+        assert scanlog._wake.is_set()
+        assert scanlog.flush() == 25
+
+    def test_batch_size_is_limited(self, client) -> None:
+        user = _make_user("batch3")
+
+        response = self._post(client, user, ["04000000000000"] * (MAX_SCAN_BATCH + 1))
+
+        assert response.status_code == 422
+
+
+@pytest.mark.django_db
+class TestTagListPagination:
+    """The tag list is keyset-paginated on (created_at, id)."""
+
+    def _get(self, client, user, query=""):
+        client.force_login(user)
+        return client.get(f"/app/api/nfctags?{query}", HTTP_AUTHORIZATION=_auth_header(user))
+
+    def test_cursor_walks_every_tag_once_newest_first(self, client) -> None:
+        user = _make_user("page1")
+        tags = [_make_plant_label(user) for _ in range(7)]
+        # Ties on created_at are broken by id.
+        PlantLabel.objects.filter(pk__in=[t.pk for t in tags[2:5]]).update(
+            created_at=tags[2].created_at
+        )
+        expected = list(
+            PlantLabel.objects.order_by("-created_at", "-id").values_list("uuid", flat=True)
+        )
+
+        seen, cursor = [], ""
+        while True:
+            data = self._get(client, user, f"limit=3&cursor={cursor}").json()
+            seen += [uuid_module.UUID(item["uuid"]) for item in data["items"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    def test_count_only_when_requested(self, client) -> None:
+        user = _make_user("page2")
+        _make_plant_label(user)
+        _make_plant_label(user)
+
+        assert self._get(client, user, "limit=1").json()["count"] is None
+        assert self._get(client, user, "limit=1&with_count=true").json()["count"] == 2
+
+    def test_deep_page_runs_no_count_or_offset(self, client) -> None:
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        user = _make_user("page3")
+        for _ in range(4):
+            _make_plant_label(user)
+        cursor = self._get(client, user, "limit=2").json()["next_cursor"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get(client, user, f"limit=2&cursor={cursor}")
+
+        assert len(response.json()["items"]) == 2
+        sql = " ".join(q["sql"] for q in queries).upper()
+        assert "COUNT(" not in sql and "OFFSET" not in sql
+
+    def test_invalid_cursor_returns_400(self, client) -> None:
+        user = _make_user("page4")
+
+        assert self._get(client, user, "cursor=not-a-cursor").status_code == 400
+        assert self._get(client, user, "cursor=WyJ4IiwieSJd").status_code == 400
+        # Right length, wrong element types: [{"a":1},1], [1,{"a":1}],
+        # [[1],"x"], ["2024-01-01T00:00:00",[1]], [null,null] and [1,null].
+        for cursor in (
+            "W251bGwsbnVsbF0",
+            "WzEsbnVsbF0",
+            "W3siYSI6MX0sMV0",
+            "WzEseyJhIjoxfV0",
+            "W1sxXSwieCJd",
+            "WyIyMDI0LTAxLTAxVDAwOjAwOjAwIixbMV1d",
+        ):
+            assert self._get(client, user, f"cursor={cursor}").status_code == 400
+
+
+@pytest.mark.django_db
+class TestTagListCounts:
+    """Totals are opt-in and exact, cached per user or planner-estimated."""
+
+    def _count(self, client, user, mode):
+        client.force_login(user)
+        response = client.get(
+            f"/app/api/nfctags?limit=1&count_mode={mode}", HTTP_AUTHORIZATION=_auth_header(user)
+        )
+        assert response.status_code == 200
+        return response.json()["count"]
+
+    def test_default_list_runs_no_count(self, client) -> None:
+        from django.test.utils import CaptureQueriesContext
+
+        user = _make_user("count1")
+        _make_plant_label(user)
+        client.force_login(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/app/api/nfctags", HTTP_AUTHORIZATION=_auth_header(user))
+
+        assert response.json()["count"] is None
+        assert "COUNT(" not in " ".join(q["sql"] for q in queries).upper()
+
+    def test_exact_and_estimated_counts(self, client) -> None:
+        user = _make_user("count2")
+        _make_plant_label(user)
+        _make_plant_label(user)
+        PlantLabel.objects.create(uid="COUNTINACTIVE", user=user, active=False)
+
+        assert self._count(client, user, "exact") == 2
+        # Small lists (and non-PostgreSQL databases) fall back to exact.
+        assert self._count(client, user, "estimated") == 2
+
+    def test_cached_count_is_reused_per_user(self, client) -> None:
+        from django.test.utils import CaptureQueriesContext
+
+        user, other = _make_user("count3"), _make_user("count3b")
+        _make_plant_label(user)
+        _make_plant_label(other)
+        _make_plant_label(other)
+
+        assert self._count(client, user, "cached") == 1
+        with CaptureQueriesContext(connection) as queries:
+            assert self._count(client, user, "cached") == 1
+        assert "COUNT(" not in " ".join(q["sql"] for q in queries).upper()
+        assert self._count(client, other, "cached") == 2
+
+    def test_cached_count_follows_tag_changes(self, client) -> None:
+        user = _make_user("count4")
+        tag = _make_plant_label(user)
+        assert self._count(client, user, "cached") == 1
+
+        _make_plant_label(user)
+        assert self._count(client, user, "cached") == 2
+
+        NFCTagService(user).deactivate_tag(tag)
+        assert self._count(client, user, "cached") == 1
+
+        NFCTagService(user).disconnect_tag(PlantLabel.objects.get(user=user, active=True))
+        assert self._count(client, user, "cached") == 0
+
+    def test_unknown_mode_is_rejected(self, client) -> None:
+        user = _make_user("count5")
+        client.force_login(user)
+
+        response = client.get(
+            "/app/api/nfctags?count_mode=approximate", HTTP_AUTHORIZATION=_auth_header(user)
+        )
+
+        assert response.status_code == 422
+
+
+@pytest.mark.django_db
+class TestVisibilitySelector:
+    """get_nfctags_for is a direct user/active filter served by the partial index."""
+
+    def _page_query(self, user):
+        from config.pagination import KeysetPagination
+
+        paginator = KeysetPagination()
+        qs = get_nfctags_for(fetched_by=user)
+        cursor = [timezone.now().isoformat(), 1]
+        return qs.order_by(*paginator.ordering).filter(paginator._after(qs, cursor))
+
+    def test_visibility_is_a_plain_predicate(self) -> None:
+        user = _make_user("vis1")
+        own = _make_plant_label(user)
+        PlantLabel.objects.create(uid="VISINACTIVE", user=user, active=False)
+        _make_plant_label(_make_user("vis1b"))
+
+        qs = get_nfctags_for(fetched_by=user)
+
+        assert "IN (SELECT" not in str(qs.query).upper()
+        assert list(qs) == [own]
+
+    def test_anonymous_sees_nothing(self) -> None:
+        from django.contrib.auth.models import AnonymousUser
+
+        _make_plant_label(_make_user("vis2"))
+
+        assert not get_nfctags_for(fetched_by=AnonymousUser()).exists()
+
+    def test_projection_and_select_related(self, django_assert_num_queries) -> None:
+        user = _make_user("vis3")
+        _make_plant_label(user, plant=_make_plant(user, name="Fern"))
+
+        with django_assert_num_queries(1):
+            tag = get_nfctags_for(
+                fetched_by=user, select_related=["plant"], only=["uuid", "plant__name"]
+            ).get()
+            assert tag.plant.name == "Fern"
+        assert "title" in tag.get_deferred_fields()
+
+    @pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="SQLite EXPLAIN QUERY PLAN format"
+    )
+    def test_sqlite_pages_seek_the_partial_index(self) -> None:
+        plan = self._page_query(_make_user("vis4")).explain()
+
+        assert "plantlabel_active_user_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="PostgreSQL EXPLAIN format"
+    )
+    def test_postgresql_pages_use_the_partial_index(self) -> None:
+        from django.db import transaction
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Tiny test tables would otherwise always be seq-scanned.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = self._page_query(_make_user("vis5")).explain()
+
+        assert "plantlabel_active_user_idx" in plan
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """?fields= narrows both the query and each item."""
+
+    def _get(self, client, user, query):
+        client.force_login(user)
+        return client.get(f"/app/api/nfctags?{query}", HTTP_AUTHORIZATION=_auth_header(user))
+
+    def test_items_hold_only_requested_fields(self, client) -> None:
+        user = _make_user("sparse1")
+        plant = _make_plant(user, name="Calathea")
+        bound = _make_plant_label(user, plant=plant)
+        unbound = _make_plant_label(user)
+
+        response = self._get(client, user, "fields=uuid,plant.name")
+
+        assert response.status_code == 200
+        items = {item["uuid"]: item for item in response.json()["items"]}
+        assert items[str(bound.uuid)] == {"uuid": str(bound.uuid), "plant": {"name": "Calathea"}}
+        assert items[str(unbound.uuid)] == {"uuid": str(unbound.uuid), "plant": None}
+
+    def test_unrequested_columns_are_not_queried(self, client) -> None:
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        user = _make_user("sparse2")
+        _make_plant_label(user, plant=_make_plant(user))
+        client.force_login(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._get(client, user, "fields=plant_id,plant.name")
+
+        page = next(q["sql"] for q in queries if "domain_plantlabel" in q["sql"])
+        assert '"botany_plant"."name"' in page
+        assert "description" not in page and "notes" not in page
+        assert '"domain_plantlabel"."title"' not in page
+
+    def test_sparse_pages_follow_cursor(self, client) -> None:
+        user = _make_user("sparse3")
+        tags = [_make_plant_label(user) for _ in range(3)]
+
+        first = self._get(client, user, "fields=uuid&limit=2").json()
+        second = self._get(
+            client, user, f"fields=uuid&limit=2&cursor={first['next_cursor']}"
+        ).json()
+
+        seen = [item["uuid"] for item in first["items"] + second["items"]]
+        assert sorted(seen) == sorted(str(t.uuid) for t in tags)
+        assert second["next_cursor"] is None
+
+    def test_unknown_field_returns_400(self, client) -> None:
+        user = _make_user("sparse4")
+
+        assert self._get(client, user, "fields=uuid,uid").status_code == 400
+        assert self._get(client, user, "fields=plant.user").status_code == 400
+
+
+@pytest.mark.django_db
+class TestTagListFastPath:
+    """Full lists are mapped from values() rows, identical to PlantLabelOut."""
+
+    def test_list_items_match_plantlabelout(self, client) -> None:
+        from ninja.renderers import JSONRenderer
+
+        from domain.schema import PlantLabelOut
+
+        user = _make_user("fast1")
+        plant = Plant.objects.create(
+            name="Monstera", user=user, gbif_id=2868241, description="Big leaves"
+        )
+        tags = [_make_plant_label(user, plant=plant), _make_plant_label(user)]
+        client.force_login(user)
+        auth = _auth_header(user)
+
+        items = client.get("/app/api/nfctags", HTTP_AUTHORIZATION=auth).json()["items"]
+
+        renderer = JSONRenderer()
+        for tag in PlantLabel.objects.select_related("plant").filter(pk__in=[t.pk for t in tags]):
+            data = PlantLabelOut.from_orm(tag).model_dump()
+            expected = renderer.render(None, data, response_status=200)
+            listed = next(i for i in items if i["uuid"] == str(tag.uuid))
+            assert json.dumps(listed) == json.dumps(json.loads(expected))
+
+    def test_page_is_one_query(self, client, django_assert_num_queries) -> None:
+        user = _make_user("fast2")
+        for i in range(5):
+            _make_plant_label(user, plant=_make_plant(user, name=f"Plant {i}"))
+        client.force_login(user)
+        auth = _auth_header(user)
+        client.get("/app/api/nfctags", HTTP_AUTHORIZATION=auth)
+
+        # JWT user, session and session user lookups, then the page itself.
+        with django_assert_num_queries(4):
+            response = client.get("/app/api/nfctags", HTTP_AUTHORIZATION=auth)
+
+        assert all(item["plant"] for item in response.json()["items"])
@@ -0,0 +1,24 @@
+from django.db import models
+
+from .validators import canonical_uid
+
+
+class UIDField(models.CharField):
+    """
+    CharField holding an NFC UID in canonical (upper-case) form.
+
+    Values are canonicalized on save and in lookups (``uid=``, ``uid__in=``,
+    ``update(uid=...)``), so a UID sent in lower case finds and never
+    duplicates the tag stored in upper case by scans and provisioning.
+    """
+
+    def to_python(self, value):
+        return canonical_uid(super().to_python(value))
+
+    def get_prep_value(self, value):
+        return canonical_uid(super().get_prep_value(value))
+
+    def pre_save(self, model_instance, add):
+        value = canonical_uid(getattr(model_instance, self.attname))
+        setattr(model_instance, self.attname, value)
+        return value
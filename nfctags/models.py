@@ -5,6 +5,7 @@ from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 
+from .fields import UIDField
 from .validators import validate_ascii_mirror_uid
 
 
@@ -15,7 +16,7 @@ class AbstractNFCTag(models.Model):
         db_index=True,
         unique=True,
     )
-    uid = models.CharField(
+    uid = UIDField(
         max_length=32,
         unique=True,
         db_index=True,
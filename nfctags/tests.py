@@ -1,6 +1,13 @@
-from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
 
 from .models import NFCTag
+from .validators import (
+    parse_ascii_mirror,
+    parse_many,
+    validate_ascii_mirror_counter,
+    validate_ascii_mirror_uid,
+)
 
 
 class NFCTagModelTest(TestCase):
@@ -17,3 +24,42 @@ class NFCTagModelTest(TestCase):
         NFCTag.objects.create(uid="04E141124C2880")
         with self.assertRaises(Exception):
             NFCTag.objects.create(uid="04E141124C2880")
+
+    def test_uid_is_stored_and_looked_up_upper_case(self):
+        tag = NFCTag.objects.create(uid="04e141124c2880")
+
+        self.assertEqual(tag.uid, "04E141124C2880")
+        self.assertEqual(NFCTag.objects.get(pk=tag.pk).uid, "04E141124C2880")
+        self.assertEqual(NFCTag.objects.get(uid="04e141124c2880"), tag)
+        self.assertTrue(NFCTag.objects.filter(uid__in=["04e141124c2880"]).exists())
+        with self.assertRaises(Exception):
+            NFCTag.objects.create(uid="04E141124C2880")
+
+
+class ASCIIMirrorParsingTest(SimpleTestCase):
+    def test_uid_only(self):
+        self.assertEqual(parse_ascii_mirror("04E141124C2880"), ("04E141124C2880", None))
+
+    def test_uid_and_counter(self):
+        self.assertEqual(parse_ascii_mirror("04E141124C2880x00002A"), ("04E141124C2880", 42))
+
+    def test_uid_is_canonical_upper_case(self):
+        self.assertEqual(validate_ascii_mirror_uid("04e141124c2880"), "04E141124C2880")
+
+    def test_invalid_components_are_none(self):
+        self.assertEqual(parse_ascii_mirror("04E141124C28"), (None, None))
+        self.assertEqual(parse_ascii_mirror("04E141124C288Gx00002A"), (None, 42))
+        self.assertEqual(parse_ascii_mirror("04E141124C2880x2A"), ("04E141124C2880", None))
+        self.assertIsNone(validate_ascii_mirror_uid("04E141124C2880\n"))
+        self.assertIsNone(validate_ascii_mirror_uid("04E141124C288\u0661"))
+        self.assertIsNone(validate_ascii_mirror_counter("+0002A"))
+
+    def test_empty_value_raises(self):
+        with self.assertRaises(ValidationError):
+            parse_ascii_mirror("")
+
+    def test_parse_many_lines_up_with_input(self):
+        self.assertEqual(
+            parse_many(["04e141124c2880x000001", "", "nope", "04E141124C2881"]),
+            [("04E141124C2880", 1), (None, None), (None, None), ("04E141124C2881", None)],
+        )
@@ -1,9 +1,19 @@
-import re
 import uuid
+from typing import Iterable, List, Optional, Tuple
 
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 
+# NTAG ASCII mirror: "<UID>" or "<UID>x<counter>", where the UID is 7 bytes
+# (14 hex characters) and the counter 3 bytes (6 hex characters).
+UID_LENGTH = 14
+COUNTER_LENGTH = 6
+SEPARATOR = "x"
+
+# Table-driven hex check: stripping every hex digit from a string leaves ""
+# only if the string was all hex. No regex, no intermediate allocations.
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
 
 def is_valid_uuid(uuid_str):
     try:
@@ -15,6 +25,10 @@ def is_valid_uuid(uuid_str):
     return str(uuid_obj) == uuid_str
 
 
+def _is_hex(value: str, length: int) -> bool:
+    return len(value) == length and not value.strip(_HEX_DIGITS)
+
+
 def parse_ascii_mirror(value):
     """
     Parse the ASCII Mirror-Based UID and counter format.
@@ -23,24 +37,42 @@ def parse_ascii_mirror(value):
         value (str): The ASCII mirror value to be parsed.
 
     Returns:
-        tuple: (uid, counter) where counter may be None.
+        tuple: (uid, counter) where uid is upper-case (None if invalid) and
+        counter is an int (None if absent or invalid).
 
     Raises:
-        ValidationError: If the input value is empty or if the format is invalid.
+        ValidationError: If the input value is empty.
     """
     if not value:
         raise ValidationError(_("Input value cannot be empty."))
 
-    if "x" in value:
-        parts = value.split("x", 1)
-        if len(parts) != 2:
-            raise ValidationError(_("Invalid format. Expected 'UIDxCounter'."))
-        uid, counter = parts
-        uid = validate_ascii_component(uid, "uid")
-        counter = validate_ascii_component(counter, "counter")
-        return uid, counter
+    uid, separator, counter = value.partition(SEPARATOR)
+    if not separator:
+        return validate_ascii_mirror_uid(value), None
+    return validate_ascii_mirror_uid(uid), validate_ascii_mirror_counter(counter)
+
 
-    return validate_ascii_component(value, "uid"), None
+def parse_many(values: Iterable[str]) -> List[Tuple[Optional[str], Optional[int]]]:
+    """
+    Parse a batch of ASCII mirrors (e.g. a provisioning file or batch scan).
+
+    Unlike ``parse_ascii_mirror`` this never raises: empty and invalid
+    entries yield ``(None, None)`` so results line up with the input.
+    """
+    results = []
+    append = results.append
+    for value in values:
+        if not value:
+            append((None, None))
+            continue
+        uid, separator, counter = value.partition(SEPARATOR)
+        if not _is_hex(uid, UID_LENGTH):
+            append((None, None))
+        elif not separator:
+            append((uid.upper(), None))
+        else:
+            append((uid.upper(), validate_ascii_mirror_counter(counter)))
+    return results
 
 
 def validate_ascii_component(value, component_type):
@@ -64,40 +96,35 @@ def validate_ascii_component(value, component_type):
     raise ValidationError(_("Invalid component type for validation."))
 
 
+def canonical_uid(value):
+    """
+    Return `value` in the canonical form UIDs are stored and cached in
+    (upper-case, surrounding whitespace removed); non-strings pass through.
+    """
+    if isinstance(value, str):
+        return value.strip().upper()
+    return value
+
+
 def validate_ascii_mirror_uid(value):
     """
     Validates the ASCII Mirror-Based NTAG uid format.
     The uid should be a 7-byte (14 characters) hex value in ASCII representation.
+
+    Returns the canonical (upper-case) uid, or None if the format is invalid.
     """
-    pattern = re.compile(r"^[0-9A-Fa-f]{14}$")
-    if not pattern.match(value):
+    if not isinstance(value, str) or not _is_hex(value, UID_LENGTH):
         return None
-    return value
+    return value.upper()
 
 
 def validate_ascii_mirror_counter(value):
     """
     Validate the ASCII Mirror-Based counter format.
     The counter should be a 3-byte(6 characters) hex value in ASCII representation.
+
+    Returns the counter as an int, or None if the format is invalid.
     """
-    pattern = re.compile(r"^[0-9A-Fa-f]{6}$")
-    if not pattern.match(value):
+    if not isinstance(value, str) or not _is_hex(value, COUNTER_LENGTH):
         return None
-
-    if isinstance(value, int):
-        return value
-
-    elif isinstance(value, bytes):
-        try:
-            return int(value.decode("utf-8"))
-        except ValueError:
-            return None
-
-    elif isinstance(value, str):
-        try:
-            return int(value, 16)  # Convert from hex if necessary
-        except ValueError:
-            return None
-
-    else:
-        return None  # raise ValidationError("Counter must be an int, bytes, or str")
+    return int(value, 16)
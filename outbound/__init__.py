@@ -0,0 +1,3 @@
+"""
+Outbound-call machinery shared by the upstream integrations (GBIF, Kindwise).
+"""
@@ -0,0 +1,224 @@
+"""
+Named bulkheads for outbound calls.
+
+Each upstream gets its own bounded thread pool plus an admission semaphore,
+so a slow upstream can only tie up its own slots: once ``max_concurrent``
+calls are running and ``max_queued`` are waiting, further callers wait at most
+``queue_timeout`` seconds for admission and then fail fast with
+``BulkheadFull``. Calls that sat in the queue longer than ``queue_timeout``
+are dropped with ``BulkheadTimeout`` instead of being started late.
+
+Bulkheads are configured with the ``OUTBOUND_BULKHEADS`` setting::
+
+    OUTBOUND_BULKHEADS = {
+        "gbif": {"max_concurrent": 8, "max_queued": 16, "queue_timeout": 2.0},
+    }
+
+and expose their queue depth and active count through ``stats()`` and the
+``outbound.bulkhead.*`` gauges in ``config.metrics``.
+"""
+
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+
+from config import metrics
+
+_DEFAULT_CONFIG = {"max_concurrent": 4, "max_queued": 8, "queue_timeout": 2.0}
+
+
+class BulkheadFull(Exception):
+    """Raised when a call could not be admitted within the queue timeout."""
+
+    pass
+
+
+class BulkheadTimeout(Exception):
+    """Raised when a call waited too long in the queue or for its result."""
+
+    pass
+
+
+class Bulkhead:
+    """
+    Bounded executor for the calls to one upstream.
+
+    Args:
+        name: Upstream name, used for thread names and metric labels.
+        max_concurrent: Calls allowed to run at the same time.
+        max_queued: Calls allowed to wait for a free worker.
+        queue_timeout: Seconds a call may wait for admission, and then for a
+            free worker, before it is rejected.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int,
+        max_queued: int,
+        queue_timeout: float,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._admission = threading.BoundedSemaphore(max_concurrent + max_queued)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix=f"bulkhead-{name}"
+        )
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "active": self._active,
+                "queued": self._queued,
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+            }
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule ``func(*args, **kwargs)`` on this bulkhead.
+
+        Raises:
+            BulkheadFull: if no slot frees up within ``queue_timeout``.
+        """
+        if not self._admission.acquire(timeout=self.queue_timeout):
+            metrics.increment("outbound.bulkhead.rejected", bulkhead=self.name)
+            raise BulkheadFull(f"{self.name} bulkhead is full")
+        return self._schedule(func, args, kwargs)
+
+    def try_submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Optional[Future]:
+        """
+        Like ``submit``, but only if a slot is free right now.
+
+        Returns:
+            The future, or None if the bulkhead is full; nothing waits.
+        """
+        if not self._admission.acquire(blocking=False):
+            metrics.increment("outbound.bulkhead.rejected", bulkhead=self.name)
+            return None
+        return self._schedule(func, args, kwargs)
+
+    def _schedule(self, func: Callable[..., Any], args, kwargs) -> Future:
+        enqueued_at = time.monotonic()
+        with self._lock:
+            self._queued += 1
+
+        def run() -> Any:
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            try:
+                if time.monotonic() - enqueued_at > self.queue_timeout:
+                    metrics.increment("outbound.bulkhead.expired", bulkhead=self.name)
+                    raise BulkheadTimeout(f"{self.name} call expired in queue")
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                self._admission.release()
+
+        try:
+            return self._executor.submit(run)
+        except RuntimeError:
+            # Executor shut down (interpreter exit); give the slot back.
+            with self._lock:
+                self._queued -= 1
+            self._admission.release()
+            raise
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` on this bulkhead and wait for the result.
+
+        Args:
+            timeout: Maximum seconds to wait for the result (None waits for
+                as long as the call runs).
+
+        Raises:
+            BulkheadFull: if the call could not be admitted.
+            BulkheadTimeout: if the call expired in the queue or `timeout`
+                elapsed.
+        """
+        future = self.submit(func, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as exc:
+            raise BulkheadTimeout(f"{self.name} call timed out") from exc
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_bulkheads: Dict[str, Bulkhead] = {}
+_registry_lock = threading.Lock()
+
+
+def get_bulkhead(name: str) -> Bulkhead:
+    """Return the process-wide bulkhead `name`, creating it from settings."""
+    bulkhead = _bulkheads.get(name)
+    if bulkhead is not None:
+        return bulkhead
+
+    with _registry_lock:
+        if name not in _bulkheads:
+            configured = getattr(settings, "OUTBOUND_BULKHEADS", {}).get(name, {})
+            bulkhead = Bulkhead(name, **{**_DEFAULT_CONFIG, **configured})
+            _bulkheads[name] = bulkhead
+            metrics.register_gauge(
+                "outbound.bulkhead.active", lambda: bulkhead.active, bulkhead=name
+            )
+            metrics.register_gauge(
+                "outbound.bulkhead.queued", lambda: bulkhead.queued, bulkhead=name
+            )
+        return _bulkheads[name]
+
+
+def all_stats() -> Dict[str, Dict[str, Any]]:
+    """Return ``stats()`` for every bulkhead created in this process."""
+    return {name: bulkhead.stats() for name, bulkhead in list(_bulkheads.items())}
+
+
+def shutdown_bulkheads(wait: bool = False) -> None:
+    """Shut down every bulkhead; new ones are created on next use."""
+    with _registry_lock:
+        bulkheads = list(_bulkheads.values())
+        _bulkheads.clear()
+    for bulkhead in bulkheads:
+        bulkhead.shutdown(wait=wait)
+
+
+def _forget_inherited_bulkheads() -> None:
+    # Worker threads don't survive fork(); children must build their own pools.
+    _bulkheads.clear()
+
+
+atexit.register(shutdown_bulkheads)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_bulkheads)
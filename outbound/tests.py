@@ -0,0 +1,251 @@
+"""
+Tests for outbound request policies and bulkheads, using a local stub
+upstream that injects latency and failures instead of calling a real service.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from outbound.bulkheads import Bulkhead, BulkheadFull, BulkheadTimeout
+from outbound.policy import (
+    LatencyTracker,
+    RequestPolicy,
+    RetryBudget,
+    decorrelated_jitter,
+)
+
+
+class StubUpstream:
+    """Callable upstream that replays a script of (delay, outcome) pairs.
+
+    ``outcome`` is either a value to return or an exception to raise. Calls
+    past the end of the script repeat its last entry.
+    """
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            index = min(self.calls, len(self.script) - 1)
+            self.calls += 1
+        delay, outcome = self.script[index]
+        time.sleep(delay)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class Transient(Exception):
+    pass
+
+
+def _policy(**kwargs):
+    sleeps = []
+    defaults = {
+        "max_attempts": 3,
+        "is_retryable": lambda exc: isinstance(exc, Transient),
+        "sleep": sleeps.append,
+        "rng": random.Random(0),
+    }
+    policy = RequestPolicy("stub", **{**defaults, **kwargs})
+    return policy, sleeps
+
+
+def _warm(policy, seconds=0.01, samples=20):
+    for _ in range(samples):
+        policy.latency.record(seconds)
+
+
+class TestDecorrelatedJitter:
+    def test_delay_stays_within_bounds(self):
+        rng = random.Random(1)
+        delay = 0.1
+        for _ in range(100):
+            delay = decorrelated_jitter(0.1, 2.0, delay, rng)
+            assert 0.1 <= delay <= 2.0
+
+
+class TestRetries:
+    def test_transient_failures_are_retried(self):
+        stub = StubUpstream((0, Transient()), (0, Transient()), (0, "ok"))
+        policy, sleeps = _policy()
+
+        assert policy.call(stub) == "ok"
+        assert stub.calls == 3
+        assert len(sleeps) == 2
+
+    def test_non_retryable_errors_raise_immediately(self):
+        stub = StubUpstream((0, ValueError("404")))
+        policy, sleeps = _policy()
+
+        with pytest.raises(ValueError):
+            policy.call(stub)
+        assert stub.calls == 1
+        assert sleeps == []
+
+    def test_gives_up_after_max_attempts(self):
+        stub = StubUpstream((0, Transient()))
+        policy, _ = _policy(max_attempts=2)
+
+        with pytest.raises(Transient):
+            policy.call(stub)
+        assert stub.calls == 2
+
+    def test_exhausted_budget_stops_retries(self):
+        stub = StubUpstream((0, Transient()))
+        policy, _ = _policy(budget=RetryBudget(ratio=0, min_tokens=1))
+
+        for _ in range(3):
+            with pytest.raises(Transient):
+                policy.call(stub)
+
+        # One retry from the single token, then only first attempts.
+        assert stub.calls == 4
+
+
+class TestHedging:
+    def test_slow_call_is_hedged(self):
+        stub = StubUpstream((0.5, "slow"), (0, "fast"))
+        policy, _ = _policy(hedge=True, hedge_min_delay=0.01)
+        _warm(policy)
+
+        start = time.monotonic()
+        result = policy.call(stub)
+
+        assert result == "fast"
+        assert time.monotonic() - start < 0.4
+        assert stub.calls == 2
+
+    def test_fast_call_is_not_hedged(self):
+        stub = StubUpstream((0, "fast"))
+        policy, _ = _policy(hedge=True, hedge_min_delay=0.2)
+        _warm(policy)
+
+        assert policy.call(stub) == "fast"
+        assert stub.calls == 1
+
+    def test_no_hedging_until_enough_samples(self):
+        stub = StubUpstream((0.1, "slow"), (0, "fast"))
+        policy, _ = _policy(hedge=True, hedge_min_delay=0.01)
+
+        assert policy.call(stub) == "slow"
+        assert stub.calls == 1
+
+    def test_hedge_failure_falls_back_to_primary(self):
+        stub = StubUpstream((0.2, "slow"), (0, Transient()))
+        policy, _ = _policy(hedge=True, hedge_min_delay=0.01, max_attempts=1)
+        _warm(policy)
+
+        assert policy.call(stub) == "slow"
+
+
+class TestLatencyTracker:
+    def test_percentile(self):
+        tracker = LatencyTracker(window=100, min_samples=10)
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+
+        assert tracker.percentile(95) == pytest.approx(0.096)
+
+
+class TestBulkhead:
+    def _bulkhead(self, **kwargs):
+        defaults = {"max_concurrent": 1, "max_queued": 1, "queue_timeout": 0.05}
+        return Bulkhead("stub", **{**defaults, **kwargs})
+
+    def test_call_returns_result(self):
+        bulkhead = self._bulkhead()
+        try:
+            assert bulkhead.call(StubUpstream((0, "ok"))) == "ok"
+        finally:
+            bulkhead.shutdown()
+
+    def test_full_bulkhead_rejects_after_queue_timeout(self):
+        bulkhead = self._bulkhead(queue_timeout=0.5)
+        release = threading.Event()
+        try:
+            bulkhead.submit(release.wait)  # running
+            bulkhead.submit(release.wait)  # queued
+            bulkhead.queue_timeout = 0.05
+            with pytest.raises(BulkheadFull):
+                bulkhead.submit(StubUpstream((0, "ok")))
+        finally:
+            release.set()
+            bulkhead.shutdown()
+
+    def test_stats_report_active_and_queued(self):
+        bulkhead = self._bulkhead(queue_timeout=0.5)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        try:
+            bulkhead.submit(block)
+            started.wait(1)
+            bulkhead.submit(release.wait)
+            stats = bulkhead.stats()
+            assert stats["active"] == 1
+            assert stats["queued"] == 1
+        finally:
+            release.set()
+            bulkhead.shutdown()
+
+    def test_calls_that_expire_in_queue_are_not_started(self):
+        bulkhead = self._bulkhead(queue_timeout=0.05)
+        stub = StubUpstream((0, "late"))
+        try:
+            bulkhead.submit(time.sleep, 0.2)
+            queued = bulkhead.submit(stub)
+            with pytest.raises(BulkheadTimeout):
+                queued.result(timeout=1)
+            assert stub.calls == 0
+        finally:
+            bulkhead.shutdown()
+
+    def test_policy_dispatches_attempts_through_bulkhead(self):
+        bulkhead = self._bulkhead()
+        seen = []
+        policy, _ = _policy(executor=bulkhead)
+        try:
+            policy.call(lambda: seen.append(threading.current_thread().name))
+        finally:
+            bulkhead.shutdown()
+
+        assert seen[0].startswith("bulkhead-stub")
+
+    def test_try_submit_does_not_wait_for_a_slot(self):
+        bulkhead = self._bulkhead(max_queued=0, queue_timeout=1.0)
+        release = threading.Event()
+        try:
+            bulkhead.submit(release.wait)
+            start = time.monotonic()
+            assert bulkhead.try_submit(StubUpstream((0, "ok"))) is None
+            assert time.monotonic() - start < 0.5
+        finally:
+            release.set()
+            bulkhead.shutdown()
+
+    def test_full_bulkhead_skips_the_hedge_and_waits_for_the_primary(self):
+        bulkhead = self._bulkhead(max_queued=0, queue_timeout=1.0)
+        stub = StubUpstream((0.3, "ok"))
+        policy, _ = _policy(executor=bulkhead, hedge=True, hedge_min_delay=0.01)
+        _warm(policy)
+        tokens = policy.budget.tokens
+        try:
+            start = time.monotonic()
+            assert policy.call(stub) == "ok"
+            assert time.monotonic() - start < 0.9
+        finally:
+            bulkhead.shutdown()
+
+        assert stub.calls == 1
+        assert policy.budget.tokens == pytest.approx(tokens + policy.budget.ratio)
@@ -1,4 +1,6 @@
 #!/bin/sh
 python manage.py migrate
 python manage.py collectstatic --noinput
+# One sync worker: keep IDENTIFICATION_EVENTS_TIMEOUT at 0. Long-lived event
+# streams need threaded workers (e.g. -k gthread --threads 8) or ASGI.
 gunicorn config.wsgi --bind 0.0.0.0:8003 --timeout 60 --access-logfile - --error-logfile -
\ No newline at end of file
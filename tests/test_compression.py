@@ -0,0 +1,109 @@
+"""
+Tests for negotiated response compression.
+
+Verifies:
+- Accept-Encoding negotiation honours q-values, wildcards and preference
+- Large compressible responses are compressed and marked Vary/Content-Encoding
+- Small, streaming, already-encoded, non-compressible and health responses
+  are left alone
+- Identical bodies reuse the cached compressed variant
+"""
+
+import gzip
+import json
+
+import pytest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from config import metrics
+from config.middleware import CODECS, CompressionMiddleware, _cache, negotiate
+
+BIG = {"items": [{"name": f"Plant {i}", "notes": "water weekly"} for i in range(200)]}
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    _cache.clear()
+    metrics.reset()
+    yield
+    _cache.clear()
+
+
+def _run(response, path="/app/api/nfctags", accept="gzip"):
+    request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING=accept)
+    return CompressionMiddleware(lambda _: response)(request)
+
+
+class TestNegotiation:
+    def test_prefers_server_order_among_accepted(self):
+        assert negotiate("gzip, br, zstd", ["zstd", "br", "gzip"]) == "zstd"
+        assert negotiate("gzip, br", ["zstd", "br", "gzip"]) == "br"
+
+    def test_honours_q_values_and_wildcard(self):
+        assert negotiate("br;q=0, gzip;q=0.5", ["br", "gzip"]) == "gzip"
+        assert negotiate("*;q=0.1, gzip;q=0", ["br", "gzip"]) == "br"
+        assert negotiate("identity", ["br", "gzip"]) is None
+        assert negotiate("", ["gzip"]) is None
+        assert negotiate("GZIP;q=bogus, br", ["gzip"]) is None
+
+
+class TestCompressionMiddleware:
+    def test_compresses_large_json(self):
+        response = _run(JsonResponse(BIG))
+
+        assert response["Content-Encoding"] == "gzip"
+        assert response["Vary"] == "Accept-Encoding"
+        assert int(response["Content-Length"]) == len(response.content)
+        assert json.loads(gzip.decompress(response.content)) == BIG
+
+    @pytest.mark.parametrize("encoding, module", [("br", "brotli"), ("zstd", "zstandard")])
+    def test_negotiates_optional_codecs_when_installed(self, encoding, module):
+        codec = pytest.importorskip(module)
+        response = _run(JsonResponse(BIG), accept=f"gzip, {encoding}")
+
+        assert response["Content-Encoding"] == encoding
+        assert json.loads(codec.decompress(response.content)) == BIG
+
+    def test_vary_set_even_when_client_accepts_nothing(self):
+        response = _run(JsonResponse(BIG), accept="")
+
+        assert not response.has_header("Content-Encoding")
+        assert response["Vary"] == "Accept-Encoding"
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            JsonResponse({"status": "ok"}),
+            HttpResponse(b"\x89PNG" * 1000, content_type="image/png"),
+            StreamingHttpResponse(iter([b"data: x\n\n"] * 500), content_type="text/event-stream"),
+        ],
+        ids=["small", "incompressible-type", "streaming"],
+    )
+    def test_leaves_other_responses_alone(self, response):
+        result = _run(response)
+
+        assert not result.has_header("Content-Encoding")
+        assert not result.has_header("Vary")
+
+    def test_health_check_is_exempt(self, client):
+        response = client.get("/app/api/health/", HTTP_ACCEPT_ENCODING="gzip")
+
+        assert not response.has_header("Content-Encoding")
+
+    def test_strong_etag_becomes_weak(self):
+        response = JsonResponse(BIG)
+        response["ETag"] = '"abc"'
+
+        assert _run(response)["ETag"] == 'W/"abc"'
+
+    def test_identical_bodies_reuse_compressed_variant(self):
+        first = _run(JsonResponse(BIG))
+        second = _run(JsonResponse(BIG))
+
+        assert first.content == second.content
+        assert metrics.get_count("compression.cache_hits") == 1
+
+    def test_only_available_codecs_are_offered(self):
+        assert "gzip" in CODECS
+        assert list(CODECS)[-1] == "gzip"
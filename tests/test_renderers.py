@@ -0,0 +1,114 @@
+"""
+Equivalence tests for the orjson renderer and parser.
+
+ORJSONRenderer must decode to exactly what ninja's stdlib JSONRenderer
+produced for every type our responses contain: datetimes (millisecond
+precision, ``Z`` for UTC), dates, times, UUIDs, Decimals, lazy strings,
+pydantic models, text choices and integer dict keys.
+"""
+
+import json
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import orjson
+import pytest
+from django.db import models
+from django.utils.translation import gettext_lazy
+from ninja import Schema
+from ninja.renderers import JSONRenderer
+
+from config.renderers import ORJSONParser, ORJSONRenderer
+
+
+class _Status(models.TextChoices):
+    PENDING = "pending"
+
+
+class _Nested(Schema):
+    id: uuid.UUID
+    at: datetime
+
+
+CET = timezone(timedelta(hours=1))
+
+PAYLOADS = {
+    "datetimes": {
+        "utc_micro": datetime(2026, 10, 19, 8, 43, 14, 178123, tzinfo=timezone.utc),
+        "utc_whole": datetime(2026, 10, 19, 8, 43, 14, tzinfo=timezone.utc),
+        "offset": datetime(2026, 10, 19, 8, 43, 14, 5000, tzinfo=CET),
+        "naive": datetime(2026, 10, 19, 8, 43, 14, 999999),
+        "date": date(2026, 10, 19),
+        "time": time(8, 43, 14, 123456),
+        "duration": timedelta(days=1, seconds=5),
+    },
+    "scalars": {
+        "uuid": uuid.UUID("77606376-7257-45a7-b4f9-de95a078e068"),
+        "decimal": Decimal("49.195060"),
+        "float": 0.1 + 0.2,
+        "lazy": gettext_lazy("Plant Label"),
+        "choice": _Status.PENDING,
+        "unicode": "Žluťoučký kůň 🌵",
+        "none": None,
+    },
+    "identification": {
+        "suggestions": {0: {"id": 2777724, "probability": 0.96}, 1: {"id": 3, "probability": 0.01}},
+        "top_match_id": 2777724,
+    },
+    "page": {
+        "items": [
+            {"uuid": uuid.uuid4(), "plant": None, "tags": ("a", "b")},
+            _Nested(id=uuid.uuid4(), at=datetime(2026, 1, 1, 0, 0, 0, 1, tzinfo=timezone.utc)),
+        ],
+        "next_cursor": None,
+        "count": 2,
+    },
+}
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_output_decodes_like_stdlib_renderer(name):
+    data = PAYLOADS[name]
+
+    expected = JSONRenderer().render(None, data, response_status=200)
+    rendered = ORJSONRenderer().render(None, data, response_status=200)
+
+    assert orjson.loads(rendered) == json.loads(expected)
+
+
+def test_datetime_strings_keep_django_format():
+    rendered = ORJSONRenderer().render(None, PAYLOADS["datetimes"], response_status=200)
+
+    data = orjson.loads(rendered)
+    assert data["utc_micro"] == "2026-10-19T08:43:14.178Z"
+    assert data["offset"] == "2026-10-19T08:43:14.005+01:00"
+
+
+def test_unencodable_values_raise():
+    with pytest.raises(TypeError):
+        ORJSONRenderer().render(None, {"value": object()}, response_status=200)
+
+
+def test_parser_matches_stdlib(rf):
+    body = '{"ascii_mirrors": ["04A1B2C3D4E5F6x000001"], "n": 1.5, "u": "\\u017d"}'
+    request = rf.post("/", data=body, content_type="application/json")
+
+    assert ORJSONParser().parse_body(request) == json.loads(body)
+
+
+@pytest.mark.django_db
+def test_malformed_body_is_a_400(client):
+    from domain.tests import _auth_header, _make_user
+
+    user = _make_user("parser")
+    client.force_login(user)
+    response = client.post(
+        "/app/api/nfctags/scan",
+        data="{not json",
+        content_type="application/json",
+        HTTP_AUTHORIZATION=_auth_header(user),
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Cannot parse request body"}